@@ -0,0 +1,3 @@
+from .log import AnswerLog, compact_answer_log, read_answer_log
+
+__all__ = ["AnswerLog", "compact_answer_log", "read_answer_log"]
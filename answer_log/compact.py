@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import glob
+import os
+
+from config import answer_log_config
+
+from .log import ANSWER_LOG_PREFIX, compact_answer_log
+
+
+def main() -> None:
+    pattern = os.path.join(answer_log_config.directory, f"{ANSWER_LOG_PREFIX}*.jsonl")
+    paths = sorted(glob.glob(pattern))
+    for path in paths:
+        compact_answer_log(path)
+    print(f"Compacted {len(paths)} answer logs in {answer_log_config.directory}.")
+
+
+if __name__ == "__main__":
+    main()
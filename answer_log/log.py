@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, IO, List, Optional, Tuple
+
+
+ANSWER_LOG_PREFIX = "interview_answers_"
+
+
+class AnswerLog:
+    """
+    Append-only JSONL answer logs, one file per session.
+
+    The first line of each file is a header with `started_at` and `roles`;
+    every following line is one answer entry. Handles stay open (buffered)
+    between appends and are fsynced every `fsync_every` entries or
+    `fsync_interval_seconds`, whichever comes first. `start_flusher` runs a
+    background thread that applies the time cadence to idle handles too, so
+    the last entries of a quiet session do not stay unsynced.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync_every: int = 5,
+        fsync_interval_seconds: float = 2.0,
+        max_open_files: int = 256,
+    ) -> None:
+        self.directory = directory
+        self.fsync_every = fsync_every
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.max_open_files = max(1, max_open_files)
+        self._lock = threading.Lock()
+        # path -> (handle, unsynced_entries, last_sync), least recently used first.
+        self._handles: "OrderedDict[str, Tuple[IO[str], int, float]]" = OrderedDict()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = threading.Event()
+
+    def path_for(self, session_id: str) -> str:
+        return os.path.join(self.directory, f"{ANSWER_LOG_PREFIX}{session_id}.jsonl")
+
+    def start(self, session_id: str, roles: List[str]) -> str:
+        """
+        Create the log for a new session and return its path.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(session_id)
+        header = {
+            "session_id": session_id,
+            "started_at": datetime.now().isoformat(),
+            "roles": roles,
+        }
+        self.append(path, header)
+        return path
+
+    def append(self, path: str, entry: Dict[str, object]) -> None:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            handle, unsynced, last_sync = self._open(path)
+            handle.write(line)
+            unsynced += 1
+            now = time.monotonic()
+            if (self.fsync_every > 0 and unsynced >= self.fsync_every) or (
+                now - last_sync >= self.fsync_interval_seconds
+            ):
+                self._sync(handle)
+                unsynced, last_sync = 0, now
+            self._handles[path] = (handle, unsynced, last_sync)
+
+    def _open(self, path: str) -> Tuple[IO[str], int, float]:
+        entry = self._handles.get(path)
+        if entry is not None:
+            self._handles.move_to_end(path)
+            return entry
+        while len(self._handles) >= self.max_open_files:
+            _, (old_handle, _, _) = self._handles.popitem(last=False)
+            self._close_handle(old_handle)
+        handle = open(path, "a", encoding="utf-8")
+        entry = (handle, 0, time.monotonic())
+        self._handles[path] = entry
+        return entry
+
+    @staticmethod
+    def _sync(handle: IO[str]) -> None:
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    def _close_handle(self, handle: IO[str]) -> None:
+        try:
+            self._sync(handle)
+        finally:
+            handle.close()
+
+    def sync_due(self) -> int:
+        """
+        fsync every handle with unsynced entries whose interval has passed;
+        returns how many were synced.
+        """
+        synced = 0
+        with self._lock:
+            now = time.monotonic()
+            for path, (handle, unsynced, last_sync) in list(self._handles.items()):
+                if unsynced > 0 and now - last_sync >= self.fsync_interval_seconds:
+                    self._sync(handle)
+                    self._handles[path] = (handle, 0, now)
+                    synced += 1
+        return synced
+
+    def start_flusher(self) -> None:
+        if self._flusher is not None or self.fsync_interval_seconds <= 0:
+            return
+        self._flusher_stop.clear()
+
+        def _run() -> None:
+            while not self._flusher_stop.wait(self.fsync_interval_seconds):
+                try:
+                    self.sync_due()
+                except Exception:
+                    pass
+
+        self._flusher = threading.Thread(target=_run, name="answer-log-flusher", daemon=True)
+        self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        self._flusher_stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self._flusher = None
+
+    def flush(self, path: str) -> None:
+        with self._lock:
+            entry = self._handles.get(path)
+            if entry is not None:
+                self._sync(entry[0])
+                self._handles[path] = (entry[0], 0, time.monotonic())
+
+    def close(self, path: str) -> None:
+        with self._lock:
+            entry = self._handles.pop(path, None)
+            if entry is not None:
+                self._close_handle(entry[0])
+
+    def close_all(self) -> None:
+        with self._lock:
+            while self._handles:
+                _, (handle, _, _) = self._handles.popitem(last=False)
+                self._close_handle(handle)
+
+    def compact(self, path: str) -> Optional[str]:
+        """
+        Write the legacy `{"started_at", "roles", "answers"}` JSON next to the
+        JSONL log and return its path.
+        """
+        self.flush(path)
+        return compact_answer_log(path)
+
+
+def read_answer_log(path: str) -> Dict[str, object]:
+    """
+    Read a JSONL answer log into the legacy JSON shape. A torn final line
+    (crash mid-write) is skipped.
+    """
+    payload: Dict[str, object] = {"started_at": None, "roles": [], "answers": []}
+    answers: List[Dict[str, object]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for idx, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if idx == 0 and "question_id" not in entry:
+                payload["started_at"] = entry.get("started_at")
+                payload["roles"] = entry.get("roles", [])
+                continue
+            answers.append(entry)
+    payload["answers"] = answers
+    return payload
+
+
+def compact_answer_log(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    payload = read_answer_log(path)
+    json_path = os.path.splitext(path)[0] + ".json"
+    tmp_path = f"{json_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, json_path)
+    return json_path
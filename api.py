@@ -1,29 +1,109 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-import tempfile
+import threading
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, TypeVar
 from datetime import datetime
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
+import numpy as np
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
-from audio_io import transcribe_audio_file
-from evaluation_engine import AnswerEvaluator
+from answer_log import AnswerLog
+from audio_io import (
+    AudioDecodeError,
+    AudioLimitExceeded,
+    AudioNotStreamable,
+    PCMDecoder,
+    TranscriptionPool,
+    TranscriptionQueueFull,
+    WindowedTranscriber,
+)
+from config import answer_log_config, audio_config, evaluation_config, session_config
+from evaluation_engine import (
+    EVAL_DEFERRED,
+    EVAL_DONE,
+    EVAL_FAILED,
+    EVAL_PENDING,
+    SUMMARY_UNAVAILABLE,
+    AnswerEvaluator,
+    AnswerToEvaluate,
+    EvaluationPipeline,
+    EvaluationQueueFull,
+    cascade_stats,
+)
 from interview_engine import InterviewSession, QuestionWithEvaluation
 from report_generator import generate_report
 from resume_parser import parse_resume_file
-from role_extractor import DetectedRole, extract_roles_from_resume
+from llm_client import llm_client
+from role_extractor import DetectedRole, async_extract_roles_from_resume
+from session_store import SessionNotFound, create_session_store
 from vector_store import InterviewVectorStore, QuestionRecord
 
 
-app = FastAPI(title="AI Interview Agent API", version="1.0.0")
+# One warmed vector store (Chroma client + embedding model) shared by every
+# session and evaluator. It is built in the background at startup; `_STORE_READY`
+# only flips once the model and both collections are loaded.
+_STORE: Optional[InterviewVectorStore] = None
+_STORE_READY = threading.Event()
+_STORE_ERROR: Optional[str] = None
+# Shared evaluator; it only holds the store and cascade thresholds.
+_EVALUATOR: Optional[AnswerEvaluator] = None
+
+_EVAL_PIPELINE = EvaluationPipeline(
+    workers=evaluation_config.workers,
+    max_queue=evaluation_config.queue_size,
+)
+
+_TRANSCRIPTION_POOL = TranscriptionPool(
+    model_name=audio_config.whisper_model,
+    workers=audio_config.transcription_workers,
+    max_queue=audio_config.transcription_queue_size,
+    torch_threads=audio_config.transcription_torch_threads,
+)
+
+
+def _warmup_store() -> None:
+    global _STORE, _STORE_ERROR
+    try:
+        store = InterviewVectorStore()
+        store.warmup()
+    except Exception as exc:
+        _STORE_ERROR = str(exc)
+        return
+    _STORE = store
+    _STORE_READY.set()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    threading.Thread(target=_warmup_store, name="vector-store-warmup", daemon=True).start()
+    await _EVAL_PIPELINE.start()
+    _TRANSCRIPTION_POOL.start()
+    _SESSIONS.start_reaper(session_config.reap_interval_seconds)
+    _ANSWER_LOG.start_flusher()
+    try:
+        yield
+    finally:
+        _SESSIONS.stop_reaper()
+        await _EVAL_PIPELINE.stop()
+        _TRANSCRIPTION_POOL.shutdown()
+        _ANSWER_LOG.stop_flusher()
+        _ANSWER_LOG.close_all()
+        await llm_client.aclose()
+
+
+app = FastAPI(title="AI Interview Agent API", version="1.0.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -39,10 +119,60 @@ class SessionState:
     evaluator: AnswerEvaluator
     created_at: float
     answer_log_path: Optional[str] = None
-    evaluation_saved: bool = False
+    # Session version last written to the evaluation JSON.
+    evaluation_saved_version: Optional[int] = None
+    # question_id -> pending/done/failed
+    evaluation_status: Dict[str, str] = field(default_factory=dict)
+    # Last generated report and the session version it was built from.
+    report_cache: Optional[Dict[str, object]] = None
+    report_version: Optional[int] = None
+
+
+def _encode_session_state(state: SessionState) -> Dict[str, object]:
+    return {
+        "session": state.session.to_state(),
+        "created_at": state.created_at,
+        "answer_log_path": state.answer_log_path,
+        "evaluation_saved_version": state.evaluation_saved_version,
+        "evaluation_status": dict(state.evaluation_status),
+        "report_cache": state.report_cache,
+        "report_version": state.report_version,
+    }
+
+
+def _decode_session_state(data: Dict[str, object]) -> SessionState:
+    store = _get_store()
+    return SessionState(
+        session=InterviewSession.from_state(data["session"], store=store),  # type: ignore[arg-type]
+        evaluator=_get_evaluator(),
+        created_at=float(data.get("created_at", time.time())),  # type: ignore[arg-type]
+        answer_log_path=data.get("answer_log_path"),  # type: ignore[arg-type]
+        evaluation_saved_version=data.get("evaluation_saved_version"),  # type: ignore[arg-type]
+        evaluation_status=dict(data.get("evaluation_status", {})),  # type: ignore[arg-type]
+        report_cache=data.get("report_cache"),  # type: ignore[arg-type]
+        report_version=data.get("report_version"),  # type: ignore[arg-type]
+    )
+
+
+_SESSIONS = create_session_store(
+    backend=session_config.backend,
+    ttl_seconds=session_config.ttl_seconds,
+    max_sessions=session_config.max_sessions,
+    encode=_encode_session_state,
+    decode=_decode_session_state,
+    sqlite_path=session_config.sqlite_path,
+)
+_ANSWER_LOG = AnswerLog(
+    directory=answer_log_config.directory,
+    fsync_every=answer_log_config.fsync_every,
+    fsync_interval_seconds=answer_log_config.fsync_interval_seconds,
+)
+# Evaluation jobs queued by this process: session_id -> question_id -> future.
+_PENDING_EVALUATIONS: Dict[str, Dict[str, asyncio.Future]] = {}
 
+T = TypeVar("T")
 
-_SESSIONS: Dict[str, SessionState] = {}
+_UPLOAD_CHUNK_BYTES = 64 * 1024
 
 
 class RoleInput(BaseModel):
@@ -81,6 +211,20 @@ class AnswerResponse(BaseModel):
     has_more_questions: bool
 
 
+def _get_store() -> InterviewVectorStore:
+    if not _STORE_READY.is_set() or _STORE is None:
+        detail = f"Vector store failed to load: {_STORE_ERROR}" if _STORE_ERROR else "Vector store is warming up."
+        raise HTTPException(status_code=503, detail=detail, headers={"Retry-After": "5"})
+    return _STORE
+
+
+def _get_evaluator() -> AnswerEvaluator:
+    global _EVALUATOR
+    if _EVALUATOR is None:
+        _EVALUATOR = AnswerEvaluator(store=_get_store())
+    return _EVALUATOR
+
+
 def _get_session_state(session_id: str) -> SessionState:
     state = _SESSIONS.get(session_id)
     if not state:
@@ -88,6 +232,16 @@ def _get_session_state(session_id: str) -> SessionState:
     return state
 
 
+def _update_session(session_id: str, update: Callable[[SessionState], T]) -> T:
+    """
+    Apply `update` to a session atomically through the session store.
+    """
+    try:
+        return _SESSIONS.update(session_id, update)
+    except SessionNotFound:
+        raise HTTPException(status_code=404, detail="Session not found.")
+
+
 def _question_to_response(question: QuestionRecord) -> QuestionResponse:
     return QuestionResponse(
         id=question.id,
@@ -106,19 +260,9 @@ def _find_question(session: InterviewSession, question_id: str) -> Optional[Ques
     return None
 
 
-def _init_answer_log(state: SessionState) -> None:
-    os.makedirs("interview_logs", exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_path = os.path.join("interview_logs", f"interview_answers_{timestamp}.json")
+def _init_answer_log(state: SessionState, session_id: str) -> None:
     roles = [r.name for r in state.session.roles]
-    payload = {
-        "started_at": datetime.now().isoformat(),
-        "roles": roles,
-        "answers": [],
-    }
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
-    state.answer_log_path = log_path
+    state.answer_log_path = _ANSWER_LOG.start(session_id, roles)
 
 
 def _append_answer_log(
@@ -130,13 +274,8 @@ def _append_answer_log(
     log_path = state.answer_log_path
     if not log_path:
         return
-    try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except Exception:
-        payload = {"started_at": datetime.now().isoformat(), "roles": [], "answers": []}
-
-    payload["answers"].append(
+    _ANSWER_LOG.append(
+        log_path,
         {
             "question_id": item.question.id,
             "role": item.question.role,
@@ -144,23 +283,208 @@ def _append_answer_log(
             "answer_text": answer_text,
             "was_timeout": was_timeout,
             "answered_at": datetime.now().isoformat(),
-        }
+        },
     )
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
 
 
 def _write_evaluation_json(state: SessionState) -> None:
-    if state.evaluation_saved:
+    if state.evaluation_saved_version == state.session.version:
         return
     log_path = state.answer_log_path
     if not log_path:
         return
-    eval_path = log_path.replace("interview_answers_", "interview_evaluation_")
+    _ANSWER_LOG.compact(log_path)
+    eval_path = os.path.splitext(log_path)[0].replace("interview_answers_", "interview_evaluation_") + ".json"
     data = state.session.to_serializable()
     with open(eval_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
-    state.evaluation_saved = True
+    state.evaluation_saved_version = state.session.version
+
+
+def _is_unscored(item: QuestionWithEvaluation) -> bool:
+    return item.question.id == "warmup_1" or item.question.role == "coding_round"
+
+
+async def _evaluate_and_record(
+    session_id: str,
+    evaluator: AnswerEvaluator,
+    item: QuestionWithEvaluation,
+    answer_text: str,
+) -> None:
+    question_id = item.question.id
+    try:
+        eval_result: Optional[Dict[str, object]] = await evaluator.async_evaluate_answer(
+            question_id=question_id,
+            role_name=item.question.role,
+            question=item.question.question,
+            ideal_answer=item.question.ideal_answer,
+            expected_concepts=item.question.expected_concepts,
+            candidate_answer=answer_text,
+            session_id=session_id,
+        )
+    except Exception:
+        eval_result = None
+
+    def _apply(state: SessionState) -> None:
+        if eval_result is None:
+            state.evaluation_status[question_id] = EVAL_FAILED
+            return
+        state.session.record_answer_evaluation(
+            question_id=question_id,
+            answer_text=answer_text,
+            score=int(eval_result["score"]),  # type: ignore[arg-type]
+            reasoning=str(eval_result["reasoning"]),
+            strengths=list(eval_result["strengths"]),  # type: ignore[arg-type]
+            weaknesses=list(eval_result["weaknesses"]),  # type: ignore[arg-type]
+        )
+        state.evaluation_status[question_id] = EVAL_DONE
+
+    try:
+        await run_in_threadpool(_update_session, session_id, _apply)
+    except HTTPException:
+        # Session was deleted or evicted while the job was running.
+        pass
+
+
+def _forget_evaluation(session_id: str, question_id: str, future: asyncio.Future) -> None:
+    pending = _PENDING_EVALUATIONS.get(session_id)
+    if pending and pending.get(question_id) is future:
+        del pending[question_id]
+        if not pending:
+            del _PENDING_EVALUATIONS[session_id]
+
+
+async def _record_answer(
+    session_id: str,
+    item: QuestionWithEvaluation,
+    answer_text: str,
+    was_timeout: bool,
+) -> bool:
+    """
+    Store the answer right away and queue its evaluation in the background.
+    Falls back to evaluating inline when the queue is full. In deferred mode
+    the answer is only marked for batch evaluation at report time. Returns
+    whether the session has more questions.
+    """
+    question_id = item.question.id
+    deferred = evaluation_config.mode == "deferred"
+
+    def _store_answer(state: SessionState) -> bool:
+        state.session.record_answer_evaluation(
+            question_id=question_id,
+            answer_text=answer_text,
+            score=None,
+            reasoning=None,
+            strengths=[],
+            weaknesses=[],
+        )
+        if _is_unscored(item):
+            state.evaluation_status[question_id] = EVAL_DONE
+        else:
+            state.evaluation_status[question_id] = EVAL_DEFERRED if deferred else EVAL_PENDING
+        _append_answer_log(state, item, answer_text, was_timeout=was_timeout)
+        return state.session.has_more_questions()
+
+    has_more = await run_in_threadpool(_update_session, session_id, _store_answer)
+    if _is_unscored(item) or deferred:
+        return has_more
+
+    evaluator = _get_evaluator()
+    job = lambda: _evaluate_and_record(session_id, evaluator, item, answer_text)  # noqa: E731
+    try:
+        future = _EVAL_PIPELINE.submit(job)
+    except EvaluationQueueFull:
+        await job()
+        return has_more
+    _PENDING_EVALUATIONS.setdefault(session_id, {})[question_id] = future
+    future.add_done_callback(lambda f: _forget_evaluation(session_id, question_id, f))
+    return has_more
+
+
+async def _evaluate_deferred(session_id: str) -> None:
+    """
+    Grade every answer still marked deferred in batched LLM calls. Answers are
+    claimed (switched to pending) first so concurrent report requests do not
+    grade them twice; if grading raises or is cancelled they are released
+    back to deferred so a later report picks them up again.
+    """
+
+    def _claim(state: SessionState) -> List[AnswerToEvaluate]:
+        claimed: List[AnswerToEvaluate] = []
+        for question_id, status in state.evaluation_status.items():
+            if status != EVAL_DEFERRED:
+                continue
+            item = _find_question(state.session, question_id)
+            if item is None or item.answer_text is None:
+                continue
+            state.evaluation_status[question_id] = EVAL_PENDING
+            claimed.append(
+                AnswerToEvaluate(
+                    question_id=question_id,
+                    role_name=item.question.role,
+                    question=item.question.question,
+                    ideal_answer=item.question.ideal_answer,
+                    expected_concepts=item.question.expected_concepts,
+                    candidate_answer=item.answer_text,
+                )
+            )
+        return claimed
+
+    claimed = await run_in_threadpool(_update_session, session_id, _claim)
+    if not claimed:
+        return
+    evaluator = _get_evaluator()
+    results: Optional[Dict[str, Dict[str, object]]] = None
+    try:
+        results = await evaluator.async_evaluate_batch(claimed, session_id=session_id)
+    finally:
+        if results is None:
+
+            def _release(state: SessionState) -> None:
+                for answer in claimed:
+                    if state.evaluation_status.get(answer.question_id) == EVAL_PENDING:
+                        state.evaluation_status[answer.question_id] = EVAL_DEFERRED
+
+            try:
+                # Shielded so a cancelled report request still releases its claim.
+                await asyncio.shield(run_in_threadpool(_update_session, session_id, _release))
+            except HTTPException:
+                pass
+
+    def _apply(state: SessionState) -> None:
+        for answer in claimed:
+            result = results.get(answer.question_id)
+            if result is None:
+                state.evaluation_status[answer.question_id] = EVAL_FAILED
+                continue
+            state.session.record_answer_evaluation(
+                question_id=answer.question_id,
+                answer_text=answer.candidate_answer,
+                score=int(result["score"]),  # type: ignore[arg-type]
+                reasoning=str(result["reasoning"]),
+                strengths=list(result["strengths"]),  # type: ignore[arg-type]
+                weaknesses=list(result["weaknesses"]),  # type: ignore[arg-type]
+            )
+            state.evaluation_status[answer.question_id] = EVAL_DONE
+
+    await run_in_threadpool(_update_session, session_id, _apply)
+
+
+async def _wait_for_evaluations(session_id: str) -> SessionState:
+    """
+    Wait (bounded) for outstanding evaluations and return the fresh session state.
+    """
+    await _evaluate_deferred(session_id)
+    deadline = time.monotonic() + evaluation_config.report_wait_seconds
+    local = list(_PENDING_EVALUATIONS.get(session_id, {}).values())
+    if local:
+        await asyncio.wait(local, timeout=evaluation_config.report_wait_seconds)
+    # Jobs queued by another worker are only visible as pending status in the store.
+    state = await run_in_threadpool(_get_session_state, session_id)
+    while EVAL_PENDING in state.evaluation_status.values() and time.monotonic() < deadline:
+        await asyncio.sleep(0.25)
+        state = await run_in_threadpool(_get_session_state, session_id)
+    return state
 
 
 @app.get("/health")
@@ -168,18 +492,36 @@ def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready() -> Dict[str, str]:
+    _get_store()
+    return {"status": "ready"}
+
+
+@app.get("/metrics")
+def metrics() -> Dict[str, object]:
+    return {
+        "sessions": _SESSIONS.stats(),
+        "evaluation": _EVAL_PIPELINE.stats(),
+        "evaluation_cascade": cascade_stats.stats(),
+        "transcription": _TRANSCRIPTION_POOL.stats(),
+        "llm": llm_client.stats(),
+        "embedding": _STORE.embedding_stats() if _STORE is not None else None,
+    }
+
+
 @app.post("/resume/parse")
 async def parse_resume(file: UploadFile = File(...)) -> Dict[str, str]:
     file_bytes = await file.read()
-    raw, cleaned = parse_resume_file(file.filename, file_bytes)
+    raw, cleaned = await run_in_threadpool(parse_resume_file, file.filename, file_bytes)
     return {"raw_text": raw, "cleaned_text": cleaned}
 
 
 @app.post("/resume/analyze")
 async def analyze_resume(file: UploadFile = File(...)) -> Dict[str, object]:
     file_bytes = await file.read()
-    raw, cleaned = parse_resume_file(file.filename, file_bytes)
-    roles = extract_roles_from_resume(cleaned)
+    raw, cleaned = await run_in_threadpool(parse_resume_file, file.filename, file_bytes)
+    roles = await async_extract_roles_from_resume(cleaned)
     return {
         "raw_text": raw,
         "cleaned_text": cleaned,
@@ -188,87 +530,82 @@ async def analyze_resume(file: UploadFile = File(...)) -> Dict[str, object]:
 
 
 @app.post("/roles/extract")
-def extract_roles(payload: Dict[str, object]) -> Dict[str, object]:
+async def extract_roles(payload: Dict[str, object]) -> Dict[str, object]:
     resume_text = str(payload.get("resume_text", "")).strip()
     if not resume_text:
         raise HTTPException(status_code=400, detail="resume_text is required.")
     max_roles = int(payload.get("max_roles", 2))
-    roles = extract_roles_from_resume(resume_text, max_roles=max_roles)
+    roles = await async_extract_roles_from_resume(resume_text, max_roles=max_roles)
     return {
         "roles": [RoleInput(name=r.name, confidence=r.confidence, rationale=r.rationale) for r in roles],
     }
 
 
 @app.post("/interview/start", response_model=StartInterviewResponse)
-def start_interview(payload: StartInterviewRequest) -> StartInterviewResponse:
+async def start_interview(payload: StartInterviewRequest) -> StartInterviewResponse:
+    store = _get_store()
     roles: List[DetectedRole] = []
     if payload.roles:
         roles = [DetectedRole(name=r.name, confidence=r.confidence, rationale=r.rationale) for r in payload.roles]
     elif payload.resume_text:
-        roles = extract_roles_from_resume(payload.resume_text, max_roles=payload.max_roles)
+        roles = await async_extract_roles_from_resume(payload.resume_text, max_roles=payload.max_roles)
 
     if not roles:
         raise HTTPException(status_code=400, detail="Provide roles or resume_text to start an interview.")
 
-    store = InterviewVectorStore()
-    store.seed_if_empty()
-    session = InterviewSession(roles=roles, store=store)
-    evaluator = AnswerEvaluator(store=store)
-
     session_id = str(uuid.uuid4())
-    state = SessionState(session=session, evaluator=evaluator, created_at=time.time())
-    _init_answer_log(state)
-    _SESSIONS[session_id] = state
+
+    def _create_session() -> InterviewSession:
+        # Session setup touches disk (coding-round PDFs, answer log, session store).
+        session = InterviewSession(roles=roles, store=store)
+        state = SessionState(session=session, evaluator=_get_evaluator(), created_at=time.time())
+        _init_answer_log(state, session_id)
+        _SESSIONS.put(session_id, state)
+        return session
+
+    session = await run_in_threadpool(_create_session)
 
     total_questions = sum(session.questions_per_role.values()) + 1
     response_roles = [RoleInput(name=r.name, confidence=r.confidence, rationale=r.rationale) for r in roles]
     return StartInterviewResponse(session_id=session_id, roles=response_roles, total_questions=total_questions)
 
 
+def _prefetch_questions(session_id: str) -> None:
+    """
+    Draw from a snapshot of the session, outside the session lock, then merge
+    the questions in a short update that drops any asked in the meantime.
+    """
+    try:
+        drawn = _get_session_state(session_id).session.draw_planned_questions()
+        if drawn:
+            _update_session(session_id, lambda state: state.session.merge_planned_questions(drawn))
+    except Exception:
+        # Speculative work only; get_next_question falls back to a direct fetch.
+        pass
+
+
 @app.get("/interview/{session_id}/question", response_model=Optional[QuestionResponse])
-def get_next_question(session_id: str) -> Optional[QuestionResponse]:
-    state = _get_session_state(session_id)
-    question = state.session.get_next_question()
+def get_next_question(session_id: str, background_tasks: BackgroundTasks) -> Optional[QuestionResponse]:
+    question, needs_prefetch = _update_session(
+        session_id, lambda state: (state.session.get_next_question(), state.session.needs_prefetch())
+    )
     if not question:
         return None
+    if needs_prefetch:
+        # Plan the following questions while the candidate answers this one.
+        background_tasks.add_task(_prefetch_questions, session_id)
     return _question_to_response(question)
 
 
 @app.post("/interview/{session_id}/answer", response_model=AnswerResponse)
-def submit_answer(session_id: str, payload: AnswerRequest) -> AnswerResponse:
-    state = _get_session_state(session_id)
+async def submit_answer(session_id: str, payload: AnswerRequest) -> AnswerResponse:
+    state = await run_in_threadpool(_get_session_state, session_id)
     item = _find_question(state.session, payload.question_id)
     if not item:
         raise HTTPException(status_code=404, detail="Question not found for this session.")
 
-    if item.question.id == "warmup_1" or item.question.role == "coding_round":
-        state.session.record_answer_evaluation(
-            question_id=item.question.id,
-            answer_text=payload.answer_text,
-            score=None,
-            reasoning=None,
-            strengths=[],
-            weaknesses=[],
-        )
-    else:
-        eval_result = state.evaluator.evaluate_answer(
-            question_id=item.question.id,
-            role_name=item.question.role,
-            question=item.question.question,
-            ideal_answer=item.question.ideal_answer,
-            expected_concepts=item.question.expected_concepts,
-            candidate_answer=payload.answer_text,
-        )
-        state.session.record_answer_evaluation(
-            question_id=item.question.id,
-            answer_text=payload.answer_text,
-            score=int(eval_result["score"]),
-            reasoning=str(eval_result["reasoning"]),
-            strengths=list(eval_result["strengths"]),
-            weaknesses=list(eval_result["weaknesses"]),
-        )
-    _append_answer_log(
-        state,
+    has_more = await _record_answer(
+        session_id,
         item,
         payload.answer_text,
         was_timeout="(No answer - time expired)" in payload.answer_text,
@@ -276,13 +613,68 @@ def submit_answer(session_id: str, payload: AnswerRequest) -> AnswerResponse:
 
     return AnswerResponse(
         question_id=item.question.id,
-        has_more_questions=state.session.has_more_questions(),
+        has_more_questions=has_more,
     )
 
 
+async def _iter_audio_upload(request: Request) -> AsyncIterator[bytes]:
+    """
+    Yield uploaded audio in chunks. Raw bodies (e.g. `Content-Type: audio/webm`)
+    are streamed straight from the socket; multipart uploads are read from the
+    form parser's spooled file in a `file` field.
+    """
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Multipart upload must include a 'file' field.")
+        try:
+            while True:
+                chunk = await upload.read(_UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await form.close()
+        return
+    async for chunk in request.stream():
+        if chunk:
+            yield chunk
+
+
+async def _decode_audio_upload(request: Request) -> np.ndarray:
+    """
+    Stream the upload into an ffmpeg decoder, enforcing the size and
+    duration caps as bytes arrive, and return 16 kHz float32 PCM.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > audio_config.max_upload_bytes:
+        raise HTTPException(status_code=413, detail=f"Upload is larger than {audio_config.max_upload_bytes} bytes.")
+
+    decoder = PCMDecoder(
+        max_bytes=audio_config.max_upload_bytes,
+        max_seconds=audio_config.max_upload_seconds,
+    )
+    try:
+        await decoder.start()
+        async for chunk in _iter_audio_upload(request):
+            await decoder.feed(chunk)
+        return await decoder.finish()
+    except AudioLimitExceeded as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
+    except AudioDecodeError as exc:
+        raise HTTPException(status_code=400, detail=f"Could not decode audio: {exc}") from exc
+    finally:
+        await decoder.abort()
+
+
+def _transcription_busy(exc: TranscriptionQueueFull) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": str(exc.retry_after)})
+
+
 @app.post("/interview/{session_id}/answer/audio", response_model=AnswerResponse)
-async def submit_audio_answer(session_id: str, question_id: str, file: UploadFile = File(...)) -> AnswerResponse:
-    state = _get_session_state(session_id)
+async def submit_audio_answer(session_id: str, question_id: str, request: Request) -> AnswerResponse:
+    state = await run_in_threadpool(_get_session_state, session_id)
     item = _find_question(state.session, question_id)
     if not item:
         raise HTTPException(status_code=404, detail="Question not found for this session.")
@@ -292,66 +684,239 @@ async def submit_audio_answer(session_id: str, question_id: str, file: UploadFil
             detail="Coding round accepts text answers only. Use /interview/{session_id}/answer.",
         )
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-        tmp.write(await file.read())
-        temp_path = tmp.name
+    if _TRANSCRIPTION_POOL.is_full():
+        raise _transcription_busy(TranscriptionQueueFull(_TRANSCRIPTION_POOL.retry_after()))
+    audio = await _decode_audio_upload(request)
+    if not audio.size:
+        raise HTTPException(status_code=400, detail="Uploaded audio is empty.")
     try:
-        answer_text = transcribe_audio_file(temp_path)
-    finally:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
+        answer_text = await _TRANSCRIPTION_POOL.transcribe_async(audio)
+    except TranscriptionQueueFull as exc:
+        raise _transcription_busy(exc) from exc
     if not answer_text:
         raise HTTPException(status_code=400, detail="Transcription returned empty text.")
 
-    if item.question.id == "warmup_1" or item.question.role == "coding_round":
-        state.session.record_answer_evaluation(
-            question_id=item.question.id,
-            answer_text=answer_text,
-            score=None,
-            reasoning=None,
-            strengths=[],
-            weaknesses=[],
-        )
-    else:
-        eval_result = state.evaluator.evaluate_answer(
-            question_id=item.question.id,
-            role_name=item.question.role,
-            question=item.question.question,
-            ideal_answer=item.question.ideal_answer,
-            expected_concepts=item.question.expected_concepts,
-            candidate_answer=answer_text,
-        )
-        state.session.record_answer_evaluation(
-            question_id=item.question.id,
-            answer_text=answer_text,
-            score=int(eval_result["score"]),
-            reasoning=str(eval_result["reasoning"]),
-            strengths=list(eval_result["strengths"]),
-            weaknesses=list(eval_result["weaknesses"]),
-        )
-    _append_answer_log(
-        state,
-        item,
-        answer_text,
-        was_timeout=False,
-    )
+    has_more = await _record_answer(session_id, item, answer_text, was_timeout=False)
 
     return AnswerResponse(
         question_id=item.question.id,
-        has_more_questions=state.session.has_more_questions(),
+        has_more_questions=has_more,
     )
 
 
+async def _send_partial_transcript(websocket: WebSocket, transcriber: WindowedTranscriber, pcm: np.ndarray) -> None:
+    try:
+        text = await run_in_threadpool(transcriber.update, pcm)
+    except TranscriptionQueueFull:
+        # Partials are best-effort; the pool is saturated, try again later.
+        return
+    if text:
+        await websocket.send_json({"type": "partial", "text": text})
+
+
+async def _finalize_transcript(transcriber: WindowedTranscriber, audio: np.ndarray) -> str:
+    """
+    Finish a live transcript, waiting (bounded) for pool capacity instead of
+    failing the answer outright.
+    """
+    deadline = time.monotonic() + audio_config.transcription_final_wait_seconds
+    while True:
+        try:
+            return await run_in_threadpool(transcriber.finalize, audio)
+        except TranscriptionQueueFull:
+            if time.monotonic() >= deadline:
+                raise
+            await asyncio.sleep(0.5)
+
+
+@app.websocket("/interview/{session_id}/answer/stream")
+async def stream_audio_answer(websocket: WebSocket, session_id: str, question_id: str) -> None:
+    """
+    Live transcription of a spoken answer.
+
+    Client -> server: binary frames with encoded audio chunks (e.g. MediaRecorder
+    webm/opus), then a text frame `{"type": "stop"}` (or `{"type": "cancel"}`).
+    Server -> client: `{"type": "partial", "text"}` while recording, then
+    `{"type": "final", "text", "question_id", "has_more_questions"}` once the
+    answer is recorded, or `{"type": "error", "detail"}`.
+    """
+    await websocket.accept()
+    try:
+        state = await run_in_threadpool(_get_session_state, session_id)
+    except HTTPException as exc:
+        await websocket.send_json({"type": "error", "detail": exc.detail})
+        await websocket.close(code=4404)
+        return
+    item = _find_question(state.session, question_id)
+    if not item or item.question.role == "coding_round":
+        await websocket.send_json({"type": "error", "detail": "Question not found or does not accept audio."})
+        await websocket.close(code=4400)
+        return
+
+    # MP4 needs the whole file before decoding; such clients use the upload endpoint.
+    decoder = PCMDecoder(
+        max_bytes=audio_config.max_upload_bytes,
+        max_seconds=audio_config.max_upload_seconds,
+        allow_spool=False,
+    )
+    transcriber = WindowedTranscriber(
+        window_seconds=audio_config.stream_window_seconds,
+        full_pass_seconds=audio_config.stream_full_pass_seconds,
+        transcribe=_TRANSCRIPTION_POOL.transcribe,
+    )
+    partial_task: Optional[asyncio.Task] = None
+    last_partial_at = 0.0
+    try:
+        await decoder.start()
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            chunk = message.get("bytes")
+            if chunk:
+                await decoder.feed(chunk)
+                # One partial transcription at a time; skip while the last one is running.
+                idle = partial_task is None or partial_task.done()
+                if idle and decoder.seconds - last_partial_at >= audio_config.stream_partial_interval_seconds:
+                    last_partial_at = decoder.seconds
+                    partial_task = asyncio.create_task(
+                        _send_partial_transcript(websocket, transcriber, decoder.pcm())
+                    )
+                continue
+            try:
+                command = json.loads(message.get("text") or "{}").get("type")
+            except (json.JSONDecodeError, AttributeError):
+                command = None
+            if command == "stop":
+                break
+            if command == "cancel":
+                await websocket.close()
+                return
+
+        audio = await decoder.finish()
+        if partial_task is not None:
+            await asyncio.gather(partial_task, return_exceptions=True)
+        answer_text = await _finalize_transcript(transcriber, audio)
+        if not answer_text:
+            await websocket.send_json({"type": "error", "detail": "Transcription returned empty text."})
+            await websocket.close()
+            return
+        has_more = await _record_answer(session_id, item, answer_text, was_timeout=False)
+        await websocket.send_json(
+            {
+                "type": "final",
+                "text": answer_text,
+                "question_id": item.question.id,
+                "has_more_questions": has_more,
+            }
+        )
+        await websocket.close()
+    except AudioNotStreamable as exc:
+        await websocket.send_json({"type": "error", "detail": str(exc), "fallback": "upload"})
+        await websocket.close(code=4415)
+    except (AudioLimitExceeded, AudioDecodeError) as exc:
+        await websocket.send_json({"type": "error", "detail": str(exc)})
+        await websocket.close(code=4413 if isinstance(exc, AudioLimitExceeded) else 4400)
+    except TranscriptionQueueFull as exc:
+        await websocket.send_json({"type": "error", "detail": str(exc), "retry_after": exc.retry_after})
+        await websocket.close(code=4429)
+    except WebSocketDisconnect:
+        return
+    finally:
+        if partial_task is not None and not partial_task.done():
+            partial_task.cancel()
+        await decoder.abort()
+
+
+@app.get("/interview/{session_id}/evaluations")
+def get_evaluation_status(session_id: str) -> Dict[str, object]:
+    statuses = dict(_get_session_state(session_id).evaluation_status)
+    return {
+        "evaluations": statuses,
+        "pending": sum(1 for s in statuses.values() if s == EVAL_PENDING),
+        "failed": sum(1 for s in statuses.values() if s == EVAL_FAILED),
+        "deferred": sum(1 for s in statuses.values() if s == EVAL_DEFERRED),
+    }
+
+
 @app.get("/interview/{session_id}/report")
-def get_report(session_id: str) -> Dict[str, object]:
-    state = _get_session_state(session_id)
+async def get_report(session_id: str) -> Dict[str, object]:
+    state = await _wait_for_evaluations(session_id)
+    version = state.session.version
+    if state.report_cache is not None and state.report_version == version:
+        return state.report_cache
+
     serializable = state.session.to_serializable()
     role_results = state.evaluator.aggregate_role_scores(serializable)
-    final_summary = state.evaluator.generate_final_summary(serializable, role_results)
-    _write_evaluation_json(state)
-    return generate_report(serializable, role_results, final_summary=final_summary)
+    final_summary = await state.evaluator.async_generate_final_summary(
+        serializable, role_results, session_id=session_id
+    )
+    report = generate_report(serializable, role_results, final_summary=final_summary)
+    await _store_report(session_id, version, report)
+    return report
+
+
+async def _store_report(session_id: str, version: int, report: Dict[str, object]) -> None:
+    def _store(state: SessionState) -> None:
+        # Skip caching if answers changed meanwhile or the summary call failed.
+        if state.session.version == version and report.get("final_summary") != SUMMARY_UNAVAILABLE:
+            state.report_cache = report
+            state.report_version = version
+        _write_evaluation_json(state)
+
+    await run_in_threadpool(_update_session, session_id, _store)
+
+
+def _sse(event: str, data: object) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+@app.get("/interview/{session_id}/report/stream")
+async def stream_report(session_id: str) -> StreamingResponse:
+    """
+    Server-Sent Events version of the report: a `report` event with the scored
+    sections right away, `summary` events carrying summary text deltas, then
+    `done` with the complete report (including `final_summary`).
+    """
+    state = await _wait_for_evaluations(session_id)
+    version = state.session.version
+    cached = state.report_cache if state.report_cache is not None and state.report_version == version else None
+
+    async def _events() -> AsyncIterator[str]:
+        if cached is not None:
+            yield _sse("report", {**cached, "final_summary": ""})
+            yield _sse("summary", {"delta": cached.get("final_summary", "")})
+            yield _sse("done", cached)
+            return
+
+        serializable = state.session.to_serializable()
+        role_results = state.evaluator.aggregate_role_scores(serializable)
+        report = generate_report(serializable, role_results, final_summary="")
+        yield _sse("report", report)
+
+        parts: List[str] = []
+        try:
+            async for delta in state.evaluator.async_stream_final_summary(
+                serializable, role_results, session_id=session_id
+            ):
+                parts.append(delta)
+                yield _sse("summary", {"delta": delta})
+            final_summary = "".join(parts).strip() or SUMMARY_UNAVAILABLE
+        except Exception:
+            final_summary = SUMMARY_UNAVAILABLE
+        report = {**report, "final_summary": final_summary}
+        try:
+            await _store_report(session_id, version, report)
+        except HTTPException:
+            # Session deleted while the summary was streaming.
+            pass
+        yield _sse("done", report)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/interview/{session_id}/export")
@@ -362,8 +927,12 @@ def export_interview(session_id: str) -> Dict[str, object]:
 
 @app.delete("/interview/{session_id}")
 def delete_session(session_id: str) -> Dict[str, str]:
-    if session_id in _SESSIONS:
-        del _SESSIONS[session_id]
+    state = _SESSIONS.get(session_id)
+    if state and _SESSIONS.delete(session_id):
+        _PENDING_EVALUATIONS.pop(session_id, None)
+        if state.answer_log_path:
+            _ANSWER_LOG.compact(state.answer_log_path)
+            _ANSWER_LOG.close(state.answer_log_path)
         return {"status": "deleted"}
     raise HTTPException(status_code=404, detail="Session not found.")
 
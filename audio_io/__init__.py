@@ -1,5 +1,17 @@
-from .stt import transcribe_audio_file
+from .decode import AudioDecodeError, AudioLimitExceeded, AudioNotStreamable, PCMDecoder
+from .pool import TranscriptionPool, TranscriptionQueueFull
+from .stt import WindowedTranscriber, transcribe_audio_file
 from .tts import speak_text, speak_text_async
 
-__all__ = ["transcribe_audio_file", "speak_text", "speak_text_async"]
-
+__all__ = [
+    "transcribe_audio_file",
+    "WindowedTranscriber",
+    "TranscriptionPool",
+    "TranscriptionQueueFull",
+    "speak_text",
+    "speak_text_async",
+    "PCMDecoder",
+    "AudioDecodeError",
+    "AudioLimitExceeded",
+    "AudioNotStreamable",
+]
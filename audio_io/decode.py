@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from typing import Any, Optional
+
+import numpy as np
+
+from config import audio_config
+
+
+# Whisper expects mono 16 kHz float32 PCM.
+SAMPLE_RATE = 16000
+_BYTES_PER_SAMPLE = 4
+_READ_CHUNK_BYTES = 64 * 1024
+# Only the tail of ffmpeg's stderr is kept for error messages.
+_STDERR_TAIL_BYTES = 4096
+# Bytes needed to recognise the container from its header.
+_SNIFF_BYTES = 12
+
+
+def _needs_seekable_input(head: bytes) -> bool:
+    """
+    ISO base media files (mp4/m4a/mov/3gp) start with an `ftyp` box and may
+    keep their `moov` index at the end, which ffmpeg cannot reach on a pipe.
+    """
+    return len(head) >= 8 and head[4:8] == b"ftyp"
+
+
+class AudioDecodeError(Exception):
+    """Raised when ffmpeg cannot decode the uploaded audio."""
+
+
+class AudioLimitExceeded(Exception):
+    """Raised when an upload exceeds the configured size or duration cap."""
+
+
+class AudioNotStreamable(AudioDecodeError):
+    """Raised for MP4-family input when the decoder may not spool it."""
+
+
+def _discard_spool(spool: Any) -> None:
+    spool.close()
+    try:
+        os.unlink(spool.name)
+    except OSError:
+        pass
+
+
+class PCMDecoder:
+    """
+    Streams encoded audio (webm/ogg/wav/...) through an ffmpeg subprocess and
+    collects mono 16 kHz float32 PCM while the input is still arriving.
+    MP4-family uploads (mp4/m4a/mov) need a seekable input, so they are
+    spooled to a temporary file and decoded in `finish()` instead: the size
+    cap still applies while streaming, but the duration cap only once the
+    upload is complete, and `pcm()` stays empty until then. Live callers pass
+    `allow_spool=False` to reject such input with `AudioNotStreamable`.
+
+    Usage:
+        decoder = PCMDecoder(max_bytes=..., max_seconds=...)
+        await decoder.start()
+        await decoder.feed(chunk)   # repeatedly
+        audio = await decoder.finish()
+    Always call `abort()` in a `finally` block; it is a no-op after `finish()`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        allow_spool: bool = True,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.allow_spool = allow_spool
+        self.bytes_in = 0
+        self._pcm = bytearray()
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._stderr_reader: Optional[asyncio.Task] = None
+        self._stderr_tail = bytearray()
+        self._limit_error: Optional[AudioLimitExceeded] = None
+        self._started = False
+        # Input buffered until the container is known, then either piped to
+        # ffmpeg or written to `_spool`.
+        self._head = bytearray()
+        self._spool = None
+
+    @property
+    def seconds(self) -> float:
+        return len(self._pcm) / float(_BYTES_PER_SAMPLE * SAMPLE_RATE)
+
+    async def start(self) -> None:
+        """
+        Prepare for input; ffmpeg is launched once the container is known.
+        """
+        self._started = True
+
+    async def _spawn(self, source: str) -> None:
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                audio_config.ffmpeg_binary,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                source,
+                "-f",
+                "f32le",
+                "-ac",
+                "1",
+                "-ar",
+                str(SAMPLE_RATE),
+                "pipe:1",
+                stdin=asyncio.subprocess.PIPE if source == "pipe:0" else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise AudioDecodeError("ffmpeg is not installed.") from exc
+        self._reader = asyncio.create_task(self._read_pcm())
+        self._stderr_reader = asyncio.create_task(self._read_stderr())
+
+    async def _route_head(self) -> None:
+        """
+        Pick pipe or spool mode from the buffered header and pass it on.
+        """
+        head, self._head = bytes(self._head), bytearray()
+        if _needs_seekable_input(head):
+            if not self.allow_spool:
+                raise AudioNotStreamable(
+                    "MP4/M4A audio cannot be decoded while streaming; upload the recording instead."
+                )
+            self._spool = await asyncio.to_thread(tempfile.NamedTemporaryFile, prefix="upload-", delete=False)
+            await asyncio.to_thread(self._spool.write, head)
+            return
+        await self._spawn("pipe:0")
+        await self._write_pipe(head)
+
+    async def _read_stderr(self) -> None:
+        assert self._proc is not None and self._proc.stderr is not None
+        while True:
+            chunk = await self._proc.stderr.read(_READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            self._stderr_tail.extend(chunk)
+            del self._stderr_tail[:-_STDERR_TAIL_BYTES]
+
+    async def _read_pcm(self) -> None:
+        assert self._proc is not None and self._proc.stdout is not None
+        max_pcm_bytes = (
+            int(self.max_seconds * SAMPLE_RATE) * _BYTES_PER_SAMPLE if self.max_seconds else None
+        )
+        while True:
+            chunk = await self._proc.stdout.read(_READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            self._pcm.extend(chunk)
+            if max_pcm_bytes is not None and len(self._pcm) > max_pcm_bytes:
+                self._limit_error = AudioLimitExceeded(
+                    f"Audio is longer than the {self.max_seconds:g} second limit."
+                )
+                self._kill()
+                return
+
+    def _kill(self) -> None:
+        if self._proc is not None and self._proc.returncode is None:
+            try:
+                self._proc.kill()
+            except ProcessLookupError:
+                pass
+
+    async def feed(self, chunk: bytes) -> None:
+        if not self._started:
+            raise RuntimeError("Decoder is not started.")
+        if self._limit_error is not None:
+            raise self._limit_error
+        self.bytes_in += len(chunk)
+        if self.max_bytes is not None and self.bytes_in > self.max_bytes:
+            raise AudioLimitExceeded(f"Upload is larger than {self.max_bytes} bytes.")
+        if self._proc is None and self._spool is None:
+            self._head.extend(chunk)
+            if len(self._head) >= _SNIFF_BYTES:
+                await self._route_head()
+            return
+        if self._spool is not None:
+            await asyncio.to_thread(self._spool.write, chunk)
+            return
+        await self._write_pipe(chunk)
+
+    async def _write_pipe(self, chunk: bytes) -> None:
+        assert self._proc is not None and self._proc.stdin is not None
+        if not chunk:
+            return
+        try:
+            self._proc.stdin.write(chunk)
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            if self._limit_error is not None:
+                raise self._limit_error from exc
+            raise AudioDecodeError(await self._stderr_text() or "ffmpeg stopped reading input.") from exc
+
+    def pcm(self) -> np.ndarray:
+        """
+        Copy of the PCM decoded so far (usable while input is still streaming).
+        """
+        usable = len(self._pcm) - (len(self._pcm) % _BYTES_PER_SAMPLE)
+        return np.frombuffer(bytes(self._pcm[:usable]), dtype=np.float32).copy()
+
+    async def finish(self) -> np.ndarray:
+        """
+        Close the input, wait for ffmpeg to drain and return all decoded PCM.
+        """
+        if not self._started:
+            raise RuntimeError("Decoder is not started.")
+        if self._proc is None and self._spool is None:
+            await self._route_head()
+        if self._spool is not None:
+            await asyncio.to_thread(self._spool.close)
+            await self._spawn(self._spool.name)
+        else:
+            assert self._proc is not None and self._proc.stdin is not None
+            try:
+                self._proc.stdin.close()
+                await self._proc.stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        assert self._proc is not None
+        if self._reader is not None:
+            await self._reader
+        returncode = await self._proc.wait()
+        if self._limit_error is not None:
+            raise self._limit_error
+        if returncode != 0 and not self._pcm:
+            raise AudioDecodeError(await self._stderr_text() or f"ffmpeg exited with code {returncode}.")
+        return self.pcm()
+
+    async def _stderr_text(self) -> str:
+        """
+        Tail of ffmpeg's stderr, after giving the reader a moment to catch up.
+        """
+        if self._stderr_reader is not None and not self._stderr_reader.done():
+            await asyncio.wait([self._stderr_reader], timeout=1.0)
+        return bytes(self._stderr_tail).decode("utf-8", errors="ignore").strip()
+
+    async def abort(self) -> None:
+        self._kill()
+        for task in (self._reader, self._stderr_reader):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        if self._proc is not None and self._proc.returncode is None:
+            await self._proc.wait()
+        if self._spool is not None:
+            spool, self._spool = self._spool, None
+            await asyncio.to_thread(_discard_spool, spool)
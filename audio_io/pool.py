@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from metrics import percentile
+
+from .decode import SAMPLE_RATE
+
+
+class TranscriptionQueueFull(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Transcription queue is full; retry in {retry_after}s.")
+        self.retry_after = retry_after
+
+
+# Per-process Whisper model, loaded once by the pool initializer.
+_worker_model: Any = None
+
+
+def _init_worker(model_name: str, torch_threads: int) -> None:
+    global _worker_model
+    import torch
+    import whisper
+
+    if torch_threads > 0:
+        torch.set_num_threads(torch_threads)
+    _worker_model = whisper.load_model(model_name)
+
+
+def _transcribe_in_worker(audio: np.ndarray, initial_prompt: Optional[str]) -> Tuple[str, float, float]:
+    started_at = time.time()
+    result = _worker_model.transcribe(audio, initial_prompt=initial_prompt)
+    return result.get("text", "").strip(), started_at, time.time()
+
+
+class TranscriptionPool:
+    """
+    Dedicated Whisper executor: `workers` processes, each holding one model
+    replica with `torch_threads` intra-op threads. At most `workers + max_queue`
+    jobs are admitted; beyond that `submit` raises `TranscriptionQueueFull`.
+
+    Records queue wait (submit -> worker start) and real-time factor
+    (processing seconds / audio seconds) for every job.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        workers: int,
+        max_queue: int,
+        torch_threads: int = 0,
+        history: int = 500,
+    ) -> None:
+        self.model_name = model_name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.torch_threads = torch_threads or max(1, (os.cpu_count() or 1) // self.workers)
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._queue_waits: Deque[float] = deque(maxlen=history)
+        self._rtfs: Deque[float] = deque(maxlen=history)
+        self._job_seconds: Deque[float] = deque(maxlen=history)
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_name, self.torch_threads),
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def is_full(self) -> bool:
+        """
+        Cheap pre-check so callers can reject before doing decode work.
+        """
+        with self._lock:
+            return self._in_flight >= self.workers + self.max_queue
+
+    def retry_after(self) -> int:
+        with self._lock:
+            avg_job = sum(self._job_seconds) / len(self._job_seconds) if self._job_seconds else 5.0
+            waiting = max(0, self._in_flight - self.workers + 1)
+        return max(1, int(math.ceil(avg_job * waiting / self.workers)))
+
+    def submit(
+        self,
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+        wait: Optional[float] = None,
+    ) -> "Future[str]":
+        """
+        Queue a transcription. With `wait=None` admission is immediate or
+        rejected; otherwise block up to `wait` seconds for a slot.
+        """
+        if self._executor is None:
+            raise RuntimeError("Transcription pool is not running.")
+        admitted = self._slots.acquire(blocking=False) if wait is None else self._slots.acquire(timeout=wait)
+        if not admitted:
+            with self._lock:
+                self._rejected += 1
+            raise TranscriptionQueueFull(self.retry_after())
+
+        submitted_at = time.time()
+        audio_seconds = len(audio) / float(SAMPLE_RATE)
+        with self._lock:
+            self._in_flight += 1
+        try:
+            inner = self._executor.submit(_transcribe_in_worker, audio, initial_prompt)
+        except Exception:
+            self._release(failed=True)
+            raise
+
+        outer: "Future[str]" = Future()
+
+        def _done(f: Future) -> None:
+            try:
+                text, started_at, finished_at = f.result()
+            except BaseException as exc:
+                self._release(failed=True)
+                outer.set_exception(exc)
+                return
+            self._release(
+                failed=False,
+                queue_wait=max(0.0, started_at - submitted_at),
+                job_seconds=finished_at - started_at,
+                audio_seconds=audio_seconds,
+            )
+            outer.set_result(text)
+
+        inner.add_done_callback(_done)
+        return outer
+
+    def _release(
+        self,
+        failed: bool,
+        queue_wait: float = 0.0,
+        job_seconds: float = 0.0,
+        audio_seconds: float = 0.0,
+    ) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+                self._queue_waits.append(queue_wait)
+                self._job_seconds.append(job_seconds)
+                if audio_seconds > 0:
+                    self._rtfs.append(job_seconds / audio_seconds)
+        self._slots.release()
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+        wait: Optional[float] = None,
+    ) -> str:
+        """
+        Blocking transcription; call from worker threads, not the event loop.
+        """
+        return self.submit(audio, initial_prompt=initial_prompt, wait=wait).result()
+
+    async def transcribe_async(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> str:
+        return await asyncio.wrap_future(self.submit(audio, initial_prompt=initial_prompt))
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            waits = list(self._queue_waits)
+            rtfs = list(self._rtfs)
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "torch_threads": self.torch_threads,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "queue_wait_seconds": {
+                    "p50": round(percentile(waits, 50), 4),
+                    "p95": round(percentile(waits, 95), 4),
+                    "max": round(max(waits), 4) if waits else 0.0,
+                },
+                "real_time_factor": {
+                    "p50": round(percentile(rtfs, 50), 4),
+                    "p95": round(percentile(rtfs, 95), 4),
+                },
+            }
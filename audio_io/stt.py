@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, List, Optional, Union
 
+import numpy as np
 import whisper
 
 from config import audio_config
@@ -17,11 +18,106 @@ def _get_model() -> whisper.Whisper:
     return _model_cache
 
 
-def transcribe_audio_file(file_path: str) -> str:
+def transcribe_audio_file(audio: Union[str, np.ndarray], initial_prompt: Optional[str] = None) -> str:
     """
-    Transcribe an audio file using Whisper.
+    Transcribe audio using Whisper. Accepts a file path or mono 16 kHz
+    float32 PCM (as produced by `audio_io.decode.PCMDecoder`).
+    `initial_prompt` conditions decoding on preceding text.
     """
     model = _get_model()
-    result = model.transcribe(file_path)
+    result = model.transcribe(audio, initial_prompt=initial_prompt)
     return result.get("text", "").strip()
 
+
+class WindowedTranscriber:
+    """
+    Incremental transcription over a growing 16 kHz PCM buffer.
+
+    Audio is committed in windows of about `window_seconds`, each cut at the
+    quietest 20 ms frame in its last 40% so words are not split across
+    windows; each committed window is transcribed once, prompted with the text
+    before it. `update` returns the committed text plus a provisional
+    transcript of the unfinished tail. `finalize` re-transcribes the whole
+    buffer in one pass when it is at most `full_pass_seconds` long (the final
+    answer then matches the upload path) and otherwise only decodes the tail.
+    Not thread-safe: call from one thread at a time.
+
+    `transcribe(pcm, initial_prompt)` defaults to the in-process model; pass
+    a `TranscriptionPool.transcribe` to run on the worker pool instead.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        sample_rate: int = 16000,
+        min_tail_seconds: float = 0.5,
+        full_pass_seconds: float = 30.0,
+        transcribe: Callable[[np.ndarray, Optional[str]], str] = transcribe_audio_file,
+    ) -> None:
+        self._transcribe = transcribe
+        self.window_samples = max(1, int(window_seconds * sample_rate))
+        self.min_tail_samples = int(min_tail_seconds * sample_rate)
+        self.full_pass_samples = int(full_pass_seconds * sample_rate)
+        self.frame_samples = max(1, sample_rate // 50)
+        self._committed_samples = 0
+        self._committed_text: List[str] = []
+
+    def _prompt(self) -> Optional[str]:
+        # Whisper only uses the last ~224 prompt tokens; keep the tail of the text.
+        text = " ".join(self._committed_text)
+        return text[-800:] or None
+
+    def _cut_point(self, pcm: np.ndarray, start: int) -> int:
+        """
+        End of the window starting at `start`: the quietest frame boundary
+        between 60% and 100% of the window length.
+        """
+        lo = start + int(self.window_samples * 0.6)
+        hi = start + self.window_samples
+        frames = (hi - lo) // self.frame_samples
+        if frames < 2:
+            return hi
+        region = pcm[lo : lo + frames * self.frame_samples].reshape(frames, self.frame_samples)
+        quietest = int(np.argmin(np.mean(region * region, axis=1)))
+        # Cut in the middle of the quietest frame.
+        return lo + quietest * self.frame_samples + self.frame_samples // 2
+
+    def _commit_windows(self, pcm: np.ndarray) -> None:
+        while len(pcm) - self._committed_samples >= self.window_samples:
+            end = self._cut_point(pcm, self._committed_samples)
+            text = self._transcribe(pcm[self._committed_samples:end], self._prompt())
+            if text:
+                self._committed_text.append(text)
+            self._committed_samples = end
+
+    def _transcribe_tail(self, pcm: np.ndarray) -> str:
+        tail = pcm[self._committed_samples:]
+        if len(tail) < self.min_tail_samples:
+            return ""
+        return self._transcribe(tail, self._prompt())
+
+    def update(self, pcm: np.ndarray) -> str:
+        """
+        Transcribe newly completed windows and return the partial transcript.
+        """
+        self._commit_windows(pcm)
+        parts = self._committed_text + [self._transcribe_tail(pcm)]
+        return " ".join(p for p in parts if p).strip()
+
+    def finalize(self, pcm: np.ndarray) -> str:
+        """
+        Return the full transcript: one pass over the whole buffer when it is
+        short enough, otherwise the committed windows plus the remaining tail.
+        """
+        if len(pcm) <= self.full_pass_samples:
+            text = self._transcribe(pcm, None) if len(pcm) >= self.min_tail_samples else ""
+            self._committed_text = [text] if text else []
+            self._committed_samples = len(pcm)
+            return text.strip()
+        self._commit_windows(pcm)
+        tail = self._transcribe_tail(pcm)
+        if tail:
+            self._committed_text.append(tail)
+        self._committed_samples = len(pcm)
+        return " ".join(self._committed_text).strip()
+
@@ -10,6 +10,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Boolean env var: "1", "true" or "yes" (any case) mean True.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes"}
+
+
 LLMProvider = Literal["groq"]
 
 
@@ -20,11 +30,52 @@ class LLMConfig:
     # Default to a widely-available Groq model; can be overridden via env.
     model: str = os.getenv("LLM_MODEL", "llama-3.3-70b-versatile")
     temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.2"))
+    # Per-attempt HTTP timeout and overall per-call deadline (including retries).
+    timeout_seconds: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+    deadline_seconds: float = float(os.getenv("LLM_DEADLINE_SECONDS", "60"))
+    # Retries on 429/5xx/timeouts use exponential full-jitter backoff.
+    max_retries: int = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    backoff_base_seconds: float = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+    backoff_max_seconds: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+    # Connection pool size for the async HTTP client.
+    max_connections: int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+    # Request `response_format={"type": "json_object"}` for structured prompts;
+    # switched off automatically if the model rejects it.
+    json_mode: bool = _env_bool("LLM_JSON_MODE", True)
+    # Hedged async requests: past the rolling `hedge_percentile` latency of a
+    # prompt type, send a duplicate request and keep the first answer. At most
+    # `hedge_max_rate` of calls are hedged; needs `hedge_min_samples` first.
+    hedge_enabled: bool = _env_bool("LLM_HEDGE_ENABLED", False)
+    hedge_percentile: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    hedge_max_rate: float = float(os.getenv("LLM_HEDGE_MAX_RATE", "0.05"))
+    hedge_min_samples: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+    # Groq rate limits enforced client-side (0 = unlimited). Waiting calls are
+    # served by priority: evaluation > role_extraction > summary.
+    requests_per_minute: float = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "30"))
+    tokens_per_minute: float = float(os.getenv("LLM_TOKENS_PER_MINUTE", "12000"))
+    # Response cache keyed on (model, temperature, prompts, max_tokens): an
+    # in-memory LRU in front of a size-bounded SQLite file. Empty path = memory only.
+    cache_enabled: bool = _env_bool("LLM_CACHE_ENABLED", True)
+    cache_path: str = os.getenv("LLM_CACHE_PATH", "llm_client/cache/responses.db")
+    cache_memory_entries: int = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "512"))
+    cache_max_disk_bytes: int = int(os.getenv("LLM_CACHE_MAX_DISK_BYTES", str(64 * 1024 * 1024)))
+    cache_ttl_seconds: float = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
 
 
 @dataclass
 class EmbeddingConfig:
     model_name: str = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    # "torch" (sentence-transformers, fp32) or "onnx" (ONNX Runtime on CPU,
+    # int8-quantized unless EMBEDDING_ONNX_INT8=false). The ONNX export is
+    # cached under `onnx_cache_dir`. 0 threads = library default.
+    backend: str = os.getenv("EMBEDDING_BACKEND", "torch").strip().lower()
+    onnx_int8: bool = _env_bool("EMBEDDING_ONNX_INT8", True)
+    onnx_cache_dir: str = os.getenv("EMBEDDING_ONNX_DIR", "vector_store/onnx_models")
+    threads: int = int(os.getenv("EMBEDDING_THREADS", "0"))
+    # Micro-batching: concurrent encode calls arriving within the window share
+    # one forward pass of up to `batch_max_size` texts. 1 disables batching.
+    batch_max_size: int = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32"))
+    batch_window_ms: float = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
 
 
 @dataclass
@@ -33,11 +84,89 @@ class VectorStoreConfig:
         "VECTOR_STORE_DIR", "vector_store/chroma_db"
     )
     collection_name: str = os.getenv("VECTOR_COLLECTION_NAME", "interview_questions")
+    # Ingestion manifest (source hashes, extracted questions, stored fingerprints).
+    manifest_path: str = os.getenv(
+        "VECTOR_INGEST_MANIFEST",
+        os.path.join(os.getenv("VECTOR_STORE_DIR", "vector_store/chroma_db"), "ingest_manifest.json"),
+    )
+    # PDF text extraction pool: worker processes (0 = cores, at most 8; 1 = serial)
+    # and pages per task, so large PDFs are split across workers.
+    ingest_workers: int = int(os.getenv("INGEST_WORKERS", "0"))
+    ingest_pages_per_task: int = int(os.getenv("INGEST_PAGES_PER_TASK", "25"))
+    # How often (seconds) the in-memory question index checks whether another
+    # process changed the collection; 0 checks before every draw.
+    index_check_seconds: float = float(os.getenv("VECTOR_INDEX_CHECK_SECONDS", "5"))
 
 
 @dataclass
 class AudioConfig:
     whisper_model: str = os.getenv("WHISPER_MODEL", "base")
+    ffmpeg_binary: str = os.getenv("FFMPEG_BINARY", "ffmpeg")
+    # Uploads are rejected while streaming once either cap is crossed.
+    max_upload_bytes: int = int(os.getenv("AUDIO_MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+    max_upload_seconds: float = float(os.getenv("AUDIO_MAX_UPLOAD_SECONDS", "180"))
+    # Live transcription over WebSocket: committed window length and how often
+    # (in seconds of new audio) a partial transcript is sent back.
+    stream_window_seconds: float = float(os.getenv("AUDIO_STREAM_WINDOW_SECONDS", "5"))
+    stream_partial_interval_seconds: float = float(os.getenv("AUDIO_STREAM_PARTIAL_INTERVAL_SECONDS", "2"))
+    # Answers up to this long are re-transcribed in one pass at the end, so the
+    # final text does not depend on window boundaries (Whisper decodes 30 s at once).
+    stream_full_pass_seconds: float = float(os.getenv("AUDIO_STREAM_FULL_PASS_SECONDS", "30"))
+    # Dedicated Whisper process pool: one model replica per worker. Jobs beyond
+    # workers + queue size are rejected with 429. 0 torch threads = cores / workers.
+    transcription_workers: int = int(os.getenv("TRANSCRIPTION_WORKERS", "1"))
+    transcription_queue_size: int = int(os.getenv("TRANSCRIPTION_QUEUE_SIZE", "4"))
+    transcription_torch_threads: int = int(os.getenv("TRANSCRIPTION_TORCH_THREADS", "0"))
+    # How long a live-stream final transcription may wait for a pool slot.
+    transcription_final_wait_seconds: float = float(os.getenv("TRANSCRIPTION_FINAL_WAIT_SECONDS", "30"))
+
+
+@dataclass
+class EvaluationConfig:
+    # Background answer evaluation: worker count and how many jobs may wait.
+    workers: int = int(os.getenv("EVAL_WORKERS", "4"))
+    queue_size: int = int(os.getenv("EVAL_QUEUE_SIZE", "64"))
+    # Upper bound on how long the report endpoint waits for outstanding jobs.
+    report_wait_seconds: float = float(os.getenv("EVAL_REPORT_WAIT_SECONDS", "60"))
+    # "per_answer" scores each answer in the background as it arrives;
+    # "deferred" only records answers and grades them in batches at report time.
+    mode: str = os.getenv("EVALUATION_MODE", "per_answer")
+    batch_size: int = int(os.getenv("EVAL_BATCH_SIZE", "4"))
+    batch_tokens_per_answer: int = int(os.getenv("EVAL_BATCH_TOKENS_PER_ANSWER", "256"))
+    # Cascade: decide clear-cut answers locally and only send the rest to the LLM.
+    # Empty/sentinel answers (and, if set, answers under `cascade_min_words`;
+    # 0 = off, since terse answers can be correct) score 0; an answer at or above both high thresholds scores 2, one at or below both
+    # low thresholds scores 0. The similarity/coverage tier stays off until its
+    # thresholds have been checked with `evaluation_engine.calibrate_cascade`.
+    cascade_enabled: bool = _env_bool("EVAL_CASCADE_ENABLED", True)
+    cascade_signals_enabled: bool = _env_bool("EVAL_CASCADE_SIGNALS_ENABLED", False)
+    cascade_min_words: int = int(os.getenv("EVAL_CASCADE_MIN_WORDS", "0"))
+    cascade_high_similarity: float = float(os.getenv("EVAL_CASCADE_HIGH_SIMILARITY", "0.88"))
+    cascade_high_coverage: float = float(os.getenv("EVAL_CASCADE_HIGH_COVERAGE", "0.75"))
+    cascade_low_similarity: float = float(os.getenv("EVAL_CASCADE_LOW_SIMILARITY", "0.2"))
+    cascade_low_coverage: float = float(os.getenv("EVAL_CASCADE_LOW_COVERAGE", "0.0"))
+    # Estimated-token budget for the final-summary prompt's per-role digest.
+    summary_token_budget: int = int(os.getenv("SUMMARY_TOKEN_BUDGET", "1500"))
+
+
+@dataclass
+class SessionConfig:
+    # "memory" (single process, LRU + TTL) or "sqlite" (shared across workers).
+    backend: str = os.getenv("SESSION_BACKEND", "memory")
+    sqlite_path: str = os.getenv("SESSION_SQLITE_PATH", "session_store/sessions.db")
+    # Idle sessions are evicted after this many seconds; 0 disables the TTL.
+    ttl_seconds: float = float(os.getenv("SESSION_TTL_SECONDS", "7200"))
+    max_sessions: int = int(os.getenv("SESSION_MAX_SESSIONS", "1000"))
+    reap_interval_seconds: float = float(os.getenv("SESSION_REAP_INTERVAL_SECONDS", "60"))
+
+
+@dataclass
+class AnswerLogConfig:
+    directory: str = os.getenv("ANSWER_LOG_DIR", "interview_logs")
+    # fsync after this many appended entries (0 = only on the time cadence)...
+    fsync_every: int = int(os.getenv("ANSWER_LOG_FSYNC_EVERY", "5"))
+    # ...or once this many seconds have passed since the last fsync.
+    fsync_interval_seconds: float = float(os.getenv("ANSWER_LOG_FSYNC_INTERVAL_SECONDS", "2"))
 
 
 @dataclass
@@ -59,5 +188,8 @@ llm_config = LLMConfig()
 embedding_config = EmbeddingConfig()
 vector_store_config = VectorStoreConfig()
 audio_config = AudioConfig()
+evaluation_config = EvaluationConfig()
+session_config = SessionConfig()
+answer_log_config = AnswerLogConfig()
 coding_round_config = CodingRoundConfig()
 
@@ -1,4 +1,29 @@
-from .evaluator import AnswerEvaluator, RoleEvaluationResult
-
-__all__ = ["AnswerEvaluator", "RoleEvaluationResult"]
+from .cascade import NO_ANSWER_SENTINELS, CascadeThresholds, cascade_stats
+from .evaluator import SUMMARY_UNAVAILABLE, AnswerEvaluator, AnswerToEvaluate, RoleEvaluationResult
+from .pipeline import (
+    EVAL_DEFERRED,
+    EVAL_DONE,
+    EVAL_FAILED,
+    EVAL_PENDING,
+    EvaluationPipeline,
+    EvaluationQueueFull,
+)
+from .summary_payload import build_summary_payload, compact_json
 
+__all__ = [
+    "AnswerEvaluator",
+    "AnswerToEvaluate",
+    "RoleEvaluationResult",
+    "SUMMARY_UNAVAILABLE",
+    "CascadeThresholds",
+    "NO_ANSWER_SENTINELS",
+    "cascade_stats",
+    "EvaluationPipeline",
+    "EvaluationQueueFull",
+    "EVAL_PENDING",
+    "EVAL_DONE",
+    "EVAL_FAILED",
+    "EVAL_DEFERRED",
+    "build_summary_payload",
+    "compact_json",
+]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+from config import evaluation_config
+from llm_client import llm_client
+from vector_store.init_vector_store import build_builtin_sample_questions
+
+from .evaluator import AnswerEvaluator, AnswerToEvaluate
+
+
+def _sample_answers(count: int) -> List[AnswerToEvaluate]:
+    """
+    Built-in questions paired with answers of mixed quality: the ideal answer,
+    its first sentence, and a non-answer, in rotation.
+    """
+    answers: List[AnswerToEvaluate] = []
+    for idx, q in enumerate(build_builtin_sample_questions()[:count]):
+        if idx % 3 == 0:
+            text = q.ideal_answer
+        elif idx % 3 == 1:
+            text = q.ideal_answer.split(". ")[0]
+        else:
+            text = "I am not sure, I have not worked with this."
+        answers.append(
+            AnswerToEvaluate(
+                question_id=q.id,
+                role_name=q.role,
+                question=q.question,
+                ideal_answer=q.ideal_answer,
+                expected_concepts=q.expected_concepts,
+                candidate_answer=text,
+            )
+        )
+    return answers
+
+
+async def _per_answer(evaluator: AnswerEvaluator, answers: List[AnswerToEvaluate]) -> Dict[str, Dict[str, object]]:
+    # Same concurrency as the background evaluation pipeline.
+    slots = asyncio.Semaphore(evaluation_config.workers)
+
+    async def _one(a: AnswerToEvaluate) -> Tuple[str, Dict[str, object]]:
+        async with slots:
+            result = await evaluator.async_evaluate_answer(
+                question_id=a.question_id,
+                role_name=a.role_name,
+                question=a.question,
+                ideal_answer=a.ideal_answer,
+                expected_concepts=a.expected_concepts,
+                candidate_answer=a.candidate_answer,
+            )
+        return a.question_id, result
+
+    return dict(await asyncio.gather(*(_one(a) for a in answers)))
+
+
+async def _measure(label: str, run) -> Tuple[Dict[str, Dict[str, object]], Dict[str, float]]:
+    before = llm_client.usage()
+    started = time.perf_counter()
+    results = await run()
+    elapsed = time.perf_counter() - started
+    after = llm_client.usage()
+    row = {key: after[key] - before[key] for key in after}
+    row["seconds"] = elapsed
+    print(
+        f"{label:<12} {row['requests']:>8} {row['prompt_tokens']:>13} "
+        f"{row['completion_tokens']:>17} {elapsed:>9.2f}"
+    )
+    return results, row
+
+
+async def _main(count: int, batch_size: int) -> None:
+    # Measure real upstream calls only.
+    llm_client.cache = None
+    evaluator = AnswerEvaluator(store=None)
+    answers = _sample_answers(count)
+    print(f"{len(answers)} answers, batch size {batch_size}\n")
+    print(f"{'mode':<12} {'requests':>8} {'prompt_tokens':>13} {'completion_tokens':>17} {'seconds':>9}")
+    single, _ = await _measure("per_answer", lambda: _per_answer(evaluator, answers))
+    batched, _ = await _measure(
+        "deferred", lambda: evaluator.async_evaluate_batch(answers, batch_size=batch_size)
+    )
+
+    common = [qid for qid in single if qid in batched]
+    if common:
+        diffs = [abs(int(single[q]["score"]) - int(batched[q]["score"])) for q in common]  # type: ignore[arg-type]
+        agree = sum(1 for q in common if single[q]["llm_score"] == batched[q]["llm_score"])
+        print(
+            f"\nScore agreement over {len(common)} answers: mean |diff| {sum(diffs) / len(diffs):.1f} points, "
+            f"same rubric score {agree}/{len(common)}"
+        )
+    missing = len(answers) - len(batched)
+    if missing:
+        print(f"{missing} answers could not be evaluated in deferred mode.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-answer and deferred batch evaluation.")
+    parser.add_argument("--answers", type=int, default=12, help="Number of sample answers to grade.")
+    parser.add_argument("--batch-size", type=int, default=evaluation_config.batch_size)
+    args = parser.parse_args()
+    asyncio.run(_main(args.answers, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import answer_log_config
+
+from .cascade import CascadeThresholds
+from .evaluator import AnswerEvaluator
+
+
+def _rubric_bucket(score: int) -> int:
+    """
+    Rubric score (0-2) behind a logged 0-100 score: blends with an LLM score
+    of 0 land at or below 30, those with an LLM score of 2 at or above 70.
+    """
+    if score <= 30:
+        return 0
+    if score >= 70:
+        return 2
+    return 1
+
+
+def _logged_answers(directory: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Scored answers from the evaluation JSON files in `directory`.
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "interview_evaluation_*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        for questions in data.get("questions", {}).values():
+            for q in questions:
+                if q.get("score") is None or q.get("answer_text") is None:
+                    continue
+                yield os.path.basename(path), q
+
+
+def calibrate(directory: str, thresholds: CascadeThresholds, store: Optional[Any]) -> Dict[str, object]:
+    """
+    Replay the cascade over logged answers and compare its local decisions
+    with the logged scores, which came from full LLM grading.
+    """
+    evaluator = AnswerEvaluator(store=store, cascade=thresholds)
+    tiers: Counter = Counter()
+    agree: Counter = Counter()
+    diffs: Dict[str, List[int]] = {"rule": [], "signals": []}
+    disagreements: List[Dict[str, object]] = []
+    total = 0
+    for filename, q in _logged_answers(directory):
+        total += 1
+        local, _ = evaluator._local_evaluation(
+            str(q.get("id", "")),
+            list(q.get("expected_concepts") or []),
+            str(q["answer_text"]),
+        )
+        if local is None:
+            tiers["llm"] += 1
+            continue
+        tier = str(local["decided_by"])
+        tiers[tier] += 1
+        logged = int(q["score"])
+        diffs[tier].append(abs(int(local["score"]) - logged))  # type: ignore[arg-type]
+        if int(local["llm_score"]) == _rubric_bucket(logged):  # type: ignore[arg-type]
+            agree[tier] += 1
+        else:
+            disagreements.append(
+                {
+                    "file": filename,
+                    "id": q.get("id"),
+                    "tier": tier,
+                    "cascade_score": local["score"],
+                    "logged_score": logged,
+                    "answer": str(q["answer_text"])[:80],
+                }
+            )
+
+    local_total = tiers["rule"] + tiers["signals"]
+    per_tier = {
+        tier: {
+            "decided": tiers[tier],
+            "agreement": round(agree[tier] / tiers[tier], 4) if tiers[tier] else None,
+            "mean_abs_diff": round(sum(diffs[tier]) / len(diffs[tier]), 1) if diffs[tier] else None,
+        }
+        for tier in ("rule", "signals")
+    }
+    return {
+        "answers": total,
+        "decided_locally": local_total,
+        "sent_to_llm": tiers["llm"],
+        "llm_calls_saved_rate": round(local_total / total, 4) if total else 0.0,
+        "agreement": round(sum(agree.values()) / local_total, 4) if local_total else None,
+        "tiers": per_tier,
+        "disagreements": disagreements,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay the evaluation cascade over logged interviews and report agreement with "
+            "full-LLM scores. Use logs written with EVAL_CASCADE_ENABLED=false."
+        )
+    )
+    defaults = CascadeThresholds()
+    parser.add_argument("--logs-dir", default=answer_log_config.directory)
+    parser.add_argument(
+        "--no-embeddings",
+        action="store_true",
+        help="Skip the vector store; only the rule tier can decide answers.",
+    )
+    parser.add_argument("--min-words", type=int, default=defaults.min_words)
+    parser.add_argument("--high-similarity", type=float, default=defaults.high_similarity)
+    parser.add_argument("--high-coverage", type=float, default=defaults.high_coverage)
+    parser.add_argument("--low-similarity", type=float, default=defaults.low_similarity)
+    parser.add_argument("--low-coverage", type=float, default=defaults.low_coverage)
+    parser.add_argument("--show-disagreements", action="store_true")
+    args = parser.parse_args()
+
+    # Both tiers are replayed, whatever EVAL_CASCADE_SIGNALS_ENABLED says.
+    thresholds = CascadeThresholds(
+        enabled=True,
+        signals_enabled=True,
+        min_words=args.min_words,
+        high_similarity=args.high_similarity,
+        high_coverage=args.high_coverage,
+        low_similarity=args.low_similarity,
+        low_coverage=args.low_coverage,
+    )
+    store = None
+    if not args.no_embeddings:
+        from vector_store import InterviewVectorStore
+
+        store = InterviewVectorStore()
+
+    report = calibrate(args.logs_dir, thresholds, store)
+    print(f"{report['answers']} logged answers")
+    print(
+        f"decided locally: {report['decided_locally']} "
+        f"({float(report['llm_calls_saved_rate']) * 100:.1f}% of LLM calls saved), "
+        f"sent to LLM: {report['sent_to_llm']}"
+    )
+    for tier, row in report["tiers"].items():  # type: ignore[union-attr]
+        agreement = f"{row['agreement'] * 100:.1f}%" if row["agreement"] is not None else "-"
+        diff = row["mean_abs_diff"] if row["mean_abs_diff"] is not None else "-"
+        print(f"  {tier:<8} decided {row['decided']:>4}  rubric agreement {agreement:>6}  mean |diff| {diff}")
+    if report["agreement"] is not None:
+        print(f"overall agreement with LLM scoring: {float(report['agreement']) * 100:.1f}%")
+    if args.show_disagreements:
+        for row in report["disagreements"]:  # type: ignore[union-attr]
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from config import evaluation_config
+
+
+# Answer texts the frontend submits when the candidate did not answer.
+NO_ANSWER_SENTINELS = ("(No answer - time expired)", "(Candidate stopped early)")
+
+DECIDED_BY_RULE = "rule"
+DECIDED_BY_SIGNALS = "signals"
+DECIDED_BY_LLM = "llm"
+
+
+@dataclass
+class CascadeThresholds:
+    enabled: bool = evaluation_config.cascade_enabled
+    signals_enabled: bool = evaluation_config.cascade_signals_enabled
+    min_words: int = evaluation_config.cascade_min_words
+    high_similarity: float = evaluation_config.cascade_high_similarity
+    high_coverage: float = evaluation_config.cascade_high_coverage
+    low_similarity: float = evaluation_config.cascade_low_similarity
+    low_coverage: float = evaluation_config.cascade_low_coverage
+
+
+def decide_by_rules(candidate_answer: str, thresholds: CascadeThresholds) -> Optional[Dict[str, Any]]:
+    """
+    Rubric verdict for answers that need no grading at all: empty answers,
+    the frontend's no-answer sentinels and, when `min_words` is set, answers
+    shorter than that.
+    """
+    text = candidate_answer.strip()
+    if not text or text in NO_ANSWER_SENTINELS:
+        reason = "No answer was given."
+    elif thresholds.min_words > 0 and len(text.split()) < thresholds.min_words:
+        reason = "The answer is too short to address the question."
+    else:
+        return None
+    return {"score": 0, "reasoning": reason, "strengths": [], "weaknesses": ["No substantive answer."]}
+
+
+def decide_by_signals(
+    similarity: Optional[float],
+    coverage: float,
+    thresholds: CascadeThresholds,
+) -> Optional[Dict[str, Any]]:
+    """
+    Rubric verdict when embedding similarity and concept coverage agree
+    clearly; None for anything in between. Without a similarity (no vector
+    store) nothing is decided here.
+    """
+    if similarity is None:
+        return None
+    if similarity >= thresholds.high_similarity and coverage >= thresholds.high_coverage:
+        return {
+            "score": 2,
+            "reasoning": "The answer closely matches the ideal answer and covers the expected concepts.",
+            "strengths": ["Covers the expected concepts."],
+            "weaknesses": [],
+        }
+    if similarity <= thresholds.low_similarity and coverage <= thresholds.low_coverage:
+        return {
+            "score": 0,
+            "reasoning": "The answer is unrelated to the ideal answer and mentions none of the expected concepts.",
+            "strengths": [],
+            "weaknesses": ["Does not address the expected concepts."],
+        }
+    return None
+
+
+class CascadeStats:
+    """
+    Counts of answers decided by each cascade tier.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {DECIDED_BY_RULE: 0, DECIDED_BY_SIGNALS: 0, DECIDED_BY_LLM: 0}
+
+    def record(self, decided_by: str) -> None:
+        with self._lock:
+            self._counts[decided_by] += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            total = sum(self._counts.values())
+            local = self._counts[DECIDED_BY_RULE] + self._counts[DECIDED_BY_SIGNALS]
+            return {
+                **self._counts,
+                "answers": total,
+                "llm_calls_saved_rate": round(local / total, 4) if total else 0.0,
+            }
+
+
+cascade_stats = CascadeStats()
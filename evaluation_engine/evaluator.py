@@ -1,11 +1,42 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from llm_client import llm_client
-from prompts import ANSWER_EVAL_SYSTEM_PROMPT, FINAL_SUMMARY_SYSTEM_PROMPT
+from config import evaluation_config
+from llm_client import PRIORITY_EVALUATION, PRIORITY_SUMMARY, StructuredOutputError, llm_client
+from prompts import (
+    ANSWER_EVAL_SCHEMA,
+    ANSWER_EVAL_SYSTEM_PROMPT,
+    BATCH_ANSWER_EVAL_SCHEMA,
+    BATCH_ANSWER_EVAL_SYSTEM_PROMPT,
+    FINAL_SUMMARY_SYSTEM_PROMPT,
+)
+
+from .cascade import (
+    DECIDED_BY_LLM,
+    DECIDED_BY_RULE,
+    DECIDED_BY_SIGNALS,
+    CascadeThresholds,
+    cascade_stats,
+    decide_by_rules,
+    decide_by_signals,
+)
+from .summary_payload import build_summary_payload, compact_json
+
+
+SUMMARY_UNAVAILABLE = "Summary unavailable."
+
+
+@dataclass
+class AnswerToEvaluate:
+    question_id: str
+    role_name: str
+    question: str
+    ideal_answer: str
+    expected_concepts: List[str]
+    candidate_answer: str
 
 
 @dataclass
@@ -22,10 +53,12 @@ class RoleEvaluationResult:
 class AnswerEvaluator:
     """
     Uses the LLM to evaluate each answer and aggregates scores per role.
+    Clear-cut answers are decided locally first (see `cascade`).
     """
 
-    def __init__(self, store: Optional[Any] = None) -> None:
+    def __init__(self, store: Optional[Any] = None, cascade: Optional[CascadeThresholds] = None) -> None:
         self._store = store
+        self._cascade = cascade or CascadeThresholds()
 
     @staticmethod
     def _safe_llm_score(value: object, default: int = 1) -> int:
@@ -47,50 +80,107 @@ class AnswerEvaluator:
                 hits += 1
         return hits / float(len(expected_concepts))
 
-    def evaluate_answer(
-        self,
-        question_id: str,
+    @staticmethod
+    def _build_eval_prompt(
         role_name: str,
         question: str,
         ideal_answer: str,
         expected_concepts: List[str],
         candidate_answer: str,
-    ) -> Dict[str, object]:
-        user_prompt = json.dumps(
+    ) -> str:
+        return compact_json(
             {
                 "role": role_name,
                 "question": question,
                 "ideal_answer": ideal_answer,
                 "expected_concepts": expected_concepts,
                 "candidate_answer": candidate_answer,
-            },
-            indent=2,
-        )
-        response = llm_client.chat(
-            system_prompt=ANSWER_EVAL_SYSTEM_PROMPT,
-            user_prompt=user_prompt,
-            max_tokens=512,
+            }
         )
+
+    @staticmethod
+    def _default_evaluation() -> Dict[str, Any]:
+        return {
+            "score": 1,
+            "reasoning": "Default partial score due to parsing error.",
+            "strengths": [],
+            "weaknesses": [],
+        }
+
+    def _semantic(self, question_id: str, candidate_answer: str) -> Optional[Dict[str, float]]:
+        if self._store is None or not candidate_answer.strip():
+            return None
         try:
-            data = json.loads(response)
-        except json.JSONDecodeError:
-            data = {
-                "score": 1,
-                "reasoning": "Default partial score due to parsing error.",
-                "strengths": [],
-                "weaknesses": [],
-            }
+            return self._store.semantic_answer_score(
+                question_id=question_id,
+                candidate_answer=candidate_answer,
+            )
+        except Exception:
+            return None
 
-        semantic = None
-        if self._store is not None and candidate_answer.strip():
-            try:
-                semantic = self._store.semantic_answer_score(
-                    question_id=question_id,
-                    candidate_answer=candidate_answer,
-                )
-            except Exception:
-                semantic = None
+    def _local_evaluation(
+        self,
+        question_id: str,
+        expected_concepts: List[str],
+        candidate_answer: str,
+    ) -> Tuple[Optional[Dict[str, object]], Optional[Dict[str, float]]]:
+        """
+        Run the cheap cascade tiers. Returns the final result when rules or
+        signals are decisive (else None) and the embedding score for reuse.
+        """
+        if not self._cascade.enabled:
+            return None, self._semantic(question_id, candidate_answer)
+        verdict = decide_by_rules(candidate_answer, self._cascade)
+        if verdict is not None:
+            return self._rule_evaluation(verdict, expected_concepts, candidate_answer), None
+        semantic = self._semantic(question_id, candidate_answer)
+        if not self._cascade.signals_enabled:
+            return None, semantic
+        verdict = decide_by_signals(
+            float(semantic["similarity"]) if semantic else None,
+            self._concept_coverage(expected_concepts, candidate_answer),
+            self._cascade,
+        )
+        if verdict is not None:
+            return self._score_evaluation(verdict, expected_concepts, candidate_answer, semantic, DECIDED_BY_SIGNALS), None
+        return None, semantic
 
+    def _rule_evaluation(
+        self,
+        verdict: Dict[str, Any],
+        expected_concepts: List[str],
+        candidate_answer: str,
+    ) -> Dict[str, object]:
+        """
+        Fixed zero for rule verdicts: no blend and no false-zero guardrail,
+        which exist to soften LLM grading, not to re-grade non-answers.
+        """
+        cascade_stats.record(DECIDED_BY_RULE)
+        return {
+            "score": 0,
+            "reasoning": str(verdict["reasoning"]),
+            "strengths": list(verdict["strengths"]),
+            "weaknesses": list(verdict["weaknesses"]),
+            "semantic_similarity": 0.0,
+            "semantic_score": 0.0,
+            "concept_coverage": round(self._concept_coverage(expected_concepts, candidate_answer), 3),
+            "llm_score": 0,
+            "blended_score_0_2": 0.0,
+            "decided_by": DECIDED_BY_RULE,
+        }
+
+    def _score_evaluation(
+        self,
+        data: Dict[str, Any],
+        expected_concepts: List[str],
+        candidate_answer: str,
+        semantic: Optional[Dict[str, float]],
+        decided_by: str = DECIDED_BY_LLM,
+    ) -> Dict[str, object]:
+        """
+        Blend the rubric score with embedding similarity and concept coverage.
+        """
+        cascade_stats.record(decided_by)
         similarity = float(semantic["similarity"]) if semantic else 0.0
         llm_score_0_2 = self._safe_llm_score(data.get("score"), default=1)
         semantic_score_0_2 = float(semantic["score"]) if semantic and "score" in semantic else float(llm_score_0_2)
@@ -120,8 +210,179 @@ class AnswerEvaluator:
             "concept_coverage": round(concept_coverage, 3),
             "llm_score": llm_score_0_2,
             "blended_score_0_2": round(blended_0_2, 3),
+            "decided_by": decided_by,
         }
 
+    def evaluate_answer(
+        self,
+        question_id: str,
+        role_name: str,
+        question: str,
+        ideal_answer: str,
+        expected_concepts: List[str],
+        candidate_answer: str,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        local, semantic = self._local_evaluation(question_id, expected_concepts, candidate_answer)
+        if local is not None:
+            return local
+        user_prompt = self._build_eval_prompt(role_name, question, ideal_answer, expected_concepts, candidate_answer)
+        try:
+            data = llm_client.chat_json(
+                system_prompt=ANSWER_EVAL_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                schema=ANSWER_EVAL_SCHEMA,
+                prompt_name="answer_evaluation",
+                max_tokens=512,
+                priority=PRIORITY_EVALUATION,
+                session_id=session_id,
+            )
+        except StructuredOutputError:
+            data = self._default_evaluation()
+        return self._score_evaluation(data, expected_concepts, candidate_answer, semantic)
+
+    async def async_evaluate_answer(
+        self,
+        question_id: str,
+        role_name: str,
+        question: str,
+        ideal_answer: str,
+        expected_concepts: List[str],
+        candidate_answer: str,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """
+        Async variant of `evaluate_answer`; the embedding pass runs in a thread.
+        """
+        local, semantic = await asyncio.to_thread(
+            self._local_evaluation, question_id, expected_concepts, candidate_answer
+        )
+        if local is not None:
+            return local
+        user_prompt = self._build_eval_prompt(role_name, question, ideal_answer, expected_concepts, candidate_answer)
+        try:
+            data = await llm_client.async_chat_json(
+                system_prompt=ANSWER_EVAL_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                schema=ANSWER_EVAL_SCHEMA,
+                prompt_name="answer_evaluation",
+                max_tokens=512,
+                priority=PRIORITY_EVALUATION,
+                session_id=session_id,
+            )
+        except StructuredOutputError:
+            data = self._default_evaluation()
+        return self._score_evaluation(data, expected_concepts, candidate_answer, semantic)
+
+    async def async_evaluate_batch(
+        self,
+        items: List[AnswerToEvaluate],
+        session_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Dict[str, object]]:
+        """
+        Evaluate many answers with several Q/A pairs per LLM call; batches run
+        concurrently. Returns results keyed by question id in the same shape
+        as `evaluate_answer`. Answers a batch did not grade are re-evaluated one
+        by one; ids missing from the result could not be evaluated at all.
+        Answers the cascade decides locally never reach a batch.
+        """
+        results: Dict[str, Dict[str, object]] = {}
+        semantics: Dict[str, Optional[Dict[str, float]]] = {}
+        pending: List[AnswerToEvaluate] = []
+        # Cascade passes run concurrently so their embeddings share batches.
+        local_passes = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._local_evaluation, item.question_id, item.expected_concepts, item.candidate_answer
+                )
+                for item in items
+            )
+        )
+        for item, (local, semantic) in zip(items, local_passes):
+            if local is not None:
+                results[item.question_id] = local
+            else:
+                semantics[item.question_id] = semantic
+                pending.append(item)
+
+        size = max(1, batch_size or evaluation_config.batch_size)
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+        outcomes = await asyncio.gather(
+            *(self._async_evaluate_chunk(chunk, semantics, session_id) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, dict):
+                results.update(outcome)
+        return results
+
+    async def _async_evaluate_chunk(
+        self,
+        chunk: List[AnswerToEvaluate],
+        semantics: Dict[str, Optional[Dict[str, float]]],
+        session_id: Optional[str],
+    ) -> Dict[str, Dict[str, object]]:
+        payload = compact_json(
+            {
+                "items": [
+                    {
+                        "id": item.question_id,
+                        "role": item.role_name,
+                        "question": item.question,
+                        "ideal_answer": item.ideal_answer,
+                        "expected_concepts": item.expected_concepts,
+                        "candidate_answer": item.candidate_answer,
+                    }
+                    for item in chunk
+                ]
+            }
+        )
+        try:
+            data = await llm_client.async_chat_json(
+                system_prompt=BATCH_ANSWER_EVAL_SYSTEM_PROMPT,
+                user_prompt=payload,
+                schema=BATCH_ANSWER_EVAL_SCHEMA,
+                prompt_name="batch_answer_evaluation",
+                max_tokens=evaluation_config.batch_tokens_per_answer * len(chunk),
+                priority=PRIORITY_EVALUATION,
+                session_id=session_id,
+            )
+            graded = {str(e["id"]): e for e in data["evaluations"]}
+        except StructuredOutputError:
+            graded = {}
+
+        results: Dict[str, Dict[str, object]] = {}
+        missing: List[AnswerToEvaluate] = []
+        for item in chunk:
+            evaluation = graded.get(item.question_id)
+            if evaluation is None:
+                missing.append(item)
+                continue
+            results[item.question_id] = self._score_evaluation(
+                evaluation, item.expected_concepts, item.candidate_answer, semantics.get(item.question_id)
+            )
+
+        singles = await asyncio.gather(
+            *(
+                self.async_evaluate_answer(
+                    question_id=item.question_id,
+                    role_name=item.role_name,
+                    question=item.question,
+                    ideal_answer=item.ideal_answer,
+                    expected_concepts=item.expected_concepts,
+                    candidate_answer=item.candidate_answer,
+                    session_id=session_id,
+                )
+                for item in missing
+            ),
+            return_exceptions=True,
+        )
+        for item, single in zip(missing, singles):
+            if isinstance(single, dict):
+                results[item.question_id] = single
+        return results
+
     def aggregate_role_scores(
         self,
         interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
@@ -158,31 +419,73 @@ class AnswerEvaluator:
             )
         return results
 
+    @staticmethod
+    def _build_summary_prompt(
+        interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
+        role_results: List[RoleEvaluationResult],
+    ) -> str:
+        return build_summary_payload(
+            interview_state,
+            role_scores={r.role_name: r.normalized_score for r in role_results},
+            token_budget=evaluation_config.summary_token_budget,
+        )
+
     def generate_final_summary(
         self,
         interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
         role_results: List[RoleEvaluationResult],
+        session_id: Optional[str] = None,
     ) -> str:
         """
         Generate a concise final summary using the LLM.
         """
         try:
-            payload = {
-                "roles": [
-                    {
-                        "role_name": r.role_name,
-                        "score_percent": round(r.normalized_score, 2),
-                    }
-                    for r in role_results
-                ],
-                "questions": interview_state.get("questions", {}),
-            }
             response = llm_client.chat(
                 system_prompt=FINAL_SUMMARY_SYSTEM_PROMPT,
-                user_prompt=json.dumps(payload, indent=2),
+                user_prompt=self._build_summary_prompt(interview_state, role_results),
                 max_tokens=256,
+                priority=PRIORITY_SUMMARY,
+                session_id=session_id,
             )
             return response.strip()
         except Exception:
-            return "Summary unavailable."
+            return SUMMARY_UNAVAILABLE
 
+    async def async_generate_final_summary(
+        self,
+        interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
+        role_results: List[RoleEvaluationResult],
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        Async variant of `generate_final_summary`.
+        """
+        try:
+            response = await llm_client.async_chat(
+                system_prompt=FINAL_SUMMARY_SYSTEM_PROMPT,
+                user_prompt=self._build_summary_prompt(interview_state, role_results),
+                max_tokens=256,
+                priority=PRIORITY_SUMMARY,
+                session_id=session_id,
+            )
+            return response.strip()
+        except Exception:
+            return SUMMARY_UNAVAILABLE
+
+    async def async_stream_final_summary(
+        self,
+        interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
+        role_results: List[RoleEvaluationResult],
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the final summary as text deltas. Errors propagate to the caller.
+        """
+        async for delta in llm_client.async_chat_stream(
+            system_prompt=FINAL_SUMMARY_SYSTEM_PROMPT,
+            user_prompt=self._build_summary_prompt(interview_state, role_results),
+            max_tokens=256,
+            priority=PRIORITY_SUMMARY,
+            session_id=session_id,
+        ):
+            yield delta
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+EVAL_PENDING = "pending"
+EVAL_DONE = "done"
+EVAL_FAILED = "failed"
+# Recorded but not yet scored (EVALUATION_MODE=deferred); graded at report time.
+EVAL_DEFERRED = "deferred"
+
+
+class EvaluationQueueFull(Exception):
+    """Raised when the pipeline already holds `max_queue` waiting jobs."""
+
+
+EvaluationJob = Callable[[], Awaitable[object]]
+
+
+class EvaluationPipeline:
+    """
+    Bounded asyncio worker pool for answer evaluation.
+
+    Jobs are coroutine factories; `submit` returns a future that resolves with
+    the job result (or its exception) once a worker has run it.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self._queue: Optional[asyncio.Queue[Tuple[EvaluationJob, asyncio.Future]]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._running = 0
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"evaluation-worker-{idx}")
+            for idx in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, job: EvaluationJob) -> asyncio.Future:
+        if self._queue is None:
+            raise RuntimeError("Evaluation pipeline is not running.")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            raise EvaluationQueueFull(f"Evaluation queue is full ({self.max_queue} jobs).") from None
+        return future
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job, future = await queue.get()
+            self._running += 1
+            try:
+                if not future.cancelled():
+                    result = await job()
+                    if not future.done():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                self._running -= 1
+                queue.task_done()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+        }
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Dict, List, Optional
+
+from llm_client import estimate_tokens
+
+
+# Successively cheaper digest settings, tried until the payload fits the
+# budget: (answer excerpt chars, question chars, strengths/weaknesses per role,
+# whether per-answer entries are included at all).
+_DEGRADE_STEPS = [
+    (400, 200, 3, True),
+    (200, 120, 3, True),
+    (100, 80, 2, True),
+    (0, 80, 2, True),
+    (0, 0, 2, False),
+    (0, 0, 1, False),
+]
+
+
+def compact_json(payload: object) -> str:
+    """
+    Serialization used for every JSON payload sent to the LLM.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(str(text).split())
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 1)].rstrip() + "…"
+
+
+def _top_points(points: List[str], limit: int) -> List[str]:
+    """
+    Most frequently mentioned points, case-insensitively, in first-seen wording.
+    """
+    counts: Counter = Counter()
+    wording: Dict[str, str] = {}
+    for point in points:
+        key = " ".join(str(point).lower().split())
+        if not key:
+            continue
+        counts[key] += 1
+        wording.setdefault(key, str(point).strip())
+    return [wording[key] for key, _ in counts.most_common(limit)]
+
+
+def _role_digest(
+    role_name: str,
+    questions: List[Dict[str, object]],
+    score_percent: Optional[float],
+    excerpt_chars: int,
+    question_chars: int,
+    points: int,
+    with_answers: bool,
+) -> Dict[str, object]:
+    answered = [q for q in questions if q.get("answer_text")]
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    for q in answered:
+        strengths.extend(q.get("strengths") or [])  # type: ignore[arg-type]
+        weaknesses.extend(q.get("weaknesses") or [])  # type: ignore[arg-type]
+
+    digest: Dict[str, object] = {
+        "role": role_name,
+        "score_percent": round(score_percent, 1) if score_percent is not None else None,
+        "answered": len(answered),
+        "question_scores": [q.get("score") for q in answered],
+        "top_strengths": _top_points(strengths, points),
+        "top_weaknesses": _top_points(weaknesses, points),
+    }
+    if with_answers:
+        answers = []
+        for q in answered:
+            entry: Dict[str, object] = {"score": q.get("score")}
+            if question_chars:
+                entry["q"] = _truncate(str(q.get("question", "")), question_chars)
+            if excerpt_chars:
+                entry["a"] = _truncate(str(q.get("answer_text", "")), excerpt_chars)
+            answers.append(entry)
+        digest["answers"] = answers
+    return digest
+
+
+def build_summary_payload(
+    interview_state: Dict[str, Dict[str, List[Dict[str, object]]]],
+    role_scores: Dict[str, float],
+    token_budget: int,
+) -> str:
+    """
+    Compact per-role digest of the interview for the final-summary prompt.
+
+    Ideal answers and per-question reasoning are never sent. Answer excerpts,
+    question text and the number of strengths/weaknesses shrink step by step
+    until the estimated token count fits `token_budget`; the smallest digest
+    is returned if even that does not fit.
+    """
+    questions_by_role = interview_state.get("questions", {})
+    payload = ""
+    for excerpt_chars, question_chars, points, with_answers in _DEGRADE_STEPS:
+        roles = [
+            _role_digest(
+                role_name,
+                list(questions),
+                role_scores.get(role_name),
+                excerpt_chars,
+                question_chars,
+                points,
+                with_answers,
+            )
+            for role_name, questions in questions_by_role.items()
+        ]
+        payload = compact_json({"roles": roles})
+        if token_budget <= 0 or estimate_tokens(payload) <= token_budget:
+            break
+    return payload
@@ -7,6 +7,7 @@ const state = {
   timerRemaining: 60,
   mediaRecorder: null,
   audioChunks: [],
+  answerStream: null,
   micStream: null,
   audioMimeType: null,
   audioDiscard: false,
@@ -37,6 +38,7 @@ const state = {
 
 const PREP_SECONDS = 10;
 const RECORD_SECONDS = 60;
+const STREAM_TIMESLICE_MS = 500;
 const CODING_SECONDS = 10 * 60;
 
 const el = {
@@ -515,17 +517,16 @@ const clearAutoRecordTimers = () => {
 const uploadAudioAnswer = async (blob, options = {}) => {
   if (!state.sessionId || !state.question) return;
   setStopBtnState(true);
-  const ext = blob.type.includes("ogg") ? "ogg" : "webm";
-  const formData = new FormData();
-  formData.append("file", blob, `answer.${ext}`);
   try {
+    // Send the raw blob so the server can stream it straight into the decoder.
     const data = await apiFetch(
       `/interview/${state.sessionId}/answer/audio?question_id=${encodeURIComponent(
         state.question.id
       )}`,
       {
         method: "POST",
-        body: formData,
+        headers: { "Content-Type": blob.type || "audio/webm" },
+        body: blob,
       }
     );
     await handlePostAnswerFlow(data, options);
@@ -535,6 +536,75 @@ const uploadAudioAnswer = async (blob, options = {}) => {
   }
 };
 
+const openAnswerStream = (questionId) => {
+  if (typeof WebSocket === "undefined" || !state.sessionId) return null;
+  const base = state.apiBase.replace(/\/$/, "").replace(/^http/, "ws");
+  const socket = new WebSocket(
+    `${base}/interview/${state.sessionId}/answer/stream?question_id=${encodeURIComponent(questionId)}`
+  );
+  // Chunks recorded before the socket opens are queued and flushed in order.
+  const stream = { socket, pending: [], failed: false, result: null };
+  stream.result = new Promise((resolve, reject) => {
+    socket.onmessage = (event) => {
+      let message = null;
+      try {
+        message = JSON.parse(event.data);
+      } catch (_err) {
+        return;
+      }
+      if (message.type === "partial") {
+        setAudioStatus(`Hearing: ${message.text}`, "info");
+      } else if (message.type === "final") {
+        resolve(message);
+      } else if (message.type === "error") {
+        reject(new Error(message.detail || "Live transcription failed."));
+      }
+    };
+    socket.onerror = () => reject(new Error("Live transcription connection failed."));
+    socket.onclose = () => reject(new Error("Live transcription closed early."));
+  });
+  stream.result.catch(() => {
+    stream.failed = true;
+  });
+  socket.onopen = () => {
+    stream.pending.forEach((item) => socket.send(item));
+    stream.pending = [];
+  };
+  return stream;
+};
+
+const sendToAnswerStream = (stream, item) => {
+  if (!stream || stream.failed) return;
+  if (stream.socket.readyState === WebSocket.OPEN) {
+    stream.socket.send(item);
+  } else if (stream.socket.readyState === WebSocket.CONNECTING) {
+    stream.pending.push(item);
+  }
+};
+
+const closeAnswerStream = (stream) => {
+  if (!stream) return;
+  stream.failed = true;
+  if (stream.socket.readyState <= WebSocket.OPEN) {
+    stream.socket.close();
+  }
+};
+
+const submitStreamedAnswer = async (stream, blob, options = {}) => {
+  if (!state.sessionId || !state.question) return;
+  setStopBtnState(true);
+  try {
+    if (stream.failed) throw new Error("Live transcription unavailable.");
+    sendToAnswerStream(stream, JSON.stringify({ type: "stop" }));
+    const data = await stream.result;
+    await handlePostAnswerFlow(data, options);
+  } catch (_err) {
+    // Fall back to uploading the full recording.
+    closeAnswerStream(stream);
+    await uploadAudioAnswer(blob, options);
+  }
+};
+
 const startRecording = async () => {
   if (!state.question || state.interviewLocked) return;
   try {
@@ -548,17 +618,23 @@ const startRecording = async () => {
     }
     const options = state.audioMimeType ? { mimeType: state.audioMimeType } : undefined;
     const recorder = new MediaRecorder(stream, options);
+    // MP4 recordings (Safari) cannot be decoded until complete; upload them instead.
+    const answerStream = /mp4/i.test(recorder.mimeType || "") ? null : openAnswerStream(state.question.id);
+    state.answerStream = answerStream;
     state.mediaRecorder = recorder;
     recorder.ondataavailable = (event) => {
       if (event.data && event.data.size > 0) {
         state.audioChunks.push(event.data);
+        sendToAnswerStream(answerStream, event.data);
       }
     };
     recorder.onstop = () => {
       const shouldGoNextImmediately = state.stopRequested;
       state.stopRequested = false;
+      state.answerStream = null;
       if (state.audioDiscard) {
         state.audioDiscard = false;
+        closeAnswerStream(answerStream);
         resetAudioUI();
         return;
       }
@@ -566,6 +642,7 @@ const startRecording = async () => {
         type: recorder.mimeType || state.audioMimeType || "audio/webm",
       });
       if (!blob.size) {
+        closeAnswerStream(answerStream);
         setAudioStatus("Recorded audio was empty.", "error");
         resetAudioUI();
         if (shouldGoNextImmediately) {
@@ -577,10 +654,14 @@ const startRecording = async () => {
         el.audioPlayback.src = URL.createObjectURL(blob);
         el.audioPlayback.hidden = false;
       }
-      uploadAudioAnswer(blob, { immediateNext: shouldGoNextImmediately });
+      if (answerStream) {
+        submitStreamedAnswer(answerStream, blob, { immediateNext: shouldGoNextImmediately });
+      } else {
+        uploadAudioAnswer(blob, { immediateNext: shouldGoNextImmediately });
+      }
       resetAudioUI();
     };
-    recorder.start();
+    recorder.start(answerStream ? STREAM_TIMESLICE_MS : undefined);
     setAudioStatus("Recording... speak now.", "success");
     state.autoRecordStopTimer = setTimeout(() => {
       stopRecording();
@@ -971,27 +1052,66 @@ const bindCodingSubmitHandler = () => {
   el.submitCodingBtn.dataset.bound = "1";
 };
 
+const renderReport = (data) => {
+  const roles = data.roles || [];
+  const lines = [];
+  if (typeof data.total_raw_score === "number" && typeof data.max_possible === "number") {
+    lines.push(`Overall Score: ${data.total_raw_score}/${data.max_possible}`);
+    lines.push("");
+  }
+  roles.forEach((role) => {
+    lines.push(`${role.role_name}: ${role.total_raw_score}/${role.max_possible}`);
+    lines.push("");
+  });
+  if (data.final_summary) {
+    lines.push("Summary:");
+    lines.push(data.final_summary);
+    lines.push("");
+  }
+  lines.push(`Total questions: ${data.total_questions}`);
+  el.reportOutput.textContent = lines.join("\n");
+};
+
+// Report sections arrive first, then the summary streams in token by token.
+// Resolves with the complete report from the final `done` event.
+const streamReport = () =>
+  new Promise((resolve, reject) => {
+    if (typeof EventSource === "undefined") {
+      reject(new Error("EventSource is not supported."));
+      return;
+    }
+    const base = state.apiBase.replace(/\/$/, "");
+    const source = new EventSource(`${base}/interview/${state.sessionId}/report/stream`);
+    let report = null;
+    let summary = "";
+    source.addEventListener("report", (event) => {
+      report = JSON.parse(event.data);
+      renderReport(report);
+    });
+    source.addEventListener("summary", (event) => {
+      summary += JSON.parse(event.data).delta || "";
+      if (report) renderReport({ ...report, final_summary: summary });
+    });
+    source.addEventListener("done", (event) => {
+      source.close();
+      resolve(JSON.parse(event.data));
+    });
+    source.onerror = () => {
+      source.close();
+      reject(new Error("Report stream failed."));
+    };
+  });
+
 el.reportBtn.addEventListener("click", async () => {
   if (!state.sessionId) return;
   try {
-    const data = await apiFetch(`/interview/${state.sessionId}/report`);
-    const roles = data.roles || [];
-    const lines = [];
-    if (typeof data.total_raw_score === "number" && typeof data.max_possible === "number") {
-      lines.push(`Overall Score: ${data.total_raw_score}/${data.max_possible}`);
-      lines.push("");
-    }
-    roles.forEach((role) => {
-      lines.push(`${role.role_name}: ${role.total_raw_score}/${role.max_possible}`);
-      lines.push("");
-    });
-    if (data.final_summary) {
-      lines.push("Summary:");
-      lines.push(data.final_summary);
-      lines.push("");
+    let data;
+    try {
+      data = await streamReport();
+    } catch (streamErr) {
+      data = await apiFetch(`/interview/${state.sessionId}/report`);
     }
-    lines.push(`Total questions: ${data.total_questions}`);
-    el.reportOutput.textContent = lines.join("\n");
+    renderReport(data);
     state.reportData = data;
     if (el.downloadReportBtn) el.downloadReportBtn.disabled = false;
     if (el.downloadAnswersBtn) el.downloadAnswersBtn.disabled = false;
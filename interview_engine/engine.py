@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import random
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Dict, List, Optional
 
 from role_extractor import DetectedRole
@@ -28,6 +28,10 @@ class InterviewSession:
     - Runs warmup + technical questions based on role allocation.
     - Adds one coding-round question after technical questions are done.
     - Uses the vector store to fetch questions, avoiding duplicates.
+    - `prefetch_questions` plans the remaining technical questions ahead of
+      time so `get_next_question` can usually serve them without a store query.
+      It is split into `draw_planned_questions` (store queries, read-only) and
+      `merge_planned_questions` so callers can draw outside a session lock.
     """
 
     def __init__(self, roles: List[DetectedRole], store: Optional[InterviewVectorStore] = None) -> None:
@@ -56,6 +60,10 @@ class InterviewSession:
         self.questions_by_role[self.coding_role_name] = []
         self.warmup_done: bool = False
         self.coding_round_done: bool = False
+        # Bumped on every recorded answer/evaluation so derived data (reports) can be cached.
+        self.version: int = 0
+        # Questions drawn ahead of time per role, served in order by get_next_question.
+        self.planned_questions: Dict[str, List[QuestionRecord]] = {r: [] for r in self.role_order}
         self._coding_round_questions: List[QuestionRecord] = load_coding_round_questions()
         self._warmup_record: QuestionRecord = QuestionRecord(
             id="warmup_1",
@@ -106,6 +114,81 @@ class InterviewSession:
     def has_more_questions(self) -> bool:
         return self._has_more_technical_questions() or (not self.coding_round_done)
 
+    def _take_planned_question(self, role_name: str) -> Optional[QuestionRecord]:
+        planned = self.planned_questions.get(role_name, [])
+        asked = set(self.asked_question_ids)
+        while planned:
+            question = planned.pop(0)
+            if question.id not in asked:
+                return question
+        return None
+
+    def _prefetch_needs(self) -> Dict[str, int]:
+        needs: Dict[str, int] = {}
+        for role_name in self.role_order:
+            planned = self.planned_questions.get(role_name, [])
+            needed = self.questions_per_role[role_name] - len(self.questions_by_role[role_name]) - len(planned)
+            if needed > 0:
+                needs[role_name] = needed
+        return needs
+
+    def needs_prefetch(self) -> bool:
+        return bool(self._prefetch_needs())
+
+    def draw_planned_questions(self) -> Dict[str, List[QuestionRecord]]:
+        """
+        Draw the questions still missing from each role's plan, one store
+        query per role, without changing the session. Pass the result to
+        `merge_planned_questions`.
+        """
+        excluded = list(self.asked_question_ids)
+        for planned in self.planned_questions.values():
+            excluded.extend(q.id for q in planned)
+
+        drawn: Dict[str, List[QuestionRecord]] = {}
+        for role_name, needed in self._prefetch_needs().items():
+            fetched = self.store.get_random_questions_for_role(
+                role=role_name,
+                n=needed,
+                exclude_ids=excluded,
+            )
+            if fetched:
+                drawn[role_name] = fetched
+                excluded.extend(q.id for q in fetched)
+        return drawn
+
+    def merge_planned_questions(self, drawn: Dict[str, List[QuestionRecord]]) -> int:
+        """
+        Add drawn questions to the plan, skipping any asked or planned since
+        the draw and any beyond what each role still needs. Returns how many
+        were added.
+        """
+        taken = set(self.asked_question_ids)
+        for planned in self.planned_questions.values():
+            taken.update(q.id for q in planned)
+        needs = self._prefetch_needs()
+
+        added = 0
+        for role_name, fetched in drawn.items():
+            planned = self.planned_questions.setdefault(role_name, [])
+            for question in fetched:
+                if needs.get(role_name, 0) <= 0:
+                    break
+                if question.id in taken:
+                    continue
+                planned.append(question)
+                taken.add(question.id)
+                needs[role_name] -= 1
+                added += 1
+        return added
+
+    def prefetch_questions(self) -> int:
+        """
+        Draw the remaining technical questions for every role in one store
+        query per role. Returns how many questions were added to the plan.
+        """
+        return self.merge_planned_questions(self.draw_planned_questions())
+
     def get_next_question(self) -> Optional[QuestionRecord]:
         """
         Retrieve the next question: first returns warmup, then technical questions
@@ -149,17 +232,18 @@ class InterviewSession:
         if len(self.questions_by_role[role_name]) >= quota:
             return None
 
-        remaining = quota - len(self.questions_by_role[role_name])
-        n_to_fetch = min(5, max(remaining, 1) + 2)
-        fetched = self.store.get_random_questions_for_role(
-            role=role_name,
-            n=n_to_fetch,
-            exclude_ids=self.asked_question_ids,
-        )
-        if not fetched:
-            return None
-
-        question = self._select_question_with_llm(role_name, fetched)
+        question = self._take_planned_question(role_name)
+        if question is None:
+            remaining = quota - len(self.questions_by_role[role_name])
+            n_to_fetch = min(5, max(remaining, 1) + 2)
+            fetched = self.store.get_random_questions_for_role(
+                role=role_name,
+                n=n_to_fetch,
+                exclude_ids=self.asked_question_ids,
+            )
+            if not fetched:
+                return None
+            question = self._select_question_with_llm(role_name, fetched)
         self.asked_question_ids.append(question.id)
         self.questions_by_role[role_name].append(QuestionWithEvaluation(question=question))
         return question
@@ -184,6 +268,7 @@ class InterviewSession:
                     item.reasoning = reasoning
                     item.strengths = strengths
                     item.weaknesses = weaknesses
+                    self.version += 1
                     return
 
     def to_serializable(self) -> Dict[str, Dict[str, List[Dict[str, object]]]]:
@@ -217,3 +302,73 @@ class InterviewSession:
                 )
         return data
 
+    def to_state(self) -> Dict[str, object]:
+        """
+        Full snapshot of the session: `to_serializable` plus the cursor fields
+        needed to resume it in another process.
+        """
+        data: Dict[str, object] = dict(self.to_serializable())
+        data["cursor"] = {
+            "current_role_index": self.current_role_index,
+            "asked_question_ids": list(self.asked_question_ids),
+            "warmup_done": self.warmup_done,
+            "coding_round_done": self.coding_round_done,
+            "version": self.version,
+            "planned_questions": {
+                role_name: [asdict(q) for q in planned]
+                for role_name, planned in self.planned_questions.items()
+            },
+        }
+        return data
+
+    @classmethod
+    def from_state(
+        cls,
+        data: Dict[str, object],
+        store: Optional[InterviewVectorStore] = None,
+    ) -> "InterviewSession":
+        """
+        Rebuild a session from a `to_state` snapshot.
+        """
+        roles_meta: Dict[str, Dict[str, object]] = data.get("roles", {})  # type: ignore[assignment]
+        roles = [
+            DetectedRole(
+                name=name,
+                confidence=float(meta.get("confidence", 0.5)),
+                rationale=str(meta.get("rationale", "")),
+            )
+            for name, meta in roles_meta.items()
+        ]
+        session = cls(roles=roles, store=store)
+
+        questions: Dict[str, List[Dict[str, object]]] = data.get("questions", {})  # type: ignore[assignment]
+        for role_name, qlist in questions.items():
+            session.questions_by_role[role_name] = [
+                QuestionWithEvaluation(
+                    question=QuestionRecord(
+                        id=str(q["id"]),
+                        question=str(q["question"]),
+                        role=role_name,
+                        difficulty=str(q.get("difficulty", "medium")),
+                        ideal_answer=str(q.get("ideal_answer", "")),
+                        expected_concepts=list(q.get("expected_concepts", [])),  # type: ignore[arg-type]
+                    ),
+                    answer_text=q.get("answer_text"),  # type: ignore[arg-type]
+                    score=q.get("score"),  # type: ignore[arg-type]
+                    reasoning=q.get("reasoning"),  # type: ignore[arg-type]
+                    strengths=list(q.get("strengths", [])),  # type: ignore[arg-type]
+                    weaknesses=list(q.get("weaknesses", [])),  # type: ignore[arg-type]
+                )
+                for q in qlist
+            ]
+
+        cursor: Dict[str, object] = data.get("cursor", {})  # type: ignore[assignment]
+        session.current_role_index = int(cursor.get("current_role_index", 0))  # type: ignore[arg-type]
+        session.asked_question_ids = list(cursor.get("asked_question_ids", []))  # type: ignore[arg-type]
+        session.warmup_done = bool(cursor.get("warmup_done", False))
+        session.coding_round_done = bool(cursor.get("coding_round_done", False))
+        session.version = int(cursor.get("version", 0))  # type: ignore[arg-type]
+        planned: Dict[str, List[Dict[str, object]]] = cursor.get("planned_questions", {})  # type: ignore[assignment]
+        for role_name, qlist in planned.items():
+            session.planned_questions[role_name] = [QuestionRecord(**q) for q in qlist]  # type: ignore[arg-type]
+        return session
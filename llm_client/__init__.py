@@ -1,4 +1,42 @@
+from .cache import ResponseCache, cache_key
 from .client import LLMClient, llm_client
+from .hedging import HedgePolicy
+from .scheduler import (
+    PRIORITY_CLASSES,
+    PRIORITY_EVALUATION,
+    PRIORITY_ROLE_EXTRACTION,
+    PRIORITY_SUMMARY,
+    LLMScheduler,
+    TokenBucket,
+    estimate_tokens,
+)
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .structured import (
+    JSONObjectExtractor,
+    ParseStats,
+    StructuredOutputError,
+    extract_json_object,
+    validate_json,
+)
 
-__all__ = ["LLMClient", "llm_client"]
-
+__all__ = [
+    "AsyncSingleFlight",
+    "HedgePolicy",
+    "JSONObjectExtractor",
+    "LLMClient",
+    "LLMScheduler",
+    "PRIORITY_CLASSES",
+    "PRIORITY_EVALUATION",
+    "PRIORITY_ROLE_EXTRACTION",
+    "PRIORITY_SUMMARY",
+    "ParseStats",
+    "ResponseCache",
+    "SingleFlight",
+    "StructuredOutputError",
+    "TokenBucket",
+    "cache_key",
+    "estimate_tokens",
+    "extract_json_object",
+    "llm_client",
+    "validate_json",
+]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def cache_key(
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    response_format: Optional[str] = None,
+) -> str:
+    """
+    Content address of a chat request: sha256 over the fields that decide the response.
+    """
+    fields: list = [model, temperature, system_prompt, user_prompt, max_tokens]
+    if response_format:
+        fields.append(response_format)
+    payload = json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for LLM responses.
+
+    The memory tier is an LRU of `memory_entries` items. The disk tier is a
+    SQLite table bounded by `max_disk_bytes` (least recently used rows go
+    first) and shared by every worker process pointing at the same file.
+    Entries older than `ttl_seconds` are treated as misses in both tiers.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        memory_entries: int = 512,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self.path = path
+        self.memory_entries = max(0, memory_entries)
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # key -> (value, stored_at), least recently used first.
+        self._memory: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._local = threading.local()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        self._disk_evictions = 0
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = self._conn()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at)")
+            conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and (now - stored_at) > self.ttl_seconds
+
+    def get(self, key: str, request_bytes: int = 0) -> Optional[str]:
+        """
+        Look `key` up in memory, then on disk. `request_bytes` is the prompt
+        size, counted towards bytes saved on a hit.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if not self._expired(stored_at, now):
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    self._bytes_saved += request_bytes + len(value.encode("utf-8"))
+                    return value
+                del self._memory[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._bytes_saved += request_bytes + len(value.encode("utf-8"))
+            self._remember(key, value, now)
+        return value
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        if not self.path:
+            return None
+        conn = self._conn()
+        row = conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        with conn:
+            if self._expired(created_at, now):
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+        if self.path:
+            self._disk_put(key, value, now)
+
+    def _remember(self, key: str, value: str, stored_at: float) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (value, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_put(self, key: str, value: str, now: float) -> None:
+        size = len(value.encode("utf-8"))
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (key, value, size, now, now),
+            )
+            if self.ttl_seconds > 0:
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            if self.max_disk_bytes > 0:
+                # Keep the most recently used rows whose running size fits the budget.
+                cur = conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC) AS running "
+                    "FROM responses) WHERE running > ?)",
+                    (self.max_disk_bytes,),
+                )
+                if cur.rowcount > 0:
+                    with self._lock:
+                        self._disk_evictions += cur.rowcount
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.path:
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.path:
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, object]:
+        disk_entries, disk_bytes = 0, 0
+        if self.path:
+            disk_entries, disk_bytes = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "memory_entries": len(self._memory),
+                "disk_entries": int(disk_entries),
+                "disk_bytes": int(disk_bytes),
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "bytes_saved": self._bytes_saved,
+                "disk_evictions": self._disk_evictions,
+            }
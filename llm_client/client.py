@@ -1,16 +1,104 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Optional
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from groq import Groq
+import httpx
+from groq import APIConnectionError, APIStatusError, APITimeoutError, AsyncGroq, BadRequestError, Groq
 
 from config import llm_config
+from prompts import JSON_REPAIR_SYSTEM_PROMPT
+
+from .cache import ResponseCache, cache_key
+from .hedging import HedgePolicy
+from .scheduler import PRIORITY_EVALUATION, LLMScheduler, estimate_tokens
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .structured import ParseStats, StructuredOutputError, extract_json_object, validate_json
+
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """
+    Read `retry-after-ms` / `retry-after` (seconds or HTTP date) from an API error.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return float(retry_ms) / 1000.0
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, (APITimeoutError, APIConnectionError, asyncio.TimeoutError)):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS
+    return False
+
+
+def _failed_generation(exc: BadRequestError) -> Optional[str]:
+    """
+    In JSON mode Groq rejects output that is not valid JSON with a 400 carrying
+    the raw text as `failed_generation`; return it so it can be repaired.
+    """
+    body = exc.body if isinstance(exc.body, dict) else {}
+    error = body.get("error", body)
+    if isinstance(error, dict) and error.get("code") == "json_validate_failed":
+        return str(error.get("failed_generation") or "")
+    return None
+
+
+def _usage_tokens(response: Any) -> Optional[int]:
+    usage = getattr(response, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    return int(total) if total is not None else None
 
 
 class LLMClient:
     """
     Groq-only LLM client for chat completions.
+
+    Both `chat` and `async_chat` enforce a per-call deadline and retry
+    429/5xx/timeouts with exponential full-jitter backoff, honouring
+    Retry-After when the API sends it. The async path shares one pooled
+    HTTP client.
+
+    Responses are cached by content (see `ResponseCache`) and concurrent
+    identical requests share one upstream call (see `SingleFlight`). Pass
+    `cache=False` for calls whose result must not be reused; those skip both.
+    Every upstream attempt is admitted by the shared `LLMScheduler` under the
+    caller's `priority` class and `session_id`.
+
+    `chat_json` / `async_chat_json` request JSON mode (dropped for the rest
+    of the process if the model rejects it), validate the response against a
+    schema and spend at most one short repair call before giving up.
+
+    Async calls can be hedged: past a rolling latency percentile an identical
+    second request is raced against the first, under a hedge-rate cap.
     """
 
     def __init__(
@@ -22,28 +110,576 @@ class LLMClient:
         self.temperature = temperature if temperature is not None else llm_config.temperature
         # Explicitly read API key from environment so it works both locally (.env)
         # and on hosts with managed secrets / env vars.
-        api_key = os.getenv("GROQ_API_KEY")
-        self._client = Groq(api_key=api_key) if api_key else Groq()
+        self._api_key = os.getenv("GROQ_API_KEY")
+        # Retries are handled here, so the SDK's own retry loop is disabled.
+        self._client = (
+            Groq(api_key=self._api_key, timeout=llm_config.timeout_seconds, max_retries=0)
+            if self._api_key
+            else Groq(timeout=llm_config.timeout_seconds, max_retries=0)
+        )
+        self._async_client: Optional[AsyncGroq] = None
+        self.cache: Optional[ResponseCache] = (
+            ResponseCache(
+                path=llm_config.cache_path or None,
+                memory_entries=llm_config.cache_memory_entries,
+                max_disk_bytes=llm_config.cache_max_disk_bytes,
+                ttl_seconds=llm_config.cache_ttl_seconds,
+            )
+            if llm_config.cache_enabled
+            else None
+        )
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self.scheduler = LLMScheduler(
+            requests_per_minute=llm_config.requests_per_minute,
+            tokens_per_minute=llm_config.tokens_per_minute,
+        )
+        self.hedge = HedgePolicy(
+            enabled=llm_config.hedge_enabled,
+            percentile=llm_config.hedge_percentile,
+            max_rate=llm_config.hedge_max_rate,
+            min_samples=llm_config.hedge_min_samples,
+        )
+        self._json_mode = llm_config.json_mode
+        self._usage_lock = threading.Lock()
+        self._usage = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._parse_stats = ParseStats()
+
+    def _get_async_client(self) -> AsyncGroq:
+        if self._async_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=llm_config.max_connections,
+                    max_keepalive_connections=llm_config.max_connections,
+                ),
+                timeout=llm_config.timeout_seconds,
+            )
+            kwargs: Dict[str, Any] = {"http_client": http_client, "max_retries": 0}
+            if self._api_key:
+                kwargs["api_key"] = self._api_key
+            self._async_client = AsyncGroq(**kwargs)
+        return self._async_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _request(self, system_prompt: str, user_prompt: str, max_tokens: int, json_mode: bool) -> Dict[str, Any]:
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+        if json_mode and self._json_mode:
+            request["response_format"] = {"type": "json_object"}
+        return request
+
+    def _json_mode_fallback(self, request: Dict[str, Any], exc: Exception) -> Optional[str]:
+        """
+        Handle a 400 caused by JSON mode. Returns the rejected generation when
+        the model produced invalid JSON, or drops JSON mode (mutating `request`)
+        and returns None when the model does not support it. Re-raises otherwise.
+        """
+        if "response_format" not in request or not isinstance(exc, BadRequestError):
+            raise exc
+        failed = _failed_generation(exc)
+        if failed is not None:
+            return failed
+        if "response_format" not in str(exc):
+            raise exc
+        self._json_mode = False
+        del request["response_format"]
+        return None
+
+    def _cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int, json_mode: bool = False) -> str:
+        return cache_key(
+            self.model,
+            self.temperature,
+            system_prompt,
+            user_prompt,
+            max_tokens,
+            response_format="json_object" if json_mode else None,
+        )
+
+    @staticmethod
+    def _request_bytes(system_prompt: str, user_prompt: str) -> int:
+        return len(system_prompt.encode("utf-8")) + len(user_prompt.encode("utf-8"))
+
+    def _account(self, estimated: int, source: Any) -> None:
+        """
+        Record Groq-reported usage from a response (or final stream chunk
+        metadata) and correct the scheduler's token estimate with it.
+        """
+        usage = getattr(source, "usage", None)
+        with self._usage_lock:
+            self._usage["requests"] += 1
+            self._usage["prompt_tokens"] += int(getattr(usage, "prompt_tokens", 0) or 0)
+            self._usage["completion_tokens"] += int(getattr(usage, "completion_tokens", 0) or 0)
+        self.scheduler.settle(estimated, _usage_tokens(source))
+
+    def usage(self) -> Dict[str, int]:
+        with self._usage_lock:
+            return dict(self._usage)
+
+    def stats(self) -> Dict[str, object]:
+        cache_stats = {"enabled": True, **self.cache.stats()} if self.cache is not None else {"enabled": False}
+        return {
+            "usage": self.usage(),
+            "cache": cache_stats,
+            "singleflight": {"sync": self._flight.stats(), "async": self._async_flight.stats()},
+            "scheduler": self.scheduler.stats(),
+            "hedging": self.hedge.stats(),
+            "json_mode": {"configured": llm_config.json_mode, "active": self._json_mode},
+            "structured": self._parse_stats.stats(),
+        }
+
+    @staticmethod
+    def _backoff(attempt: int, exc: Exception) -> float:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, llm_config.backoff_max_seconds)
+        ceiling = min(llm_config.backoff_max_seconds, llm_config.backoff_base_seconds * (2**attempt))
+        return random.uniform(0.0, ceiling)
+
+    def _next_delay(self, attempt: int, exc: Exception, deadline_at: float) -> Optional[float]:
+        """
+        Delay before the next attempt, or None when the error is final.
+        """
+        if attempt >= llm_config.max_retries or not _is_retryable(exc):
+            return None
+        delay = self._backoff(attempt, exc)
+        if time.monotonic() + delay >= deadline_at:
+            return None
+        return delay
 
     def chat(
         self,
         system_prompt: str,
         user_prompt: str,
         max_tokens: int = 512,
+        deadline: Optional[float] = None,
+        cache: bool = True,
+        priority: str = PRIORITY_EVALUATION,
+        session_id: Optional[str] = None,
+        json_mode: bool = False,
     ) -> str:
         """
         Perform a Groq chat completion request and return the response text.
+        `deadline` (seconds) bounds the whole call including retries and
+        time spent queued for rate-limit budget.
+        """
+        if not cache:
+            return self._chat_uncached(system_prompt, user_prompt, max_tokens, deadline, priority, session_id, json_mode)
+        key = self._cache_key(system_prompt, user_prompt, max_tokens, json_mode)
+        if self.cache is not None:
+            cached = self.cache.get(key, self._request_bytes(system_prompt, user_prompt))
+            if cached is not None:
+                return cached
+
+        def _call() -> str:
+            text = self._chat_uncached(system_prompt, user_prompt, max_tokens, deadline, priority, session_id, json_mode)
+            if self.cache is not None and text:
+                self.cache.put(key, text)
+            return text
+
+        return self._flight.do(key, _call)
+
+    def _chat_uncached(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        deadline: Optional[float],
+        priority: str,
+        session_id: Optional[str],
+        json_mode: bool,
+    ) -> str:
+        deadline_at = time.monotonic() + (deadline or llm_config.deadline_seconds)
+        request = self._request(system_prompt, user_prompt, max_tokens, json_mode)
+        estimated = estimate_tokens(system_prompt, user_prompt) + max_tokens
+        attempt = 0
+        while True:
+            try:
+                self.scheduler.acquire(
+                    priority, session_id, estimated, timeout=max(0.1, deadline_at - time.monotonic())
+                )
+                remaining = deadline_at - time.monotonic()
+                response = self._client.chat.completions.create(
+                    **request,
+                    timeout=max(0.1, min(remaining, llm_config.timeout_seconds)),
+                )
+                self._account(estimated, response)
+                return response.choices[0].message.content or ""
+            except BadRequestError as exc:
+                failed = self._json_mode_fallback(request, exc)
+                if failed is not None:
+                    return failed
+                continue
+            except Exception as exc:
+                delay = self._next_delay(attempt, exc, deadline_at)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def async_chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 512,
+        deadline: Optional[float] = None,
+        cache: bool = True,
+        priority: str = PRIORITY_EVALUATION,
+        session_id: Optional[str] = None,
+        json_mode: bool = False,
+        prompt_name: Optional[str] = None,
+    ) -> str:
         """
-        response = self._client.chat.completions.create(
-            model=self.model,
-            temperature=self.temperature,
+        Async variant of `chat` on the pooled HTTP client. Slow calls may be
+        hedged (see `HedgePolicy`); `prompt_name` (default: the priority class)
+        selects the latency history used for that.
+        """
+        prompt_name = prompt_name or priority
+        if not cache:
+            return await self._async_hedged(
+                system_prompt, user_prompt, max_tokens, deadline, priority, session_id, json_mode, prompt_name
+            )
+        key = self._cache_key(system_prompt, user_prompt, max_tokens, json_mode)
+        if self.cache is not None:
+            cached = await asyncio.to_thread(
+                self.cache.get, key, self._request_bytes(system_prompt, user_prompt)
+            )
+            if cached is not None:
+                return cached
+
+        async def _call() -> str:
+            text = await self._async_hedged(
+                system_prompt, user_prompt, max_tokens, deadline, priority, session_id, json_mode, prompt_name
+            )
+            if self.cache is not None and text:
+                await asyncio.to_thread(self.cache.put, key, text)
+            return text
+
+        return await self._async_flight.do(key, _call)
+
+    async def _async_hedged(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        deadline: Optional[float],
+        priority: str,
+        session_id: Optional[str],
+        json_mode: bool,
+        prompt_name: str,
+    ) -> str:
+        """
+        Run the request; if it outlives the prompt's hedge threshold, race an
+        identical second request and cancel whichever loses. Both requests
+        share the call's deadline; a call too short to fit a hedge is not hedged.
+        """
+        started = time.monotonic()
+        budget = deadline or llm_config.deadline_seconds
+        deadline_at = started + budget
+
+        def _start() -> "asyncio.Task[str]":
+            return asyncio.ensure_future(
+                self._async_chat_uncached(
+                    system_prompt,
+                    user_prompt,
+                    max_tokens,
+                    max(0.1, deadline_at - time.monotonic()),
+                    priority,
+                    session_id,
+                    json_mode,
+                )
+            )
+
+        threshold = self.hedge.threshold(prompt_name, budget)
+        primary = _start()
+        hedge: Optional["asyncio.Task[str]"] = None
+        hedge_started = 0.0
+        try:
+            if threshold is not None:
+                await asyncio.wait({primary}, timeout=threshold)
+                if not primary.done() and self.hedge.try_hedge(prompt_name):
+                    hedge_started = time.monotonic()
+                    hedge = _start()
+            if hedge is None:
+                try:
+                    text = await primary
+                except Exception:
+                    self.hedge.record(prompt_name, time.monotonic() - started, None, hedged=False)
+                    raise
+                elapsed = time.monotonic() - started
+                self.hedge.record(prompt_name, elapsed, elapsed, hedged=False)
+                return text
+
+            pending = {primary, hedge}
+            while pending:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    now = time.monotonic()
+                    hedge_won = winner is hedge
+                    sample = now - (hedge_started if hedge_won else started)
+                    self.hedge.record(prompt_name, now - started, sample, hedged=True, hedge_won=hedge_won)
+                    return winner.result()
+            self.hedge.record(prompt_name, time.monotonic() - started, None, hedged=True)
+            if pending:
+                raise asyncio.TimeoutError(f"LLM call exceeded its {budget:g}s deadline.")
+            # Both failed: surface the primary's error.
+            return primary.result()
+        finally:
+            losers = [task for task in (primary, hedge) if task is not None and not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    async def _async_chat_uncached(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        deadline: Optional[float],
+        priority: str,
+        session_id: Optional[str],
+        json_mode: bool,
+    ) -> str:
+        deadline_at = time.monotonic() + (deadline or llm_config.deadline_seconds)
+        request = self._request(system_prompt, user_prompt, max_tokens, json_mode)
+        client = self._get_async_client()
+        estimated = estimate_tokens(system_prompt, user_prompt) + max_tokens
+        attempt = 0
+        while True:
+            try:
+                await self.scheduler.acquire_async(
+                    priority, session_id, estimated, timeout=max(0.1, deadline_at - time.monotonic())
+                )
+                remaining = max(0.1, deadline_at - time.monotonic())
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        **request,
+                        timeout=min(remaining, llm_config.timeout_seconds),
+                    ),
+                    timeout=remaining,
+                )
+                self._account(estimated, response)
+                return response.choices[0].message.content or ""
+            except BadRequestError as exc:
+                failed = self._json_mode_fallback(request, exc)
+                if failed is not None:
+                    return failed
+                continue
+            except Exception as exc:
+                delay = self._next_delay(attempt, exc, deadline_at)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def async_chat_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 512,
+        deadline: Optional[float] = None,
+        cache: bool = True,
+        priority: str = PRIORITY_EVALUATION,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream completion text as it is generated. Retries only happen before
+        the first delta arrives. A cache hit is yielded as a single chunk and a
+        completed stream is cached under the same key as `async_chat`.
+        Streams are not coalesced.
+        """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens) if cache else None
+        if key is not None and self.cache is not None:
+            cached = await asyncio.to_thread(
+                self.cache.get, key, self._request_bytes(system_prompt, user_prompt)
+            )
+            if cached is not None:
+                yield cached
+                return
+
+        deadline_at = time.monotonic() + (deadline or llm_config.deadline_seconds)
+        request = self._request(system_prompt, user_prompt, max_tokens, json_mode=False)
+        client = self._get_async_client()
+        estimated = estimate_tokens(system_prompt, user_prompt) + max_tokens
+        attempt = 0
+        while True:
+            try:
+                await self.scheduler.acquire_async(
+                    priority, session_id, estimated, timeout=max(0.1, deadline_at - time.monotonic())
+                )
+                remaining = max(0.1, deadline_at - time.monotonic())
+                stream = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        **request,
+                        stream=True,
+                        timeout=min(remaining, llm_config.timeout_seconds),
+                    ),
+                    timeout=remaining,
+                )
+                break
+            except Exception as exc:
+                delay = self._next_delay(attempt, exc, deadline_at)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        parts: List[str] = []
+        usage_source: Any = None
+        try:
+            async for chunk in stream:
+                # Groq reports usage on the final chunk under `x_groq`.
+                x_groq = getattr(chunk, "x_groq", None)
+                if getattr(x_groq, "usage", None) is not None:
+                    usage_source = x_groq
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        finally:
+            # Runs on error and when the consumer stops early (client
+            # disconnect), so the request is always counted and settled.
+            try:
+                await stream.close()
+            finally:
+                self._account(estimated, usage_source)
+                if usage_source is None:
+                    # No usage chunk arrived: settle with what was streamed.
+                    self.scheduler.settle(estimated, estimate_tokens(system_prompt, user_prompt, *parts))
+        text = "".join(parts)
+        if key is not None and self.cache is not None and text:
+            await asyncio.to_thread(self.cache.put, key, text)
+
+    @staticmethod
+    def _check_json(text: str, schema: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        data = extract_json_object(text)
+        if data is None:
+            return None, ["$: no JSON object found"]
+        return data, validate_json(data, schema)
+
+    @staticmethod
+    def _repair_prompt(schema: Dict[str, Any], text: str, errors: List[str]) -> str:
+        return json.dumps(
+            {"schema": schema, "previous_output": text[:4000], "errors": errors[:10]},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    def _discard_cached(self, system_prompt: str, user_prompt: str, max_tokens: int) -> None:
+        if self.cache is not None:
+            self.cache.discard(self._cache_key(system_prompt, user_prompt, max_tokens, json_mode=True))
+
+    def chat_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: Dict[str, Any],
+        prompt_name: str,
+        max_tokens: int = 512,
+        deadline: Optional[float] = None,
+        priority: str = PRIORITY_EVALUATION,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        JSON-mode chat validated against `schema`. Invalid output gets one
+        repair call; if that also fails, raises `StructuredOutputError`.
+        """
+        text = self.chat(
+            system_prompt,
+            user_prompt,
             max_tokens=max_tokens,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            deadline=deadline,
+            priority=priority,
+            session_id=session_id,
+            json_mode=True,
+        )
+        data, errors = self._check_json(text, schema)
+        if not errors:
+            self._parse_stats.record(prompt_name, "valid")
+            return data  # type: ignore[return-value]
+
+        self._discard_cached(system_prompt, user_prompt, max_tokens)
+        repaired = self.chat(
+            JSON_REPAIR_SYSTEM_PROMPT,
+            self._repair_prompt(schema, text, errors),
+            max_tokens=max_tokens,
+            deadline=deadline,
+            cache=False,
+            priority=priority,
+            session_id=session_id,
+            json_mode=True,
+        )
+        return self._finish_repair(prompt_name, schema, repaired)
+
+    async def async_chat_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: Dict[str, Any],
+        prompt_name: str,
+        max_tokens: int = 512,
+        deadline: Optional[float] = None,
+        priority: str = PRIORITY_EVALUATION,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of `chat_json`.
+        """
+        text = await self.async_chat(
+            system_prompt,
+            user_prompt,
+            max_tokens=max_tokens,
+            deadline=deadline,
+            priority=priority,
+            session_id=session_id,
+            json_mode=True,
+            prompt_name=prompt_name,
         )
-        return response.choices[0].message.content or ""
+        data, errors = self._check_json(text, schema)
+        if not errors:
+            self._parse_stats.record(prompt_name, "valid")
+            return data  # type: ignore[return-value]
+
+        await asyncio.to_thread(self._discard_cached, system_prompt, user_prompt, max_tokens)
+        repaired = await self.async_chat(
+            JSON_REPAIR_SYSTEM_PROMPT,
+            self._repair_prompt(schema, text, errors),
+            max_tokens=max_tokens,
+            deadline=deadline,
+            cache=False,
+            priority=priority,
+            session_id=session_id,
+            json_mode=True,
+            prompt_name=f"{prompt_name}_repair",
+        )
+        return self._finish_repair(prompt_name, schema, repaired)
+
+    def _finish_repair(self, prompt_name: str, schema: Dict[str, Any], repaired: str) -> Dict[str, Any]:
+        data, errors = self._check_json(repaired, schema)
+        if errors:
+            self._parse_stats.record(prompt_name, "failed")
+            raise StructuredOutputError(prompt_name, errors, repaired)
+        self._parse_stats.record(prompt_name, "repaired")
+        return data  # type: ignore[return-value]
 
 
 # Shared default client
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from metrics import percentile
+
+
+class _PromptLatency:
+    def __init__(self, history: int) -> None:
+        # Single-request latencies (cancelled hedged primaries as lower bounds).
+        self.samples: Deque[float] = deque(maxlen=history)
+        # End-to-end latency seen by callers (after hedging).
+        self.observed: Deque[float] = deque(maxlen=history)
+        # Whether each recent call was hedged, for the rate cap.
+        self.recent_hedges: Deque[bool] = deque(maxlen=history)
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        # Calls not hedged because the deadline left no room for a hedge.
+        self.skipped_deadline = 0
+        self.saved_seconds = 0.0
+
+
+class HedgePolicy:
+    """
+    Decides when an async LLM call should be hedged, per prompt type.
+
+    A hedge is sent once the primary request has been running longer than the
+    `percentile` of recent single-request latencies (after `min_samples`
+    observations), and only while hedges stay below `max_rate` of recent calls.
+    A call whose deadline is shorter than the threshold plus the median
+    latency is not hedged, since the hedge could not finish in time.
+
+    Saved time for a hedge win is estimated as the mean remaining latency of
+    historical requests that were still running at that point; it is 0 when
+    no such request has been seen.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float = 95.0,
+        max_rate: float = 0.05,
+        min_samples: int = 20,
+        history: int = 200,
+    ) -> None:
+        self.enabled = enabled
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.history = history
+        self._lock = threading.Lock()
+        self._prompts: Dict[str, _PromptLatency] = {}
+
+    def _prompt(self, prompt_name: str) -> _PromptLatency:
+        entry = self._prompts.get(prompt_name)
+        if entry is None:
+            entry = self._prompts[prompt_name] = _PromptLatency(self.history)
+        return entry
+
+    def threshold(self, prompt_name: str, budget_seconds: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds after which to hedge, or None when hedging does not apply
+        (including when `budget_seconds` cannot fit the threshold plus p50).
+        """
+        if not self.enabled or self.max_rate <= 0:
+            return None
+        with self._lock:
+            entry = self._prompt(prompt_name)
+            if len(entry.samples) < self.min_samples:
+                return None
+            samples = list(entry.samples)
+            threshold = percentile(samples, self.percentile)
+            if budget_seconds is not None and budget_seconds < threshold + percentile(samples, 50):
+                entry.skipped_deadline += 1
+                return None
+            return threshold
+
+    def try_hedge(self, prompt_name: str) -> bool:
+        """
+        Reserve a hedge for a call that crossed the threshold, if the rate cap allows.
+        """
+        with self._lock:
+            entry = self._prompt(prompt_name)
+            window = list(entry.recent_hedges)
+            if window and (sum(window) + 1) / (len(window) + 1) > self.max_rate:
+                return False
+            entry.hedged += 1
+            return True
+
+    def record(
+        self,
+        prompt_name: str,
+        observed: float,
+        sample: Optional[float],
+        hedged: bool,
+        hedge_won: bool = False,
+    ) -> None:
+        """
+        Record one finished call. `sample` is the latency of the request that
+        completed on its own (None if it failed), `observed` what the caller waited.
+        """
+        with self._lock:
+            entry = self._prompt(prompt_name)
+            entry.calls += 1
+            entry.recent_hedges.append(hedged)
+            entry.observed.append(observed)
+            if hedge_won:
+                entry.hedge_wins += 1
+                tail = [s - observed for s in entry.samples if s > observed]
+                if tail:
+                    entry.saved_seconds += sum(tail) / len(tail)
+                # The cancelled primary ran at least this long; keep it as a
+                # (lower-bound) sample so the slow tail stays in the history.
+                entry.samples.append(observed)
+            if sample is not None:
+                entry.samples.append(sample)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            prompts: Dict[str, object] = {}
+            for prompt_name, entry in self._prompts.items():
+                observed = list(entry.observed)
+                threshold = (
+                    percentile(list(entry.samples), self.percentile)
+                    if len(entry.samples) >= self.min_samples
+                    else None
+                )
+                prompts[prompt_name] = {
+                    "calls": entry.calls,
+                    "hedged": entry.hedged,
+                    "hedge_wins": entry.hedge_wins,
+                    "skipped_deadline": entry.skipped_deadline,
+                    "hedge_rate": round(entry.hedged / entry.calls, 4) if entry.calls else 0.0,
+                    "threshold_seconds": round(threshold, 3) if threshold is not None else None,
+                    "latency_seconds": {
+                        "p50": round(percentile(observed, 50), 3),
+                        "p95": round(percentile(observed, 95), 3),
+                        "p99": round(percentile(observed, 99), 3),
+                    },
+                    "estimated_saved_seconds": round(entry.saved_seconds, 3),
+                }
+            return {
+                "enabled": self.enabled,
+                "percentile": self.percentile,
+                "max_rate": self.max_rate,
+                "prompts": prompts,
+            }
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Optional
+
+from metrics import percentile
+
+
+# Priority classes, most urgent first. Unknown names are scheduled last.
+PRIORITY_EVALUATION = "evaluation"
+PRIORITY_ROLE_EXTRACTION = "role_extraction"
+PRIORITY_SUMMARY = "summary"
+PRIORITY_CLASSES = (PRIORITY_EVALUATION, PRIORITY_ROLE_EXTRACTION, PRIORITY_SUMMARY)
+
+_ANONYMOUS = "_anonymous"
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Rough token count (~4 characters per token) used for TPM accounting.
+    """
+    return sum(int(math.ceil(len(text) / 4.0)) for text in texts if text)
+
+
+class TokenBucket:
+    """
+    Refills `per_minute` units evenly over a minute, holding at most one
+    minute's worth. A non-positive rate means unlimited.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.per_minute = per_minute
+        self.capacity = float(per_minute)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.per_minute <= 0
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """
+        Seconds until `amount` is available (0 when it already is). Requests
+        larger than the capacity wait for a full bucket.
+        """
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        needed = min(amount, self.capacity) - self._level
+        return max(0.0, needed * 60.0 / self.per_minute)
+
+    def take(self, amount: float, now: float) -> None:
+        if self.unlimited:
+            return
+        self._refill(now)
+        self._level -= amount
+
+    def adjust(self, delta: float) -> None:
+        """
+        Correct a previous `take` once the real cost is known (negative refunds).
+        """
+        if self.unlimited:
+            return
+        self._refill(time.monotonic())
+        self._level = min(self.capacity, self._level - delta)
+
+    @property
+    def level(self) -> float:
+        if self.unlimited:
+            return float("inf")
+        self._refill(time.monotonic())
+        return self._level
+
+
+class _Ticket:
+    def __init__(self, priority: str, session_id: str, tokens: int, wake: Callable[[], None]) -> None:
+        self.priority = priority
+        self.session_id = session_id
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self._wake = wake
+
+    def grant(self) -> None:
+        self.granted = True
+        self._wake()
+
+
+class LLMScheduler:
+    """
+    Admission control in front of the Groq API.
+
+    Each attempt is admitted against two token buckets: requests per minute
+    and (estimated) tokens per minute. Waiting requests are served strictly
+    by priority class; within a class, sessions take turns so one busy
+    session cannot starve the rest. A single dispatcher thread hands out
+    grants, so sync and async callers share the same budget.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, history: int = 500) -> None:
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._cond = threading.Condition()
+        # priority -> session_id -> waiting tickets; session order is the round-robin order.
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Ticket]]"] = {}
+        self._order = {name: idx for idx, name in enumerate(PRIORITY_CLASSES)}
+        self._unknown_rank = itertools.count(len(PRIORITY_CLASSES))
+        self._waits: Dict[str, Deque[float]] = {}
+        self._granted: Dict[str, int] = {}
+        self._history = history
+        self._dispatcher: Optional[threading.Thread] = None
+
+    @property
+    def unlimited(self) -> bool:
+        return self.requests.unlimited and self.tokens.unlimited
+
+    def _rank(self, priority: str) -> int:
+        if priority not in self._order:
+            self._order[priority] = next(self._unknown_rank)
+        return self._order[priority]
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="llm-scheduler", daemon=True)
+            self._dispatcher.start()
+
+    def _enqueue(self, ticket: _Ticket) -> None:
+        with self._cond:
+            self._ensure_dispatcher()
+            sessions = self._queues.setdefault(ticket.priority, OrderedDict())
+            sessions.setdefault(ticket.session_id, deque()).append(ticket)
+            self._rank(ticket.priority)
+            self._cond.notify()
+
+    def _withdraw(self, ticket: _Ticket) -> bool:
+        """
+        Remove a ticket that is still waiting. Returns False if it was already granted.
+        """
+        with self._cond:
+            if ticket.granted:
+                return False
+            sessions = self._queues.get(ticket.priority)
+            queue = sessions.get(ticket.session_id) if sessions else None
+            if queue is not None and ticket in queue:
+                queue.remove(ticket)
+                if not queue:
+                    del sessions[ticket.session_id]
+            self._cond.notify()
+            return True
+
+    def _head(self) -> Optional[_Ticket]:
+        for priority in sorted(self._queues, key=self._rank):
+            sessions = self._queues[priority]
+            if sessions:
+                return sessions[next(iter(sessions))][0]
+        return None
+
+    def _dispatch_loop(self) -> None:
+        with self._cond:
+            while True:
+                ticket = self._head()
+                if ticket is None:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(ticket.tokens, now))
+                if wait > 0:
+                    # A higher-priority arrival or a withdrawal re-runs the loop early.
+                    self._cond.wait(timeout=wait)
+                    continue
+                self.requests.take(1, now)
+                self.tokens.take(ticket.tokens, now)
+                sessions = self._queues[ticket.priority]
+                queue = sessions.pop(ticket.session_id)
+                queue.popleft()
+                if queue:
+                    # Rotate: the session goes to the back of its class.
+                    sessions[ticket.session_id] = queue
+                self._record(ticket, now)
+                ticket.grant()
+
+    def _record(self, ticket: _Ticket, now: float) -> None:
+        waits = self._waits.setdefault(ticket.priority, deque(maxlen=self._history))
+        waits.append(now - ticket.enqueued_at)
+        self._granted[ticket.priority] = self._granted.get(ticket.priority, 0) + 1
+
+    def acquire(self, priority: str, session_id: Optional[str], tokens: int, timeout: Optional[float] = None) -> None:
+        """
+        Block until one request of `tokens` estimated tokens may be sent.
+        Raises TimeoutError if no grant arrives within `timeout` seconds.
+        """
+        if self.unlimited:
+            return
+        granted = threading.Event()
+        ticket = _Ticket(priority, session_id or _ANONYMOUS, tokens, granted.set)
+        self._enqueue(ticket)
+        if not granted.wait(timeout) and self._withdraw(ticket):
+            raise TimeoutError("Timed out waiting for LLM rate-limit budget.")
+
+    async def acquire_async(
+        self,
+        priority: str,
+        session_id: Optional[str],
+        tokens: int,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if self.unlimited:
+            return
+        loop = asyncio.get_running_loop()
+        granted: "asyncio.Future[None]" = loop.create_future()
+
+        def _wake() -> None:
+            loop.call_soon_threadsafe(lambda: granted.done() or granted.set_result(None))
+
+        ticket = _Ticket(priority, session_id or _ANONYMOUS, tokens, _wake)
+        self._enqueue(ticket)
+        try:
+            await asyncio.wait_for(granted, timeout)
+        except asyncio.TimeoutError:
+            # A grant that raced the timeout has already been charged; use it.
+            if self._withdraw(ticket):
+                raise TimeoutError("Timed out waiting for LLM rate-limit budget.") from None
+        except asyncio.CancelledError:
+            self._withdraw(ticket)
+            raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """
+        Replace the estimate charged at admission with the usage Groq reported.
+        """
+        if actual_tokens is None or self.tokens.unlimited:
+            return
+        with self._cond:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            classes: Dict[str, object] = {}
+            for priority in sorted(set(self._queues) | set(self._waits), key=self._rank):
+                waits = list(self._waits.get(priority, ()))
+                sessions = self._queues.get(priority, {})
+                classes[priority] = {
+                    "queued": sum(len(q) for q in sessions.values()),
+                    "queued_sessions": len(sessions),
+                    "granted": self._granted.get(priority, 0),
+                    "queue_wait_seconds": {
+                        "p50": round(percentile(waits, 50), 4),
+                        "p95": round(percentile(waits, 95), 4),
+                        "max": round(max(waits), 4) if waits else 0.0,
+                    },
+                }
+            return {
+                "requests_per_minute": self.requests.per_minute,
+                "tokens_per_minute": self.tokens.per_minute,
+                "requests_available": None if self.requests.unlimited else round(self.requests.level, 2),
+                "tokens_available": None if self.tokens.unlimited else round(self.tokens.level, 1),
+                "classes": classes,
+            }
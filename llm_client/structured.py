@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+    "number": (int, float),
+    "integer": int,
+}
+
+
+class StructuredOutputError(Exception):
+    """Raised when a response still fails its schema after the repair retry."""
+
+    def __init__(self, prompt_name: str, errors: List[str], raw: str) -> None:
+        super().__init__(f"{prompt_name}: invalid structured output ({'; '.join(errors)})")
+        self.prompt_name = prompt_name
+        self.errors = errors
+        self.raw = raw
+
+
+def _loads_lenient(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(_TRAILING_COMMA.sub(r"\1", text))
+
+
+class JSONObjectExtractor:
+    """
+    Incrementally finds the first complete top-level JSON object in model
+    output, skipping prose and code fences around it. Feed chunks as they
+    arrive; `feed` returns the object as soon as its closing brace is seen.
+    `finish` makes a best effort on truncated output by closing any open
+    string, array and object.
+    """
+
+    def __init__(self) -> None:
+        self.value: Optional[Any] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buf: List[str] = []
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        if self.value is not None:
+            return self.value
+        for ch in chunk:
+            if not self._stack:
+                if ch == "{":
+                    self._buf = ["{"]
+                    self._stack = ["}"]
+                continue
+            self._buf.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._stack.append("}")
+            elif ch == "[":
+                self._stack.append("]")
+            elif ch in "}]" and ch == self._stack[-1]:
+                self._stack.pop()
+                if not self._stack:
+                    try:
+                        value = _loads_lenient("".join(self._buf))
+                    except json.JSONDecodeError:
+                        # Not JSON after all (e.g. a brace in prose); keep scanning.
+                        self._reset()
+                        continue
+                    if isinstance(value, dict):
+                        self.value = value
+                        return value
+                    self._reset()
+        return None
+
+    def finish(self) -> Optional[Any]:
+        if self.value is not None or not self._stack:
+            return self.value
+        text = "".join(self._buf)
+        if self._in_string:
+            text += '"'
+        text = text.rstrip().rstrip(",:")
+        try:
+            value = _loads_lenient(text + "".join(reversed(self._stack)))
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a JSON object from model output: a plain `json.loads` first (the
+    JSON-mode case), then the tolerant extractor.
+    """
+    try:
+        value = json.loads(text)
+        if isinstance(value, dict):
+            return value
+    except json.JSONDecodeError:
+        pass
+    extractor = JSONObjectExtractor()
+    value = extractor.feed(text)
+    return value if value is not None else extractor.finish()
+
+
+def validate_json(value: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """
+    Check `value` against a small JSON Schema subset: type, required,
+    properties, items, enum, minimum and maximum. Returns error strings.
+    """
+    errors: List[str] = []
+    expected = schema.get("type")
+    if expected is not None:
+        py_type = _JSON_TYPES[expected]
+        # bool is an int subclass; never accept it as a number.
+        if not isinstance(value, py_type) or (isinstance(value, bool) and expected != "boolean"):
+            return [f"{path}: expected {expected}, got {type(value).__name__}"]
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: must be one of {schema['enum']}")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            errors.append(f"{path}: must be >= {schema['minimum']}")
+        if "maximum" in schema and value > schema["maximum"]:
+            errors.append(f"{path}: must be <= {schema['maximum']}")
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}.{key}: missing")
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(validate_json(value[key], sub_schema, f"{path}.{key}"))
+    if isinstance(value, list) and "items" in schema:
+        for idx, item in enumerate(value):
+            errors.extend(validate_json(item, schema["items"], f"{path}[{idx}]"))
+    return errors
+
+
+class ParseStats:
+    """
+    Per-prompt outcome counters for structured calls.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, prompt_name: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(prompt_name, {"valid": 0, "repaired": 0, "failed": 0})
+            counts[outcome] += 1
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            result: Dict[str, Dict[str, object]] = {}
+            for prompt_name, counts in self._counts.items():
+                total = sum(counts.values())
+                result[prompt_name] = {
+                    **counts,
+                    "calls": total,
+                    # First-pass failures, whether or not the repair saved them.
+                    "parse_failure_rate": round((counts["repaired"] + counts["failed"]) / total, 4),
+                    "final_failure_rate": round(counts["failed"] / total, 4),
+                }
+            return result
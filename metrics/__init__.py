@@ -0,0 +1,5 @@
+from .percentiles import percentile
+
+__all__ = [
+    "percentile",
+]
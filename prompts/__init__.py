@@ -1,12 +1,19 @@
 from .role_extraction_prompt import ROLE_EXTRACTION_SYSTEM_PROMPT
 from .evaluation_prompt import ANSWER_EVAL_SYSTEM_PROMPT
+from .batch_evaluation_prompt import BATCH_ANSWER_EVAL_SYSTEM_PROMPT
 from .question_selection_prompt import QUESTION_SELECTION_SYSTEM_PROMPT
 from .final_summary_prompt import FINAL_SUMMARY_SYSTEM_PROMPT
+from .json_repair_prompt import JSON_REPAIR_SYSTEM_PROMPT
+from .schemas import ANSWER_EVAL_SCHEMA, BATCH_ANSWER_EVAL_SCHEMA, ROLE_EXTRACTION_SCHEMA
 
 __all__ = [
     "ROLE_EXTRACTION_SYSTEM_PROMPT",
     "ANSWER_EVAL_SYSTEM_PROMPT",
+    "BATCH_ANSWER_EVAL_SYSTEM_PROMPT",
     "QUESTION_SELECTION_SYSTEM_PROMPT",
     "FINAL_SUMMARY_SYSTEM_PROMPT",
+    "JSON_REPAIR_SYSTEM_PROMPT",
+    "ANSWER_EVAL_SCHEMA",
+    "BATCH_ANSWER_EVAL_SCHEMA",
+    "ROLE_EXTRACTION_SCHEMA",
 ]
-
@@ -0,0 +1,50 @@
+# JSON schemas (the small subset understood by `llm_client.validate_json`)
+# for prompts whose responses are parsed as structured output.
+
+ANSWER_EVAL_SCHEMA = {
+    "type": "object",
+    "required": ["score", "reasoning", "strengths", "weaknesses"],
+    "properties": {
+        "score": {"type": "integer", "minimum": 0, "maximum": 2},
+        "reasoning": {"type": "string"},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "weaknesses": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+ROLE_EXTRACTION_SCHEMA = {
+    "type": "object",
+    "required": ["roles"],
+    "properties": {
+        "roles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                    "rationale": {"type": "string"},
+                },
+            },
+        },
+    },
+}
+
+BATCH_ANSWER_EVAL_SCHEMA = {
+    "type": "object",
+    "required": ["evaluations"],
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "score", "reasoning", "strengths", "weaknesses"],
+                "properties": {
+                    "id": {"type": "string"},
+                    **ANSWER_EVAL_SCHEMA["properties"],
+                },
+            },
+        },
+    },
+}
@@ -1,4 +1,3 @@
-from .extractor import extract_roles_from_resume, DetectedRole
-
-__all__ = ["extract_roles_from_resume", "DetectedRole"]
+from .extractor import extract_roles_from_resume, async_extract_roles_from_resume, DetectedRole
 
+__all__ = ["extract_roles_from_resume", "async_extract_roles_from_resume", "DetectedRole"]
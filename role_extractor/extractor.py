@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from llm_client import llm_client
-from prompts import ROLE_EXTRACTION_SYSTEM_PROMPT
+from llm_client import PRIORITY_ROLE_EXTRACTION, StructuredOutputError, llm_client
+from prompts import ROLE_EXTRACTION_SCHEMA, ROLE_EXTRACTION_SYSTEM_PROMPT
 
 
 @dataclass
@@ -15,27 +14,13 @@ class DetectedRole:
     rationale: str
 
 
-def extract_roles_from_resume(resume_text: str, max_roles: int = 2) -> List[DetectedRole]:
-    """
-    Use an LLM to infer up to `max_roles` suitable technical roles from the resume text.
-    """
-    user_prompt = f"RESUME TEXT:\n\"\"\"\n{resume_text}\n\"\"\"\n\nReturn JSON only."
-    response = llm_client.chat(
-        system_prompt=ROLE_EXTRACTION_SYSTEM_PROMPT,
-        user_prompt=user_prompt,
-        max_tokens=512,
-    )
+def _build_role_prompt(resume_text: str) -> str:
+    return f"RESUME TEXT:\n\"\"\"\n{resume_text}\n\"\"\"\n\nReturn JSON only."
 
-    try:
-        # Some models may wrap JSON with extra text; try to extract the JSON object.
-        start = response.find("{")
-        end = response.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            data = json.loads(response[start : end + 1])
-        else:
-            data = json.loads(response)
-    except json.JSONDecodeError:
-        # Fallback: treat the whole response as a single low-confidence generic role
+
+def _roles_from_data(data: Optional[Dict[str, Any]], max_roles: int) -> List[DetectedRole]:
+    if data is None:
+        # Fallback: a single low-confidence generic role
         return [DetectedRole(name="General Technical Candidate", confidence=0.5, rationale="Fallback role due to parsing error.")]
 
     roles_data = data.get("roles", [])
@@ -57,3 +42,38 @@ def extract_roles_from_resume(resume_text: str, max_roles: int = 2) -> List[Dete
 
     return roles
 
+
+def extract_roles_from_resume(resume_text: str, max_roles: int = 2) -> List[DetectedRole]:
+    """
+    Use an LLM to infer up to `max_roles` suitable technical roles from the resume text.
+    """
+    try:
+        data: Optional[Dict[str, Any]] = llm_client.chat_json(
+            system_prompt=ROLE_EXTRACTION_SYSTEM_PROMPT,
+            user_prompt=_build_role_prompt(resume_text),
+            schema=ROLE_EXTRACTION_SCHEMA,
+            prompt_name="role_extraction",
+            max_tokens=512,
+            priority=PRIORITY_ROLE_EXTRACTION,
+        )
+    except StructuredOutputError:
+        data = None
+    return _roles_from_data(data, max_roles)
+
+
+async def async_extract_roles_from_resume(resume_text: str, max_roles: int = 2) -> List[DetectedRole]:
+    """
+    Async variant of `extract_roles_from_resume`.
+    """
+    try:
+        data: Optional[Dict[str, Any]] = await llm_client.async_chat_json(
+            system_prompt=ROLE_EXTRACTION_SYSTEM_PROMPT,
+            user_prompt=_build_role_prompt(resume_text),
+            schema=ROLE_EXTRACTION_SCHEMA,
+            prompt_name="role_extraction",
+            max_tokens=512,
+            priority=PRIORITY_ROLE_EXTRACTION,
+        )
+    except StructuredOutputError:
+        data = None
+    return _roles_from_data(data, max_roles)
@@ -0,0 +1,15 @@
+from .store import (
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    SessionNotFound,
+    SessionStore,
+    create_session_store,
+)
+
+__all__ = [
+    "SessionStore",
+    "SessionNotFound",
+    "InMemorySessionStore",
+    "SQLiteSessionStore",
+    "create_session_store",
+]
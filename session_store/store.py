@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SessionNotFound(KeyError):
+    """
+    Raised by `SessionStore.update` when the session is missing or expired.
+    """
+
+SessionEncoder = Callable[[Any], Dict[str, Any]]
+SessionDecoder = Callable[[Dict[str, Any]], Any]
+
+
+class SessionStore(ABC):
+    """
+    Storage for interview session state with idle-TTL and size-based eviction.
+
+    Mutations go through `update`, which applies them atomically with
+    respect to other updates of the same session, in this process and (for
+    SQLite) in other workers. `put` stores a new session.
+    """
+
+    def __init__(self, ttl_seconds: float, max_sessions: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._evictions_ttl = 0
+        self._evictions_lru = 0
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def put(self, session_id: str, state: Any) -> None:
+        ...
+
+    @abstractmethod
+    def update(self, session_id: str, mutate: Callable[[Any], T]) -> T:
+        """
+        Load the session, apply `mutate` and store the result as one atomic
+        step. Raises SessionNotFound if the session does not exist or has expired.
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    def reap(self) -> int:
+        """
+        Drop sessions idle for longer than the TTL. Returns how many were removed.
+        """
+
+    @abstractmethod
+    def stats(self) -> Dict[str, object]:
+        ...
+
+    def _expired(self, last_access: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and (now - last_access) > self.ttl_seconds
+
+    def start_reaper(self, interval_seconds: float) -> None:
+        if self._reaper is not None or interval_seconds <= 0:
+            return
+        self._reaper_stop.clear()
+
+        def _run() -> None:
+            while not self._reaper_stop.wait(interval_seconds):
+                try:
+                    self.reap()
+                except Exception:
+                    pass
+
+        self._reaper = threading.Thread(target=_run, name="session-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop_reaper(self) -> None:
+        self._reaper_stop.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=5)
+        self._reaper = None
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local LRU + TTL store holding live session objects.
+
+    The approximate size of a session is measured when it is stored and
+    then re-measured every `resize_every` updates, not on every write.
+    """
+
+    resize_every = 16
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_sessions: int,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        super().__init__(ttl_seconds, max_sessions)
+        self._sizeof = sizeof
+        # session_id -> (state, last_access, approx_bytes), oldest first.
+        self._items: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        # Updates since each session's size was last measured.
+        self._unmeasured: Dict[str, int] = {}
+        # Updates of one session are serialized; different sessions run in parallel.
+        self._update_locks = [threading.Lock() for _ in range(64)]
+
+    def get(self, session_id: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._items.get(session_id)
+            if entry is None:
+                return None
+            state, last_access, size = entry
+            if self._expired(last_access, now):
+                self._remove(session_id)
+                self._evictions_ttl += 1
+                return None
+            self._items[session_id] = (state, now, size)
+            self._items.move_to_end(session_id)
+            return state
+
+    def _measure(self, state: Any) -> int:
+        if self._sizeof is None:
+            return 0
+        try:
+            return int(self._sizeof(state))
+        except Exception:
+            return 0
+
+    def put(self, session_id: str, state: Any) -> None:
+        size = self._measure(state)
+        with self._lock:
+            if session_id in self._items:
+                self._remove(session_id)
+            self._items[session_id] = (state, time.time(), size)
+            self._unmeasured[session_id] = 0
+            self._bytes += size
+            while self.max_sessions > 0 and len(self._items) > self.max_sessions:
+                oldest = next(iter(self._items))
+                self._remove(oldest)
+                self._evictions_lru += 1
+
+    def update(self, session_id: str, mutate: Callable[[Any], T]) -> T:
+        with self._update_locks[hash(session_id) % len(self._update_locks)]:
+            state = self.get(session_id)
+            if state is None:
+                raise SessionNotFound(session_id)
+            result = mutate(state)
+            with self._lock:
+                pending = self._unmeasured.get(session_id, 0) + 1
+                remeasure = pending >= self.resize_every
+                self._unmeasured[session_id] = 0 if remeasure else pending
+            if remeasure:
+                size = self._measure(state)
+                with self._lock:
+                    entry = self._items.get(session_id)
+                    if entry is not None and entry[0] is state:
+                        self._bytes += size - entry[2]
+                        self._items[session_id] = (state, entry[1], size)
+            return result
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id not in self._items:
+                return False
+            self._remove(session_id)
+            return True
+
+    def _remove(self, session_id: str) -> None:
+        _, _, size = self._items.pop(session_id)
+        self._unmeasured.pop(session_id, None)
+        self._bytes -= size
+
+    def reap(self) -> int:
+        now = time.time()
+        removed = 0
+        with self._lock:
+            # Entries are in access order, so stop at the first live one.
+            for session_id, (_, last_access, _) in list(self._items.items()):
+                if not self._expired(last_access, now):
+                    break
+                self._remove(session_id)
+                removed += 1
+            self._evictions_ttl += removed
+        return removed
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "sessions": len(self._items),
+                "approx_bytes": self._bytes,
+                "evictions_ttl": self._evictions_ttl,
+                "evictions_lru": self._evictions_lru,
+            }
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite-backed store so several uvicorn workers can serve the same session.
+    State is serialized with `encode` on `put` and rebuilt with `decode` on `get`.
+    `update` reads, mutates and writes inside one `BEGIN IMMEDIATE`
+    transaction, so concurrent updates from different workers never
+    overwrite each other. `get` is read-only and never waits on that lock;
+    the last-access time (TTL and LRU order) is refreshed by writes, and
+    expired rows are deleted by the reaper.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        max_sessions: int,
+        encode: SessionEncoder,
+        decode: SessionDecoder,
+    ) -> None:
+        super().__init__(ttl_seconds, max_sessions)
+        self.path = path
+        self._encode = encode
+        self._decode = decode
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, payload TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, session_id: str) -> Optional[Any]:
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT payload, updated_at FROM sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        payload, updated_at = row
+        if self._expired(updated_at, now):
+            return None
+        return self._decode(json.loads(payload))
+
+    def _write(self, conn: sqlite3.Connection, session_id: str, state: Any) -> None:
+        payload = json.dumps(self._encode(state), separators=(",", ":"))
+        conn.execute(
+            "INSERT INTO sessions (session_id, payload, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET payload = excluded.payload, updated_at = excluded.updated_at",
+            (session_id, payload, time.time()),
+        )
+        if self.max_sessions > 0:
+            cur = conn.execute(
+                "DELETE FROM sessions WHERE session_id IN ("
+                "SELECT session_id FROM sessions ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_sessions,),
+            )
+            if cur.rowcount > 0:
+                with self._lock:
+                    self._evictions_lru += cur.rowcount
+
+    def put(self, session_id: str, state: Any) -> None:
+        conn = self._conn()
+        with conn:
+            self._write(conn, session_id, state)
+
+    def update(self, session_id: str, mutate: Callable[[Any], T]) -> T:
+        conn = self._conn()
+        # Take the write lock before reading so no other worker can commit
+        # a newer version of this session in between.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT payload, updated_at FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None or self._expired(row[1], time.time()):
+                raise SessionNotFound(session_id)
+            state = self._decode(json.loads(row[0]))
+            result = mutate(state)
+            self._write(conn, session_id, state)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return result
+
+    def delete(self, session_id: str) -> bool:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        return cur.rowcount > 0
+
+    def reap(self) -> int:
+        if self.ttl_seconds <= 0:
+            return 0
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        removed = max(cur.rowcount, 0)
+        with self._lock:
+            self._evictions_ttl += removed
+        return removed
+
+    def stats(self) -> Dict[str, object]:
+        conn = self._conn()
+        count, payload_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM sessions"
+        ).fetchone()
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        with self._lock:
+            return {
+                "backend": "sqlite",
+                "sessions": int(count),
+                "approx_bytes": int(payload_bytes),
+                "file_bytes": int(page_count) * int(page_size),
+                "evictions_ttl": self._evictions_ttl,
+                "evictions_lru": self._evictions_lru,
+            }
+
+
+def create_session_store(
+    backend: str,
+    ttl_seconds: float,
+    max_sessions: int,
+    encode: SessionEncoder,
+    decode: SessionDecoder,
+    sqlite_path: str,
+) -> SessionStore:
+    """
+    Build the configured backend ("memory" or "sqlite").
+    """
+    backend = backend.strip().lower()
+    if backend == "sqlite":
+        return SQLiteSessionStore(
+            path=sqlite_path,
+            ttl_seconds=ttl_seconds,
+            max_sessions=max_sessions,
+            encode=encode,
+            decode=decode,
+        )
+    if backend == "memory":
+        return InMemorySessionStore(
+            ttl_seconds=ttl_seconds,
+            max_sessions=max_sessions,
+            sizeof=lambda state: len(json.dumps(encode(state), separators=(",", ":"))),
+        )
+    raise ValueError(f"Unknown session backend: {backend!r}")
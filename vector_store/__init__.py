@@ -1,4 +1,18 @@
-from .store import InterviewVectorStore, QuestionRecord
+from typing import TYPE_CHECKING, Any
+
+from .records import QuestionRecord
+
+if TYPE_CHECKING:
+    from .store import InterviewVectorStore
 
 __all__ = ["InterviewVectorStore", "QuestionRecord"]
 
+
+def __getattr__(name: str) -> Any:
+    # The store pulls in Chroma and sentence-transformers; import it on first
+    # use so ingestion worker processes only load what PDF extraction needs.
+    if name == "InterviewVectorStore":
+        from .store import InterviewVectorStore
+
+        return InterviewVectorStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class AnswerEmbeddingMatrix:
+    """
+    Ideal-answer embeddings held as one L2-normalized float32 matrix with an
+    id -> row index, so cosine similarity is a single dot product.
+
+    Rows are appended in place (capacity doubles as needed) and overwritten
+    on upsert; nothing is ever removed except through `remove`, which frees
+    the row for reuse.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.ndarray] = None
+        self._size = 0
+        self._index: Dict[str, int] = {}
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self._index
+
+    def _reserve(self, dim: int, rows: int) -> None:
+        if self._matrix is None:
+            self._matrix = np.zeros((max(rows, 16), dim), dtype=np.float32)
+            return
+        if self._matrix.shape[1] != dim:
+            raise ValueError(f"embedding dimension changed from {self._matrix.shape[1]} to {dim}")
+        needed = self._size + rows
+        if needed > self._matrix.shape[0]:
+            grown = np.zeros((max(needed, 2 * self._matrix.shape[0]), dim), dtype=np.float32)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        if not ids:
+            return
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1))
+        with self._lock:
+            self._reserve(vectors.shape[1], len(ids))
+            assert self._matrix is not None
+            for question_id, vector in zip(ids, vectors):
+                row = self._index.get(question_id)
+                if row is None:
+                    if self._free:
+                        row = self._free.pop()
+                    else:
+                        row = self._size
+                        self._size += 1
+                    self._index[question_id] = row
+                self._matrix[row] = vector
+
+    def remove(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            for question_id in ids:
+                row = self._index.pop(question_id, None)
+                if row is not None and self._matrix is not None:
+                    self._matrix[row] = 0.0
+                    self._free.append(row)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix = None
+            self._size = 0
+            self._index.clear()
+            self._free.clear()
+
+    def similarity(self, question_id: str, embedding: Sequence[float]) -> Optional[float]:
+        """
+        Cosine similarity between the stored ideal answer and `embedding`, or
+        None when the id is not loaded.
+        """
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        with self._lock:
+            row = self._index.get(question_id)
+            if row is None or self._matrix is None:
+                return None
+            ideal = self._matrix[row]
+        if norm == 0.0:
+            return 0.0
+        return float(ideal @ vector) / norm
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+from metrics import percentile
+
+# Upper bounds of the batch-size histogram buckets (texts per encode call).
+_BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def _bucket(size: int) -> str:
+    for bound in _BATCH_BUCKETS:
+        if size <= bound:
+            return f"<={bound}"
+    return f">{_BATCH_BUCKETS[-1]}"
+
+
+class _Request:
+    def __init__(self, texts: List[str]) -> None:
+        self.texts = texts
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent `encode` calls into shared forward passes.
+
+    A dispatcher thread takes the oldest waiting request, keeps collecting
+    requests for up to `window_seconds` or until `max_batch` texts are
+    gathered, runs one `encode` for all of them and hands each caller its
+    rows. A request larger than `max_batch` runs as its own batch.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        max_batch: int = 32,
+        window_seconds: float = 0.005,
+        history: int = 1000,
+    ) -> None:
+        self._encode = encode
+        self.max_batch = max(1, max_batch)
+        self.window_seconds = max(0.0, window_seconds)
+        self._cond = threading.Condition()
+        self._queue: Deque[_Request] = deque()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._batches = 0
+        self._requests = 0
+        self._texts = 0
+        self._sizes: Counter = Counter()
+        # Time each request spent waiting for its batch to start.
+        self._waits: Deque[float] = deque(maxlen=history)
+        self._encode_seconds: Deque[float] = deque(maxlen=history)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        request = _Request(list(texts))
+        with self._cond:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch_loop, name="embedding-batcher", daemon=True)
+                self._dispatcher.start()
+            self._queue.append(request)
+            self._cond.notify()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        assert request.result is not None
+        return request.result
+
+    def _collect(self) -> List[_Request]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+            batch = [self._queue.popleft()]
+            size = len(batch[0].texts)
+            deadline = batch[0].enqueued_at + self.window_seconds
+            while size < self.max_batch:
+                if self._queue:
+                    if size + len(self._queue[0].texts) > self.max_batch:
+                        break
+                    request = self._queue.popleft()
+                    batch.append(request)
+                    size += len(request.texts)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return batch
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            batch = self._collect()
+            texts = [text for request in batch for text in request.texts]
+            started = time.monotonic()
+            try:
+                vectors = self._encode(texts)
+                error: Optional[BaseException] = None
+            except BaseException as exc:  # noqa: BLE001 - handed to every caller
+                vectors, error = None, exc
+            elapsed = time.monotonic() - started
+
+            offset = 0
+            for request in batch:
+                if error is not None:
+                    request.error = error
+                else:
+                    assert vectors is not None
+                    request.result = vectors[offset : offset + len(request.texts)]
+                offset += len(request.texts)
+                request.done.set()
+
+            with self._cond:
+                self._batches += 1
+                self._requests += len(batch)
+                self._texts += len(texts)
+                self._sizes[_bucket(len(texts))] += 1
+                self._waits.extend(started - request.enqueued_at for request in batch)
+                self._encode_seconds.append(elapsed)
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            waits = list(self._waits)
+            encodes = list(self._encode_seconds)
+            return {
+                "max_batch": self.max_batch,
+                "window_ms": round(self.window_seconds * 1000, 3),
+                "queued": len(self._queue),
+                "batches": self._batches,
+                "requests": self._requests,
+                "texts": self._texts,
+                "mean_batch_size": round(self._texts / self._batches, 2) if self._batches else 0.0,
+                "batch_size_histogram": {
+                    label: self._sizes[label]
+                    for label in [f"<={b}" for b in _BATCH_BUCKETS] + [f">{_BATCH_BUCKETS[-1]}"]
+                },
+                "added_latency_ms": {
+                    "p50": round(percentile(waits, 50) * 1000, 3),
+                    "p95": round(percentile(waits, 95) * 1000, 3),
+                    "max": round(max(waits) * 1000, 3) if waits else 0.0,
+                },
+                "encode_ms": {
+                    "p50": round(percentile(encodes, 50) * 1000, 3),
+                    "p95": round(percentile(encodes, 95) * 1000, 3),
+                },
+            }
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from .store import InterviewVectorStore
+
+
+def _legacy_similarity(store: InterviewVectorStore, question_id: str, cand_embedding: List[float]) -> float:
+    """
+    The previous scoring path: one Chroma lookup plus a pure-Python cosine.
+    """
+    stored = store._answer_collection.get(ids=[question_id], include=["embeddings"])
+    ideal_embedding = list(stored["embeddings"][0])
+    dot = sum(a * b for a, b in zip(ideal_embedding, cand_embedding))
+    norm_a = sum(a * a for a in ideal_embedding) ** 0.5
+    norm_b = sum(b * b for b in cand_embedding) ** 0.5
+    return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+
+
+def _time(label: str, iterations: int, fn: Callable[[int], float]) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    elapsed = time.perf_counter() - started
+    per_call_us = elapsed / iterations * 1e6
+    print(f"{label:<10} {iterations:>10} {elapsed:>10.3f} {per_call_us:>12.1f}")
+    return per_call_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ideal-answer similarity via Chroma lookups against the in-memory matrix."
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    store = InterviewVectorStore()
+    store.warmup()
+    ids = list(store._answer_collection.get(include=[]).get("ids", []))
+    if not ids:
+        print("The answer collection is empty; run `python -m vector_store.init_vector_store` first.")
+        return
+
+    # Scoring cost only: the candidate is embedded once, as both paths embed it identically.
+    cand_embedding = store._embed(["A candidate answer about caching, indexing and trade-offs."])[0]
+    order = [random.choice(ids) for _ in range(args.iterations)]
+
+    print(f"{len(ids)} ideal answers, embedding dim {len(cand_embedding)}\n")
+    print(f"{'path':<10} {'calls':>10} {'seconds':>10} {'us/call':>12}")
+    legacy = _time("chroma", args.iterations, lambda i: _legacy_similarity(store, order[i], cand_embedding))
+    matrix = _time(
+        "matrix", args.iterations, lambda i: store._answer_matrix.similarity(order[i], cand_embedding) or 0.0
+    )
+
+    drift = max(
+        abs(_legacy_similarity(store, qid, cand_embedding) - (store._answer_matrix.similarity(qid, cand_embedding) or 0.0))
+        for qid in ids
+    )
+    print(f"\nspeedup {legacy / matrix:.1f}x, max |similarity diff| {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from config import embedding_config
+
+from .embedders import BACKEND_ONNX, BACKEND_TORCH, build_embedder
+from .init_vector_store import build_builtin_sample_questions
+
+
+def _corpus() -> List[str]:
+    texts: List[str] = []
+    for q in build_builtin_sample_questions():
+        texts.extend([q.question, q.ideal_answer])
+    return texts
+
+
+def _throughput(embedder, texts: List[str], batch_size: int, rounds: int) -> float:
+    embedder.encode(texts[:batch_size])
+    started = time.perf_counter()
+    done = 0
+    for _ in range(rounds):
+        for i in range(0, len(texts), batch_size):
+            done += len(embedder.encode(texts[i : i + batch_size]))
+    return done / (time.perf_counter() - started)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare embedding backends: cosine drift against fp32 PyTorch and texts/second."
+    )
+    parser.add_argument("--model", default=embedding_config.model_name)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 32])
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    texts = _corpus()
+    backends = [
+        ("torch-fp32", build_embedder(BACKEND_TORCH, args.model)),
+        ("onnx-fp32", build_embedder(BACKEND_ONNX, args.model, int8=False)),
+        ("onnx-int8", build_embedder(BACKEND_ONNX, args.model, int8=True)),
+    ]
+    reference = _normalize(backends[0][1].encode(texts))
+    # Drift where it matters: ideal answer vs. question similarity for each pair.
+    ref_pairs = np.sum(reference[0::2] * reference[1::2], axis=1)
+
+    print(f"{len(texts)} texts, model {args.model}\n")
+    header = f"{'backend':<11} {'min cos':>8} {'mean cos':>9} {'max |dsim|':>11}"
+    header += "".join(f" {f'batch {b} t/s':>13}" for b in args.batch_sizes)
+    print(header)
+    for label, embedder in backends:
+        vectors = _normalize(embedder.encode(texts))
+        cosines = np.sum(vectors * reference, axis=1)
+        pairs = np.sum(vectors[0::2] * vectors[1::2], axis=1)
+        row = f"{label:<11} {cosines.min():>8.4f} {cosines.mean():>9.4f} {np.abs(pairs - ref_pairs).max():>11.4f}"
+        for batch_size in args.batch_sizes:
+            row += f" {_throughput(embedder, texts, batch_size, args.rounds):>13.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional
+
+from .init_vector_store import ROLE_QUESTION_DIR, load_questions_from_role_pdfs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time role-PDF question extraction at several worker counts and check the results match."
+    )
+    parser.add_argument("--base-dir", default=ROLE_QUESTION_DIR)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    baseline: Optional[List[str]] = None
+    baseline_seconds = 0.0
+    print(f"{'workers':>7} {'questions':>9} {'seconds':>9} {'speedup':>8} {'identical':>9}")
+    for workers in args.workers:
+        started = time.perf_counter()
+        questions = load_questions_from_role_pdfs(args.base_dir, workers=workers)
+        elapsed = time.perf_counter() - started
+        ids = [q.id for q in questions]
+        if baseline is None:
+            baseline, baseline_seconds = ids, elapsed
+        print(
+            f"{workers:>7} {len(ids):>9} {elapsed:>9.2f} {baseline_seconds / elapsed:>7.2f}x "
+            f"{str(ids == baseline):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import embedding_config
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+
+_FP32_FILE = "model.onnx"
+_INT8_FILE = "model.int8.onnx"
+_META_FILE = "export.json"
+
+
+def embedding_key(
+    backend: str = embedding_config.backend,
+    model_name: str = embedding_config.model_name,
+    int8: bool = embedding_config.onnx_int8,
+) -> str:
+    """
+    Identifies the vectors a configuration produces, so stored embeddings
+    are refreshed when the backend changes.
+    """
+    if backend == BACKEND_ONNX:
+        return f"{model_name}:{BACKEND_ONNX}{'-int8' if int8 else ''}"
+    return model_name
+
+
+class TorchEmbedder:
+    """
+    The sentence-transformers model in fp32 PyTorch.
+    """
+
+    name = BACKEND_TORCH
+
+    def __init__(self, model_name: str, threads: int = 0) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        if threads > 0:
+            import torch
+
+            torch.set_num_threads(threads)
+        self.model = SentenceTransformer(model_name, device="cpu")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(
+            self.model.encode(texts, show_progress_bar=False, convert_to_numpy=True),
+            dtype=np.float32,
+        )
+
+
+def onnx_model_dir(model_name: str, cache_dir: str = embedding_config.onnx_cache_dir) -> str:
+    return os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]+", "__", model_name))
+
+
+def export_onnx(
+    model_name: str,
+    cache_dir: str = embedding_config.onnx_cache_dir,
+    quantize: bool = True,
+) -> str:
+    """
+    Export the transformer behind a sentence-transformers model to ONNX (and
+    a dynamically int8-quantized copy) together with its tokenizer. Needs
+    torch and onnxruntime; returns the export directory.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    out_dir = onnx_model_dir(model_name, cache_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    if len(st_model) < 2 or not getattr(st_model[1], "pooling_mode_mean_tokens", False):
+        raise ValueError(f"{model_name}: only mean-pooling models can be exported")
+    transformer = st_model[0]
+    auto_model = transformer.auto_model.eval()
+    tokenizer = transformer.tokenizer
+    tokenizer.save_pretrained(out_dir)
+
+    sample = tokenizer(["warmup text", "a second, longer warmup text"], padding=True, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes: Dict[str, Dict[int, str]] = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    fp32_path = os.path.join(out_dir, _FP32_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            auto_model,
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(fp32_path, os.path.join(out_dir, _INT8_FILE), weight_type=QuantType.QInt8)
+
+    with open(os.path.join(out_dir, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "model_name": model_name,
+                "max_seq_length": int(st_model.max_seq_length),
+                "input_names": input_names,
+                "int8": quantize,
+            },
+            f,
+            indent=1,
+        )
+    return out_dir
+
+
+class OnnxEmbedder:
+    """
+    The same model run with ONNX Runtime on CPU, optionally int8-quantized.
+    Mean pooling over the attention mask and L2 normalization reproduce the
+    sentence-transformers pipeline (cosine similarities are unchanged for
+    models without a Normalize step). The export is built on first use if
+    it is not cached yet.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        int8: bool = True,
+        threads: int = 0,
+        cache_dir: str = embedding_config.onnx_cache_dir,
+    ) -> None:
+        try:
+            import onnxruntime as ort
+            from transformers import AutoTokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "EMBEDDING_BACKEND=onnx needs onnxruntime and transformers (pip install onnxruntime)."
+            ) from exc
+
+        self.name = f"{BACKEND_ONNX}-int8" if int8 else BACKEND_ONNX
+        model_dir = onnx_model_dir(model_name, cache_dir)
+        model_path = os.path.join(model_dir, _INT8_FILE if int8 else _FP32_FILE)
+        if not os.path.exists(model_path):
+            export_onnx(model_name, cache_dir, quantize=int8)
+        with open(os.path.join(model_dir, _META_FILE), "r", encoding="utf-8") as f:
+            meta: Dict[str, Any] = json.load(f)
+
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        self._session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self._tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self._input_names = [i.name for i in self._session.get_inputs()]
+        self._max_length: Optional[int] = meta.get("max_seq_length")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        encoded = self._tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self._max_length,
+            return_tensors="np",
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self._input_names}
+        hidden = self._session.run(None, feeds)[0]
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+def build_embedder(
+    backend: str = embedding_config.backend,
+    model_name: str = embedding_config.model_name,
+    int8: bool = embedding_config.onnx_int8,
+    threads: int = embedding_config.threads,
+) -> Any:
+    """
+    Embedder for EMBEDDING_BACKEND; each exposes `name` and
+    `encode(texts) -> float32 array`.
+    """
+    if backend == BACKEND_ONNX:
+        return OnnxEmbedder(model_name, int8=int8, threads=threads)
+    return TorchEmbedder(model_name, threads=threads)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX for EMBEDDING_BACKEND=onnx.")
+    parser.add_argument("--model", default=embedding_config.model_name)
+    parser.add_argument("--cache-dir", default=embedding_config.onnx_cache_dir)
+    parser.add_argument("--no-int8", action="store_true", help="Skip the int8-quantized copy.")
+    args = parser.parse_args()
+    out_dir = export_onnx(args.model, args.cache_dir, quantize=not args.no_int8)
+    print(f"Exported {args.model} to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
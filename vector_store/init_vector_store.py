@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import argparse
 import hashlib
 import os
 import re
-from typing import List
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pdfplumber
+from config import vector_store_config
 
-from .store import InterviewVectorStore, QuestionRecord
+from .embedders import embedding_key
+from .manifest import IngestManifest, question_fingerprint
+from .pdf_text import extract_texts
+from .records import QuestionRecord
+
+if TYPE_CHECKING:
+    from .store import InterviewVectorStore
 
 ROLE_QUESTION_DIR = os.getenv("ROLE_QUESTION_DIR", "data/role_questions")
 SUPPORTED_EXTENSIONS = {".pdf"}
@@ -21,11 +30,6 @@ STOP_SECTION_PATTERN = re.compile(
 )
 
 
-def _extract_text_from_pdf(path: str) -> str:
-    with pdfplumber.open(path) as pdf:
-        return "\n".join((page.extract_text() or "") for page in pdf.pages)
-
-
 def _normalize_spaces(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
@@ -106,13 +110,12 @@ def _build_question_record(role: str, source_path: str, index: int, question: st
     )
 
 
-def load_questions_from_role_pdfs(base_dir: str = ROLE_QUESTION_DIR) -> List[QuestionRecord]:
-    questions: List[QuestionRecord] = []
-    seen_pairs: set[tuple[str, str]] = set()
-
+def _iter_role_pdfs(base_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    (path, role) for every supported file under `base_dir`, in walk order.
+    """
     if not os.path.isdir(base_dir):
-        return questions
-
+        return
     for root, _, files in os.walk(base_dir):
         for filename in files:
             ext = os.path.splitext(filename)[1].lower()
@@ -125,23 +128,56 @@ def load_questions_from_role_pdfs(base_dir: str = ROLE_QUESTION_DIR) -> List[Que
                 role = _format_role_name(os.path.basename(root))
             else:
                 role = _format_role_name(os.path.splitext(filename)[0])
+            yield path, role
 
-            try:
-                text = _extract_text_from_pdf(path)
-            except Exception:
-                continue
 
-            extracted = _extract_questions_from_text(text)
-            for idx, qtext in enumerate(extracted, start=1):
-                key = (role.lower(), qtext.lower())
-                if key in seen_pairs:
-                    continue
-                seen_pairs.add(key)
-                questions.append(_build_question_record(role, path, idx, qtext))
+def extract_pdf_questions(
+    paths: List[str],
+    workers: int = vector_store_config.ingest_workers,
+    pages_per_task: int = vector_store_config.ingest_pages_per_task,
+) -> Dict[str, Optional[List[str]]]:
+    """
+    Extracted questions per PDF (None if it could not be read). Page text is
+    extracted in parallel; questions are parsed from each file's full text.
+    """
+    texts = extract_texts(paths, workers, pages_per_task)
+    return {
+        path: _extract_questions_from_text(text) if text is not None else None
+        for path, text in texts.items()
+    }
+
 
+def _merge_pdf_questions(parsed: Iterable[Tuple[str, str, List[str]]]) -> List[QuestionRecord]:
+    """
+    Records for (path, role, extracted questions) in walk order; a question
+    already seen for the same role is skipped.
+    """
+    questions: List[QuestionRecord] = []
+    seen_pairs: set[tuple[str, str]] = set()
+    for path, role, extracted in parsed:
+        for idx, qtext in enumerate(extracted, start=1):
+            key = (role.lower(), qtext.lower())
+            if key in seen_pairs:
+                continue
+            seen_pairs.add(key)
+            questions.append(_build_question_record(role, path, idx, qtext))
     return questions
 
 
+def load_questions_from_role_pdfs(
+    base_dir: str = ROLE_QUESTION_DIR,
+    workers: int = vector_store_config.ingest_workers,
+) -> List[QuestionRecord]:
+    sources = list(_iter_role_pdfs(base_dir))
+    extracted = extract_pdf_questions([path for path, _ in sources], workers=workers)
+    parsed: List[Tuple[str, str, List[str]]] = []
+    for path, role in sources:
+        questions = extracted[path]
+        if questions is not None:
+            parsed.append((path, role, questions))
+    return _merge_pdf_questions(parsed)
+
+
 def build_builtin_sample_questions() -> List[QuestionRecord]:
     """
     Seed the vector store with a small but realistic set of questions
@@ -676,18 +712,140 @@ def build_sample_questions() -> List[QuestionRecord]:
     return pdf_questions + builtin_questions
 
 
+@dataclass
+class SyncReport:
+    parsed_sources: List[str] = field(default_factory=list)
+    cached_sources: int = 0
+    removed_sources: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    pdf_questions: int = 0
+    builtin_questions: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def sync_questions(
+    store: InterviewVectorStore,
+    base_dir: str = ROLE_QUESTION_DIR,
+    manifest_path: str = vector_store_config.manifest_path,
+    dry_run: bool = False,
+) -> SyncReport:
+    """
+    Bring the store in line with the role PDFs and built-in questions.
+
+    Only files whose mtime/size and content hash changed since the last run
+    are parsed, only questions whose fingerprint changed are embedded, and
+    questions whose source is gone are deleted. With `dry_run` nothing is
+    written; the report shows what would change.
+    """
+    report = SyncReport()
+    manifest = IngestManifest.load(manifest_path)
+
+    started = time.perf_counter()
+    sources = list(_iter_role_pdfs(base_dir))
+    seen_paths = {path for path, _ in sources}
+    known: Dict[str, List[str]] = {}
+    for path, _ in sources:
+        cached = manifest.cached_questions(path)
+        if cached is not None:
+            known[path] = cached
+            report.cached_sources += 1
+    fresh = extract_pdf_questions([path for path, _ in sources if path not in known])
+    for path, extracted in fresh.items():
+        if extracted is None:
+            # Unreadable now: keep what was ingested from it before, if anything.
+            previous = manifest.sources.get(path)
+            if previous is not None:
+                known[path] = previous.questions
+            continue
+        manifest.remember(path, extracted)
+        known[path] = extracted
+        report.parsed_sources.append(path)
+    # Merge in walk order so ids and de-duplication match a serial run.
+    parsed = [(path, role, known[path]) for path, role in sources if path in known]
+    report.removed_sources = [path for path in manifest.sources if path not in seen_paths]
+    for path in report.removed_sources:
+        del manifest.sources[path]
+    report.timings["parse"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pdf_questions = _merge_pdf_questions(parsed)
+    builtin_questions = build_builtin_sample_questions()
+    report.pdf_questions, report.builtin_questions = len(pdf_questions), len(builtin_questions)
+    desired = {q.id: q for q in pdf_questions + builtin_questions}
+    model_key = embedding_key()
+    fingerprints = {qid: question_fingerprint(q, model_key) for qid, q in desired.items()}
+    # An empty store (e.g. a deleted database) means nothing was ingested.
+    previous = manifest.ingested if store.count() > 0 else {}
+    for qid, fingerprint in fingerprints.items():
+        if qid not in previous:
+            report.added.append(qid)
+        elif previous[qid] != fingerprint:
+            report.updated.append(qid)
+        else:
+            report.unchanged += 1
+    report.deleted = [qid for qid in previous if qid not in desired]
+    report.timings["diff"] = time.perf_counter() - started
+
+    if dry_run:
+        return report
+
+    started = time.perf_counter()
+    changed = [desired[qid] for qid in report.added + report.updated]
+    if changed:
+        store.add_questions(changed)
+    report.timings["embed"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    store.delete_questions(report.deleted)
+    report.timings["delete"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    manifest.ingested = fingerprints
+    manifest.save(manifest_path)
+    report.timings["manifest"] = time.perf_counter() - started
+    return report
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Incrementally ingest role PDFs and built-in questions.")
+    parser.add_argument("--base-dir", default=ROLE_QUESTION_DIR)
+    parser.add_argument("--manifest", default=vector_store_config.manifest_path)
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing.")
+    args = parser.parse_args()
+
+    from .store import InterviewVectorStore
+
     os.makedirs("vector_store", exist_ok=True)
     store = InterviewVectorStore()
-    pdf_questions = load_questions_from_role_pdfs()
-    builtin_questions = build_builtin_sample_questions()
-    questions = pdf_questions + builtin_questions
-    store.add_questions(questions)
+    report = sync_questions(store, base_dir=args.base_dir, manifest_path=args.manifest, dry_run=args.dry_run)
+
+    prefix = "Would ingest" if args.dry_run else "Ingested"
+    print(
+        f"{prefix} {report.pdf_questions + report.builtin_questions} questions "
+        f"({report.pdf_questions} from {args.base_dir}, {report.builtin_questions} built-in)."
+    )
+    print(
+        f"Sources: {len(report.parsed_sources)} parsed, {report.cached_sources} unchanged, "
+        f"{len(report.removed_sources)} removed."
+    )
     print(
-        "Seeded vector store with "
-        f"{len(questions)} questions "
-        f"({len(pdf_questions)} from {ROLE_QUESTION_DIR}, {len(builtin_questions)} built-in)."
+        f"Questions: {len(report.added)} added, {len(report.updated)} updated, "
+        f"{len(report.deleted)} deleted, {report.unchanged} unchanged."
     )
+    if args.dry_run:
+        for label, items in (
+            ("parse", report.parsed_sources),
+            ("remove source", report.removed_sources),
+            ("add", report.added),
+            ("update", report.updated),
+            ("delete", report.deleted),
+        ):
+            for item in items:
+                print(f"  {label}: {item}")
+    print("Timings: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in report.timings.items()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .records import QuestionRecord
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def question_fingerprint(record: QuestionRecord, model_name: str) -> str:
+    """
+    Hash of everything that goes into a question's stored documents, metadata
+    and embeddings; a question is re-embedded only when this changes.
+    """
+    payload = json.dumps(
+        [
+            model_name,
+            record.question,
+            record.role,
+            record.difficulty,
+            record.ideal_answer,
+            list(record.expected_concepts),
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SourceEntry:
+    mtime: float
+    size: int
+    sha256: str
+    # Question texts extracted from the file, in extraction order.
+    questions: List[str]
+
+
+@dataclass
+class IngestManifest:
+    """
+    What the last ingestion run saw and wrote: each source PDF's stat and
+    content hash with its extracted questions (so unchanged files are not
+    re-parsed), and the fingerprint of every question in the store.
+    """
+
+    sources: Dict[str, SourceEntry] = field(default_factory=dict)
+    ingested: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "IngestManifest":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cls()
+        if data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(
+            sources={key: SourceEntry(**entry) for key, entry in data.get("sources", {}).items()},
+            ingested=dict(data.get("ingested", {})),
+        )
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        payload = {
+            "version": MANIFEST_VERSION,
+            "sources": {key: vars(entry) for key, entry in sorted(self.sources.items())},
+            "ingested": dict(sorted(self.ingested.items())),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    def cached_questions(self, path: str) -> Optional[List[str]]:
+        """
+        Extracted questions for `path` if the file is unchanged since it was
+        parsed: same mtime and size, or failing that the same content hash.
+        """
+        entry = self.sources.get(path)
+        if entry is None:
+            return None
+        stat = os.stat(path)
+        if stat.st_mtime == entry.mtime and stat.st_size == entry.size:
+            return entry.questions
+        if file_sha256(path) == entry.sha256:
+            entry.mtime, entry.size = stat.st_mtime, stat.st_size
+            return entry.questions
+        return None
+
+    def remember(self, path: str, questions: List[str]) -> None:
+        stat = os.stat(path)
+        self.sources[path] = SourceEntry(
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            sha256=file_sha256(path),
+            questions=list(questions),
+        )
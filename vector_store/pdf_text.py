@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pdfplumber
+
+# Kept free of the store's imports (Chroma, sentence-transformers) so that
+# spawned extraction workers start quickly.
+
+
+def page_count(path: str) -> int:
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(path: str, start: int, end: int) -> str:
+    with pdfplumber.open(path) as pdf:
+        return "\n".join((page.extract_text() or "") for page in pdf.pages[start:end])
+
+
+def extract_text(path: str) -> str:
+    with pdfplumber.open(path) as pdf:
+        return "\n".join((page.extract_text() or "") for page in pdf.pages)
+
+
+def _page_ranges(pages: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    step = max(1, pages_per_task)
+    return [(start, min(start + step, pages)) for start in range(0, max(pages, 1), step)]
+
+
+def extract_texts(paths: Sequence[str], workers: int, pages_per_task: int) -> Dict[str, Optional[str]]:
+    """
+    Full text of each PDF (None if it could not be read). With more than one
+    worker, files are split into `pages_per_task` page ranges and extracted
+    on a process pool; the ranges are joined back in page order, so the text
+    is identical to a serial `extract_text`.
+    """
+    workers = workers or min(8, os.cpu_count() or 1)
+    if workers > 1 and paths:
+        try:
+            return _extract_texts_parallel(paths, workers, pages_per_task)
+        except BrokenProcessPool:
+            pass
+    texts: Dict[str, Optional[str]] = {}
+    for path in paths:
+        try:
+            texts[path] = extract_text(path)
+        except Exception:
+            texts[path] = None
+    return texts
+
+
+def _extract_texts_parallel(paths: Sequence[str], workers: int, pages_per_task: int) -> Dict[str, Optional[str]]:
+    texts: Dict[str, Optional[str]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        counts = {path: executor.submit(page_count, path) for path in paths}
+        parts: Dict[str, List[Future]] = {}
+        for path in paths:
+            try:
+                pages = counts[path].result()
+            except BrokenProcessPool:
+                raise
+            except Exception:
+                texts[path] = None
+                continue
+            parts[path] = [
+                executor.submit(extract_page_range, path, start, end)
+                for start, end in _page_ranges(pages, pages_per_task)
+            ]
+        for path, futures in parts.items():
+            try:
+                texts[path] = "\n".join(f.result() for f in futures)
+            except BrokenProcessPool:
+                raise
+            except Exception:
+                texts[path] = None
+    return {path: texts[path] for path in paths}
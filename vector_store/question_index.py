@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Collection, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .records import QuestionRecord
+
+
+def _sample_excluding(
+    pool: List[QuestionRecord],
+    n: int,
+    exclude_ids: Collection[str],
+    rng: random.Random,
+) -> List[QuestionRecord]:
+    """
+    Up to `n` distinct records from `pool` in random order, skipping excluded
+    ids. A lazy Fisher-Yates shuffle (only touched positions are stored)
+    makes this O(n + skipped) rather than O(len(pool)).
+    """
+    picked: List[QuestionRecord] = []
+    swapped: Dict[int, int] = {}
+    size = len(pool)
+    for i in range(size):
+        if len(picked) >= n:
+            break
+        j = rng.randrange(i, size)
+        chosen = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        record = pool[chosen]
+        if record.id not in exclude_ids:
+            picked.append(record)
+    return picked
+
+
+class QuestionIndex:
+    """
+    Read-only snapshot of the question collection: parsed records per role,
+    and per role and difficulty. Built once; the store drops and rebuilds it
+    whenever it writes to the collection.
+    """
+
+    def __init__(self, records: Iterable[QuestionRecord], rng: Optional[random.Random] = None) -> None:
+        self._rng = rng or random.Random()
+        self._by_role: Dict[str, List[QuestionRecord]] = {}
+        self._by_difficulty: Dict[str, Dict[str, List[QuestionRecord]]] = {}
+        for record in records:
+            self._by_role.setdefault(record.role, []).append(record)
+            self._by_difficulty.setdefault(record.role, {}).setdefault(record.difficulty, []).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(pool) for pool in self._by_role.values())
+
+    def roles(self) -> List[str]:
+        return list(self._by_role)
+
+    def difficulties(self, role: str) -> Dict[str, int]:
+        return {d: len(pool) for d, pool in self._by_difficulty.get(role, {}).items()}
+
+    def sample(
+        self,
+        role: str,
+        n: int,
+        exclude_ids: Optional[Collection[str]] = None,
+        difficulty: Optional[str] = None,
+    ) -> List[QuestionRecord]:
+        """
+        Up to `n` random questions for `role` (optionally one difficulty),
+        without replacement and skipping `exclude_ids`.
+        """
+        if difficulty is None:
+            pool = self._by_role.get(role, [])
+        else:
+            pool = self._by_difficulty.get(role, {}).get(difficulty, [])
+        excluded = exclude_ids if isinstance(exclude_ids, (set, frozenset)) else set(exclude_ids or ())
+        return _sample_excluding(pool, n, excluded, self._rng)
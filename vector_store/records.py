@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class QuestionRecord:
+    id: str
+    question: str
+    role: str
+    difficulty: str
+    ideal_answer: str
+    expected_concepts: List[str]
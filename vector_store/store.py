@@ -1,36 +1,50 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 import json
-import random
+import os
+import threading
+import time
 
 import chromadb
 from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from config import embedding_config, vector_store_config
 
+from .answer_matrix import AnswerEmbeddingMatrix
+from .batcher import EmbeddingBatcher
+from .embedders import build_embedder
+from .question_index import QuestionIndex
+from .records import QuestionRecord
 
-@dataclass
-class QuestionRecord:
-    id: str
-    question: str
-    role: str
-    difficulty: str
-    ideal_answer: str
-    expected_concepts: List[str]
+
+def _parse_concepts(raw_concepts: Any) -> List[str]:
+    # Chroma metadata stores the list as a JSON string.
+    if isinstance(raw_concepts, str):
+        try:
+            return json.loads(raw_concepts)
+        except json.JSONDecodeError:
+            return [raw_concepts]
+    return list(raw_concepts)
 
 
 class InterviewVectorStore:
     """
-    Thin wrapper around Chroma with sentence-transformer embeddings.
+    Thin wrapper around Chroma with sentence-transformer embeddings
+    (PyTorch or ONNX Runtime, see `embedders`).
     Stores interview questions with role-based metadata and supports
     similarity search with metadata filtering.
+
+    A single instance is meant to be shared across sessions; embedding and
+    collection writes are serialized so concurrent requests are safe.
     """
 
     def __init__(self) -> None:
+        # Fast tokenizers are not re-entrant and Chroma upserts should not
+        # interleave, so guard both behind one lock.
+        self._lock = threading.RLock()
         self._client = chromadb.Client(
             Settings(
                 persist_directory=vector_store_config.persist_directory,
@@ -45,11 +59,54 @@ class InterviewVectorStore:
             name=f"{vector_store_config.collection_name}_answers",
             metadata={"hnsw:space": "cosine"},
         )
-        self._embedder = SentenceTransformer(embedding_config.model_name)
+        self._embedder = build_embedder()
+        # Concurrent single-text encodes (answer scoring, question queries)
+        # share forward passes; the batcher's thread is the only encoder.
+        self._batcher: Optional[EmbeddingBatcher] = None
+        if embedding_config.batch_max_size > 1:
+            self._batcher = EmbeddingBatcher(
+                self._embedder.encode,
+                max_batch=embedding_config.batch_max_size,
+                window_seconds=embedding_config.batch_window_ms / 1000.0,
+            )
+        # Ideal-answer embeddings for scoring, loaded from the answer
+        # collection on first use and kept in sync by add_questions.
+        self._answer_matrix = AnswerEmbeddingMatrix()
+        self._answer_matrix_loaded = False
+        # Parsed questions by role/difficulty for random draws; None until
+        # first use and after any write to the question collection. Writes
+        # from other processes are noticed through `_collection_stamp`,
+        # checked at most every `index_check_seconds`.
+        self._question_index: Optional[QuestionIndex] = None
+        self._question_index_stamp: Optional[tuple] = None
+        self._question_index_checked_at = 0.0
         self.ensure_answer_collection()
 
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._batcher is not None:
+            return self._batcher.encode(texts)
+        with self._lock:
+            return self._embedder.encode(texts)
+
     def _embed(self, texts: List[str]) -> List[List[float]]:
-        return self._embedder.encode(texts, show_progress_bar=False).tolist()
+        return self._encode(texts).tolist()
+
+    def embedding_stats(self) -> Dict[str, object]:
+        return {
+            "backend": self._embedder.name,
+            "batching": self._batcher.stats() if self._batcher is not None else None,
+        }
+
+    def warmup(self) -> None:
+        """
+        Seed/backfill the collections and run one embedding pass so model
+        weights are loaded before the first interview arrives.
+        """
+        self.seed_if_empty()
+        self.ensure_answer_collection()
+        self._load_answer_matrix()
+        self._get_question_index()
+        self._embed(["Technical interview question warmup"])
 
     def add_questions(self, questions: List[QuestionRecord]) -> None:
         ids = [q.id for q in questions]
@@ -76,25 +133,97 @@ class InterviewVectorStore:
                 }
             )
             answer_documents.append(q.ideal_answer)
-        embeddings = self._embed(documents)
-        self._collection.upsert(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas,
-            embeddings=embeddings,
-        )
-        answer_embeddings = self._embed(answer_documents)
-        self._answer_collection.upsert(
-            ids=ids,
-            documents=answer_documents,
-            metadatas=answer_metadatas,
-            embeddings=answer_embeddings,
-        )
+        with self._lock:
+            embeddings = self._embed(documents)
+            self._collection.upsert(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings,
+            )
+            self._question_index = None
+            answer_embeddings = self._embed(answer_documents)
+            self._answer_collection.upsert(
+                ids=ids,
+                documents=answer_documents,
+                metadatas=answer_metadatas,
+                embeddings=answer_embeddings,
+            )
+            if self._answer_matrix_loaded:
+                self._answer_matrix.upsert(ids, answer_embeddings)
+
+    def delete_questions(self, ids: List[str]) -> None:
+        """
+        Remove questions (and their ideal answers) by id.
+        """
+        if not ids:
+            return
+        with self._lock:
+            self._collection.delete(ids=list(ids))
+            self._answer_collection.delete(ids=list(ids))
+            self._answer_matrix.remove(ids)
+            self._question_index = None
+
+    def _load_answer_matrix(self) -> None:
+        with self._lock:
+            if self._answer_matrix_loaded:
+                return
+            data = self._answer_collection.get(include=["embeddings"])
+            ids = list(data.get("ids", [])) if data else []
+            embeddings = data.get("embeddings") if data else None
+            if ids and embeddings is not None and len(embeddings):
+                self._answer_matrix.upsert(ids, embeddings)
+            self._answer_matrix_loaded = True
+
+    def _collection_stamp(self) -> tuple:
+        """
+        Cheap fingerprint of the question collection: its size and the mtime
+        of the ingestion manifest that `sync_questions` rewrites on every run.
+        """
+        try:
+            manifest_mtime = os.stat(vector_store_config.manifest_path).st_mtime_ns
+        except OSError:
+            manifest_mtime = 0
+        return (self.count(), manifest_mtime)
+
+    def _get_question_index(self) -> QuestionIndex:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._question_index is not None
+                and now - self._question_index_checked_at >= vector_store_config.index_check_seconds
+            ):
+                self._question_index_checked_at = now
+                if self._collection_stamp() != self._question_index_stamp:
+                    self._question_index = None
+            if self._question_index is None:
+                self._question_index_stamp = self._collection_stamp()
+                self._question_index_checked_at = now
+                data = self._collection.get(include=["documents", "metadatas"])
+                ids = list(data.get("ids", []))
+                documents = list(data.get("documents", []))
+                metadatas = list(data.get("metadatas", []))
+                self._question_index = QuestionIndex(
+                    QuestionRecord(
+                        id=qid,
+                        question=documents[idx],
+                        role=metadatas[idx].get("role", ""),
+                        difficulty=metadatas[idx].get("difficulty", "medium"),
+                        ideal_answer=metadatas[idx].get("ideal_answer", ""),
+                        expected_concepts=_parse_concepts(metadatas[idx].get("expected_concepts", "[]")),
+                    )
+                    for idx, qid in enumerate(ids)
+                )
+            return self._question_index
 
     def ensure_answer_collection(self) -> None:
         """
         Backfill the answer collection from the main question collection if needed.
         """
+        with self._lock:
+            self._backfill_answer_collection()
+
+    def _backfill_answer_collection(self) -> None:
         try:
             if int(self._answer_collection.count()) > 0:
                 return
@@ -123,6 +252,8 @@ class InterviewVectorStore:
                 metadatas=answer_metadatas,
                 embeddings=answer_embeddings,
             )
+            if self._answer_matrix_loaded:
+                self._answer_matrix.upsert(ids, answer_embeddings)
         except Exception:
             return
 
@@ -134,17 +265,14 @@ class InterviewVectorStore:
         Seed the vector store with sample questions if it's empty.
         Returns True if seeding occurred.
         """
-        if self.count() > 0:
-            return False
-        try:
-            from .init_vector_store import build_sample_questions
-            questions = build_sample_questions()
-            if questions:
-                self.add_questions(questions)
-                return True
-        except Exception:
-            return False
-        return False
+        with self._lock:
+            if self.count() > 0:
+                return False
+            try:
+                from .init_vector_store import sync_questions
+                return bool(sync_questions(self).added)
+            except Exception:
+                return False
 
     def get_questions_for_role(
         self,
@@ -192,14 +320,7 @@ class InterviewVectorStore:
                 continue
             doc = results["documents"][0][idx]
             meta = results["metadatas"][0][idx]
-            raw_concepts = meta.get("expected_concepts", "[]")
-            if isinstance(raw_concepts, str):
-                try:
-                    expected_concepts = json.loads(raw_concepts)
-                except json.JSONDecodeError:
-                    expected_concepts = [raw_concepts]
-            else:
-                expected_concepts = list(raw_concepts)
+            expected_concepts = _parse_concepts(meta.get("expected_concepts", "[]"))
             records.append(
                 QuestionRecord(
                     id=qid,
@@ -219,44 +340,13 @@ class InterviewVectorStore:
         role: str,
         n: int,
         exclude_ids: Optional[List[str]] = None,
+        difficulty: Optional[str] = None,
     ) -> List[QuestionRecord]:
         """
-        Retrieve random questions for the given role, excluding already asked IDs.
+        Retrieve random questions for the given role (optionally one difficulty),
+        excluding already asked IDs. Served from the in-memory question index.
         """
-        exclude_ids = exclude_ids or []
-        results = self._collection.get(where={"role": role})
-        ids = list(results.get("ids", []))
-        documents = list(results.get("documents", []))
-        metadatas = list(results.get("metadatas", []))
-        pool = []
-        for idx, qid in enumerate(ids):
-            if qid in exclude_ids:
-                continue
-            pool.append((qid, documents[idx], metadatas[idx]))
-        if not pool:
-            return []
-        random.shuffle(pool)
-        records: List[QuestionRecord] = []
-        for qid, doc, meta in pool[:n]:
-            raw_concepts = meta.get("expected_concepts", "[]")
-            if isinstance(raw_concepts, str):
-                try:
-                    expected_concepts = json.loads(raw_concepts)
-                except json.JSONDecodeError:
-                    expected_concepts = [raw_concepts]
-            else:
-                expected_concepts = list(raw_concepts)
-            records.append(
-                QuestionRecord(
-                    id=qid,
-                    question=doc,
-                    role=role,
-                    difficulty=meta.get("difficulty", "medium"),
-                    ideal_answer=meta.get("ideal_answer", ""),
-                    expected_concepts=expected_concepts,
-                )
-            )
-        return records
+        return self._get_question_index().sample(role, n, exclude_ids=exclude_ids, difficulty=difficulty)
 
     def semantic_answer_score(self, question_id: str, candidate_answer: str) -> Dict[str, float]:
         """
@@ -266,16 +356,16 @@ class InterviewVectorStore:
         if not candidate_answer.strip():
             return {"similarity": 0.0, "score": 0.0}
 
-        stored = self._answer_collection.get(ids=[question_id], include=["embeddings"])
-        embeddings = stored.get("embeddings", []) if stored else []
-        if not embeddings:
-            return {"similarity": 0.0, "score": 0.0}
-        ideal_embedding = embeddings[0]
-        cand_embedding = self._embed([candidate_answer])[0]
-        dot = sum(a * b for a, b in zip(ideal_embedding, cand_embedding))
-        norm_a = sum(a * a for a in ideal_embedding) ** 0.5
-        norm_b = sum(b * b for b in cand_embedding) ** 0.5
-        similarity = dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+        self._load_answer_matrix()
+        if question_id not in self._answer_matrix:
+            # Added by another process after the matrix was loaded.
+            stored = self._answer_collection.get(ids=[question_id], include=["embeddings"])
+            embeddings = stored.get("embeddings") if stored else None
+            if embeddings is None or not len(embeddings):
+                return {"similarity": 0.0, "score": 0.0}
+            self._answer_matrix.upsert([question_id], [embeddings[0]])
+        cand_embedding = self._encode([candidate_answer])[0]
+        similarity = self._answer_matrix.similarity(question_id, cand_embedding) or 0.0
 
         if similarity >= 0.78:
             score = 2.0